@@ -0,0 +1,68 @@
+"""
+QnA/KnA 에이전트 병렬 처리 벤치마크
+
+실행: python -m benchmarks.bench_agent_concurrency --items 7
+"""
+import argparse
+import asyncio
+import time
+
+from core import news_ka_agent, news_qa_agent
+from benchmarks.stubs import StubChatModel, StubSearch
+
+
+def build_agents(llm_latency: float, tool_latency: float, max_concurrency: int):
+    """대역 모델과 검색 도구를 사용하는 에이전트 생성"""
+    StubSearch.latency = tool_latency
+    for module in (news_qa_agent, news_ka_agent):
+        module.create_chat_model = lambda module_name: StubChatModel(latency=llm_latency)
+        module.TavilySearchResults = StubSearch
+    qa_agent = news_qa_agent.NewsQnAAgent(max_concurrency=max_concurrency)
+    ka_agent = news_ka_agent.NewsKnAAgent(max_concurrency=max_concurrency)
+    # 벤치마크 출력이 묻히지 않도록 디버그 출력 비활성화
+    qa_agent.graph.debug = False
+    ka_agent.graph.debug = False
+    return qa_agent, ka_agent
+
+
+def run_sequential(answer, news_content: str, items):
+    """변경 전 동작: 항목마다 동기 invoke를 차례로 실행"""
+    started = time.perf_counter()
+    for index, item in enumerate(items):
+        answer(news_content, item, f"sequential_{index}")
+    return time.perf_counter() - started
+
+
+async def run_concurrent(process, news_content: str, items):
+    """변경 후 동작: ainvoke와 세마포어로 항목을 병렬 실행"""
+    started = time.perf_counter()
+    await process(news_content, items)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark QnA/KnA agent fan-out with stubbed latency")
+    parser.add_argument("--items", type=int, default=7, help="Number of questions/keywords per article")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Simulated seconds per model call")
+    parser.add_argument("--tool-latency", type=float, default=0.1, help="Simulated seconds per search call")
+    parser.add_argument("--max-concurrency", type=int, default=5, help="Agent semaphore size")
+    args = parser.parse_args()
+
+    qa_agent, ka_agent = build_agents(args.llm_latency, args.tool_latency, args.max_concurrency)
+    news_content = "벤치마크용 뉴스 본문"
+    questions = [f"질문 {i}" for i in range(args.items)]
+    keywords = [f"키워드 {i}" for i in range(args.items)]
+
+    print(f"항목 {args.items}개, 모델 지연 {args.llm_latency}s, 검색 지연 {args.tool_latency}s, 동시성 {args.max_concurrency}")
+    print(f"{'agent':<8}{'sequential':>12}{'concurrent':>12}{'speedup':>10}")
+    for name, answer, process, items in (
+        ("qa", qa_agent.answer_question, qa_agent.process_questions_async, questions),
+        ("ka", ka_agent.answer_keyword, ka_agent.process_keywords_async, keywords),
+    ):
+        sequential = run_sequential(answer, news_content, items)
+        concurrent = asyncio.run(run_concurrent(process, news_content, items))
+        print(f"{name:<8}{sequential:>11.2f}s{concurrent:>11.2f}s{sequential / concurrent:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
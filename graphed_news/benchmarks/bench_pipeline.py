@@ -0,0 +1,194 @@
+"""
+오프라인 전체 파이프라인 벤치마크
+
+crawl_news, 모델, Tavily 검색을 대역으로 바꾼 뒤 단건(analyze_articles), 배치
+(analyze_articles_batch), 대량 백필(analyze_articles_bulk, 로컬 파일 배치 백엔드),
+질문 처리(process_questions_async) 경로를 실행하고
+분당 처리 기사 수, 지연 시간 p50/p95, 최대 메모리 사용량(RSS)을 출력합니다.
+
+실행: python -m benchmarks.bench_pipeline --articles 20 --max-concurrency 4
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from benchmarks.stubs import install_stubs, make_stub_batch_responder
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    """최근접 순위 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(ratio * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """시나리오 결과 요약"""
+    return {
+        "scenario": name,
+        "runs": len(latencies),
+        "errors": errors,
+        "elapsed": round(elapsed, 3),
+        "per_minute": round(len(latencies) / elapsed * 60, 1) if elapsed else 0.0,
+        "p50": round(percentile(latencies, 0.50), 3),
+        "p95": round(percentile(latencies, 0.95), 3),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def bench_single(urls: List[str]) -> Dict[str, Any]:
+    """analyze_articles로 기사를 한 건씩 차례로 처리"""
+    import main
+
+    latencies = []
+    started = time.perf_counter()
+    for url in urls:
+        run_started = time.perf_counter()
+        main.analyze_articles(url)
+        latencies.append(time.perf_counter() - run_started)
+    return summarize("single", latencies, time.perf_counter() - started)
+
+
+def bench_batch(urls: List[str], max_concurrency: int) -> Dict[str, Any]:
+    """analyze_articles_batch로 기사를 동시에 처리"""
+    import main
+
+    async def run():
+        latencies, errors = [], 0
+        async for item in main.analyze_articles_batch(urls, max_concurrency=max_concurrency):
+            if item["error"]:
+                errors += 1
+            else:
+                latencies.append(item["result"]["trace"]["totals"]["wall_time"])
+        return latencies, errors
+
+    started = time.perf_counter()
+    latencies, errors = asyncio.run_coroutine_threadsafe(run(), main._get_runner_loop()).result()
+    return summarize("batch", latencies, time.perf_counter() - started, errors)
+
+
+def bench_bulk(urls: List[str], max_concurrency: int, output_tokens: int) -> Dict[str, Any]:
+    """analyze_articles_bulk로 모델 단계를 로컬 파일 배치 백엔드에 제출하여 처리"""
+    import main
+    from core.batch_jobs import LocalFileBatchBackend
+
+    async def run(job_dir: str):
+        backend = LocalFileBatchBackend(job_dir, responder=make_stub_batch_responder(output_tokens))
+        items = await main.analyze_articles_bulk(urls, backend=backend, job_dir=job_dir, max_concurrency=max_concurrency)
+        latencies = [item["result"]["trace"]["totals"]["wall_time"] for item in items if not item["error"]]
+        return latencies, sum(1 for item in items if item["error"])
+
+    # 로컬 백엔드는 제출 시 결과 파일을 만들므로 상태 확인 대기 없이 진행됨
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as job_dir:
+        latencies, errors = asyncio.run_coroutine_threadsafe(run(job_dir), main._get_runner_loop()).result()
+    return summarize("bulk", latencies, time.perf_counter() - started, errors)
+
+
+def bench_questions(articles: int, questions: int) -> Dict[str, Any]:
+    """공유 워크플로우의 QnA 에이전트로 기사별 질문 목록을 처리"""
+    import main
+
+    qa_agent = main.get_workflow().qa_agent
+    items = [f"질문 {i}" for i in range(questions)]
+
+    async def run():
+        latencies = []
+        for index in range(articles):
+            run_started = time.perf_counter()
+            await qa_agent.process_questions_async("벤치마크용 뉴스 본문", items, thread_prefix=f"bench_{index}")
+            latencies.append(time.perf_counter() - run_started)
+        return latencies
+
+    started = time.perf_counter()
+    latencies = asyncio.run_coroutine_threadsafe(run(), main._get_runner_loop()).result()
+    return summarize("questions", latencies, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark with stubbed crawler, LLM and search")
+    parser.add_argument("--articles", type=int, default=20, help="Number of articles per scenario")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Batch concurrency")
+    parser.add_argument("--questions", type=int, default=5, help="Questions per article for the questions scenario")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Simulated seconds per model call")
+    parser.add_argument("--tool-latency", type=float, default=0.1, help="Simulated seconds per search call")
+    parser.add_argument("--crawl-latency", type=float, default=0.5, help="Simulated seconds per crawl")
+    parser.add_argument("--content-chars", type=int, default=8000, help="Crawled markdown length")
+    parser.add_argument("--output-tokens", type=int, default=200, help="Simulated output tokens per model call")
+    parser.add_argument("--hosts", type=int, default=0, help="Spread URLs over this many hosts (0: one host per article)")
+    parser.add_argument("--rate-limits", action="store_true", help="Apply configured search rate limits")
+    parser.add_argument("--fused", action="store_true", help="Use the fused extraction + question generation graph")
+    parser.add_argument("--scenarios", default="single,batch,questions", help="Comma separated scenarios to run")
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON to this path")
+    parser.add_argument("--verbose", action="store_true", help="Keep workflow progress output")
+    args = parser.parse_args()
+
+    settings = install_stubs(
+        llm_latency=args.llm_latency,
+        tool_latency=args.tool_latency,
+        crawl_latency=args.crawl_latency,
+        content_chars=args.content_chars,
+        output_tokens=args.output_tokens,
+        rate_limits=args.rate_limits,
+    )
+
+    import main as workflow_main
+
+    if args.fused:
+        workflow_main._workflow = workflow_main.NewsAnalysisGraph(fused=True)
+    workflow = workflow_main.get_workflow()
+    settings["fused"] = workflow.fused
+    # 벤치마크 출력이 묻히지 않도록 에이전트 디버그 출력 비활성화
+    workflow.qa_agent.graph.debug = False
+    workflow.ka_agent.graph.debug = False
+
+    # crawl_many의 호스트별 요청 간격이 적용되는 단위
+    hosts = args.hosts or args.articles
+    urls = [f"https://bench{i % hosts}.local/article/{i}" for i in range(args.articles)]
+    scenarios = {
+        "single": lambda: bench_single(urls),
+        "batch": lambda: bench_batch(urls, args.max_concurrency),
+        "bulk": lambda: bench_bulk(urls, args.max_concurrency, args.output_tokens),
+        "questions": lambda: bench_questions(args.articles, args.questions),
+    }
+
+    results = []
+    for name in args.scenarios.split(","):
+        name = name.strip()
+        if name not in scenarios:
+            parser.error(f"unknown scenario: {name}")
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            results.append(scenarios[name]())
+
+    print(f"설정: {settings}")
+    print(f"{'scenario':<11}{'runs':>6}{'errors':>8}{'elapsed':>10}{'per min':>10}{'p50':>9}{'p95':>9}{'rss MB':>9}")
+    for row in results:
+        print(
+            f"{row['scenario']:<11}{row['runs']:>6}{row['errors']:>8}{row['elapsed']:>9.2f}s"
+            f"{row['per_minute']:>10.1f}{row['p50']:>8.2f}s{row['p95']:>8.2f}s{row['peak_rss_mb']:>9.1f}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            json.dump({"settings": settings, "results": results}, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+벤치마크용 로컬 대역(stub) 모듈
+
+외부 API(OpenAI, Tavily)와 브라우저 크롤링을 호출하지 않고
+지연 시간과 토큰 사용량만 흉내 내는 대역입니다.
+"""
+import asyncio
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Type
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from core.utils import estimate_tokens
+
+# 정제/질문 생성 단계의 구조화된 출력 스키마가 모두 읽을 수 있는 응답
+STRUCTURED_PAYLOAD = {
+    "topic": "벤치마크 주제",
+    "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"],
+    "content": "벤치마크용 정제된 기사 본문입니다.",
+    "questions": ["질문1", "질문2", "질문3", "질문4", "질문5"],
+}
+
+
+class StubChatModel(BaseChatModel):
+    """
+    지정한 지연 시간 후 응답하는 ChatOpenAI 대역
+
+    도구가 바인딩된 경우 첫 호출에서 도구 호출을 한 번 요청하고,
+    도구 결과를 받은 뒤 최종 답변을 반환하여 ReAct 루프 한 바퀴를 흉내 냅니다.
+    도구가 없으면 STRUCTURED_PAYLOAD JSON을, with_structured_output에서는
+    스키마의 모든 필드를 채운 JSON을 반환합니다. (include_raw 지원) 토큰 사용량은 입력 길이로 어림합니다.
+    """
+    latency: float = 0.2
+    answer: str = "벤치마크용 답변입니다."
+    output_tokens: int = 200
+    tool_names: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "StubChatModel":
+        names = [getattr(tool, "name", str(tool)) for tool in tools]
+        return self.model_copy(update={"tool_names": names})
+
+    def with_structured_output(self, schema: Type[BaseModel], include_raw: bool = False, **kwargs: Any) -> Runnable:
+        def parse(message: AIMessage) -> Any:
+            parsed = schema.model_validate_json(message.content)
+            return {"raw": message, "parsed": parsed, "parsing_error": None} if include_raw else parsed
+
+        return self.bind(stub_schema=schema) | RunnableLambda(parse)
+
+    def _respond(self, messages: List[BaseMessage], stub_schema: Optional[Type[BaseModel]] = None) -> ChatResult:
+        if stub_schema is not None:
+            content = json.dumps(
+                {name: STRUCTURED_PAYLOAD.get(name, f"벤치마크 {name}") for name in stub_schema.model_fields},
+                ensure_ascii=False,
+            )
+            message = AIMessage(content=content)
+        elif self.tool_names and not any(isinstance(m, ToolMessage) for m in messages):
+            message = AIMessage(
+                content="",
+                tool_calls=[{
+                    "name": self.tool_names[0],
+                    "args": {"__arg1": "benchmark query"},
+                    "id": f"call_{uuid.uuid4().hex[:8]}",
+                }],
+            )
+        elif self.tool_names:
+            message = AIMessage(content=self.answer)
+        else:
+            message = AIMessage(content=json.dumps(STRUCTURED_PAYLOAD, ensure_ascii=False))
+
+        input_tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": input_tokens + self.output_tokens,
+        }
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        time.sleep(self.latency)
+        return self._respond(messages, kwargs.get("stub_schema"))
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._respond(messages, kwargs.get("stub_schema"))
+
+
+def make_stub_batch_responder(output_tokens: int = 200):
+    """
+    LocalFileBatchBackend에 넘길 Chat Completions 응답 대역을 생성합니다.
+
+    요청의 JSON 스키마 response_format에 있는 필드를 STRUCTURED_PAYLOAD 값으로 채워 즉시 응답합니다.
+
+    Args:
+        output_tokens (int): 응답당 출력 토큰 수
+
+    Returns:
+        Callable: 요청 본문을 받아 Chat Completions 응답 본문을 반환하는 함수
+    """
+    def respond(body: Dict[str, Any]) -> Dict[str, Any]:
+        properties = body["response_format"]["json_schema"]["schema"].get("properties", {})
+        content = json.dumps({name: STRUCTURED_PAYLOAD.get(name, f"벤치마크 {name}") for name in properties}, ensure_ascii=False)
+        input_tokens = sum(estimate_tokens(str(m["content"])) for m in body["messages"])
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:8]}",
+            "object": "chat.completion",
+            "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content, "refusal": None}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": input_tokens, "completion_tokens": output_tokens, "total_tokens": input_tokens + output_tokens},
+        }
+
+    return respond
+
+
+class StubSearch:
+    """지정한 지연 시간 후 고정 결과를 반환하는 TavilySearchResults 대역"""
+    latency: float = 0.1
+
+    def run(self, query: str) -> str:
+        time.sleep(self.latency)
+        return f"'{query}'에 대한 검색 결과"
+
+    async def arun(self, query: str) -> str:
+        await asyncio.sleep(self.latency)
+        return f"'{query}'에 대한 검색 결과"
+
+
+def make_stub_crawler(latency: float = 0.5, content_chars: int = 8000):
+    """
+    지정한 지연 시간 후 고정 길이 마크다운을 반환하는 crawl_news 대역을 생성합니다.
+
+    Args:
+        latency (float): 페이지당 크롤링 시간 (초)
+        content_chars (int): 반환할 마크다운 길이
+
+    Returns:
+        Callable: crawl_news와 같은 시그니처의 비동기 함수
+    """
+    paragraph = "벤치마크용 기사 문단입니다. 이 문장은 크롤링 결과를 흉내 냅니다.\n\n"
+
+    async def stub_crawl_news(url: str, force_refresh: bool = False) -> str:
+        await asyncio.sleep(latency)
+        body = (paragraph * (content_chars // len(paragraph) + 1))[:content_chars]
+        return f"# {url}\n\n{body}"
+
+    return stub_crawl_news
+
+
+def install_stubs(llm_latency: float = 0.2, tool_latency: float = 0.1, crawl_latency: float = 0.5,
+                  content_chars: int = 8000, output_tokens: int = 200, rate_limits: bool = False) -> Dict[str, Any]:
+    """
+    crawl_news, 모델 클라이언트, Tavily 검색을 대역으로 교체하고
+    결과 캐시와 체크포인트를 꺼서 매 실행이 전체 파이프라인을 거치도록 합니다.
+
+    Args:
+        llm_latency (float): 모델 호출당 지연 시간 (초)
+        tool_latency (float): 검색 호출당 지연 시간 (초)
+        crawl_latency (float): 페이지당 크롤링 시간 (초)
+        content_chars (int): 크롤링 결과 길이
+        output_tokens (int): 모델 호출당 출력 토큰 수
+        rate_limits (bool): True이면 model_config.yaml의 검색 호출 제한을 그대로 적용
+
+    Returns:
+        Dict[str, Any]: 적용한 설정
+    """
+    import main
+    from core import (
+        llm_scheduler, news_accumulator, news_fused_extractor, news_ka_agent, news_processor, news_qa_agent,
+        news_question_generator,
+    )
+
+    StubSearch.latency = tool_latency
+    for module in (news_processor, news_question_generator, news_fused_extractor, news_qa_agent, news_ka_agent, news_accumulator):
+        module.create_chat_model = lambda module_name: StubChatModel(latency=llm_latency, output_tokens=output_tokens)
+    for module in (news_qa_agent, news_ka_agent):
+        module.TavilySearchResults = StubSearch
+
+    if not rate_limits:
+        llm_scheduler._scheduler = llm_scheduler.LLMScheduler({}, llm_scheduler.load_scheduler_config()["priorities"])
+
+    main.crawl_news = make_stub_crawler(crawl_latency, content_chars)
+    main.get_result_cache = lambda: None
+    main.get_checkpoint_path = lambda: None
+    main.get_answer_store = lambda: None
+
+    return {
+        "llm_latency": llm_latency,
+        "tool_latency": tool_latency,
+        "crawl_latency": crawl_latency,
+        "content_chars": content_chars,
+        "output_tokens": output_tokens,
+        "rate_limits": rate_limits,
+    }
@@ -0,0 +1,347 @@
+"""
+배치 작업 파일 모듈
+
+대량 백필에서 지연 시간보다 비용과 호출 한도가 중요한 단계(정제, 질문 생성, 최종 보고서)의
+모델 요청을 OpenAI Batch API 형식의 JSONL 파일로 모아 배치 백엔드에 제출하고,
+결과 파일을 받아 스키마로 검증합니다. 단계별 제출 상태는 작업 디렉토리의
+manifest.json에 기록되므로 중단된 작업을 다시 실행하면 제출한 배치를 이어서 기다립니다.
+"""
+import asyncio
+import json
+import os
+import shutil
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from langchain_core.messages import BaseMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel
+
+from .structured_output import parse_structured_text
+from .utils import get_prompt_template, get_shared_http_clients, load_model_config, load_runtime_config, resolve_project_path
+
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+# 배치 요청 본문에 넘길 모델 설정 키
+_BODY_KEYS = ("temperature", "top_p", "max_tokens", "seed")
+_ROLES = {"human": "user", "ai": "assistant", "system": "system"}
+
+# 배치 상태 (OpenAI Batch API 상태 이름)
+COMPLETED = "completed"
+FAILED_STATUSES = ("failed", "expired", "cancelled")
+
+
+class BatchBackend(ABC):
+    """JSONL 배치 작업 파일을 제출하고 결과 파일을 받아 오는 백엔드"""
+
+    @abstractmethod
+    def submit(self, input_path: str) -> str:
+        """
+        배치 작업 파일을 제출합니다.
+
+        Args:
+            input_path (str): 요청 JSONL 파일 경로
+
+        Returns:
+            str: 배치 ID
+        """
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """배치 상태 ('completed', 'failed', 'expired', 'cancelled' 또는 진행 중 상태)"""
+
+    @abstractmethod
+    def download(self, batch_id: str, output_path: str):
+        """
+        완료된 배치의 결과 JSONL을 저장합니다.
+
+        Args:
+            batch_id (str): 배치 ID
+            output_path (str): 결과를 저장할 경로
+        """
+
+
+def _default_responder(body: Dict[str, Any]) -> Dict[str, Any]:
+    """공유 HTTP 클라이언트로 Chat Completions를 바로 호출합니다."""
+    from openai import OpenAI
+
+    client = OpenAI(http_client=get_shared_http_clients()[0])
+    return client.chat.completions.create(**body).model_dump()
+
+
+class LocalFileBatchBackend(BatchBackend):
+    """
+    로컬 파일로 배치를 흉내 내는 백엔드 (테스트, 소량 실행용)
+
+    제출한 파일의 요청을 responder로 하나씩 처리해 OpenAI Batch API와 같은 형식의
+    결과 파일을 만듭니다. responder가 없으면 Chat Completions를 바로 호출합니다.
+    """
+
+    def __init__(self, directory: str, responder: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+        """
+        Args:
+            directory (str): 배치 입력/결과 파일을 보관할 디렉토리
+            responder (Callable, optional): 요청 본문을 받아 Chat Completions 응답 본문을 반환하는 함수
+        """
+        self.directory = directory
+        self.responder = responder or _default_responder
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, batch_id: str, kind: str) -> str:
+        return os.path.join(self.directory, f"{batch_id}.{kind}.jsonl")
+
+    def submit(self, input_path: str) -> str:
+        batch_id = f"local_{uuid.uuid4().hex}"
+        shutil.copyfile(input_path, self._path(batch_id, "input"))
+
+        with open(self._path(batch_id, "input"), "r", encoding="utf-8") as source, \
+                open(self._path(batch_id, "output") + ".tmp", "w", encoding="utf-8") as target:
+            for line in source:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                try:
+                    response = {"status_code": 200, "body": self.responder(request["body"])}
+                    error = None
+                except Exception as e:
+                    response, error = None, {"code": type(e).__name__, "message": str(e)}
+                target.write(json.dumps(
+                    {"id": uuid.uuid4().hex, "custom_id": request["custom_id"], "response": response, "error": error},
+                    ensure_ascii=False,
+                ) + "\n")
+        os.replace(self._path(batch_id, "output") + ".tmp", self._path(batch_id, "output"))
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        if os.path.exists(self._path(batch_id, "output")):
+            return COMPLETED
+        return "failed" if not os.path.exists(self._path(batch_id, "input")) else "in_progress"
+
+    def download(self, batch_id: str, output_path: str):
+        shutil.copyfile(self._path(batch_id, "output"), output_path)
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API 백엔드 (요청당 비용이 낮고 대화형 호출 한도와 별도로 처리됨)"""
+
+    def __init__(self, completion_window: str = "24h", client: Any = None):
+        """
+        Args:
+            completion_window (str): 배치 완료 기한
+            client (openai.OpenAI, optional): OpenAI 클라이언트. 없으면 공유 HTTP 클라이언트로 생성
+        """
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI(http_client=get_shared_http_clients()[0])
+        self.client = client
+        self.completion_window = completion_window
+
+    def submit(self, input_path: str) -> str:
+        with open(input_path, "rb") as file:
+            uploaded = self.client.files.create(file=file, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=CHAT_COMPLETIONS_URL,
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return self.client.batches.retrieve(batch_id).status
+
+    def download(self, batch_id: str, output_path: str):
+        batch = self.client.batches.retrieve(batch_id)
+        with open(output_path, "w", encoding="utf-8") as file:
+            # 모든 요청이 실패하면 결과 파일 없이 오류 파일만 생김
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    file.write(self.client.files.content(file_id).text.rstrip("\n") + "\n")
+
+
+def get_batch_backend() -> BatchBackend:
+    """
+    config/runtime_config.yaml의 bulk 설정에 맞는 배치 백엔드를 생성합니다.
+
+    Returns:
+        BatchBackend: backend가 'local'이면 LocalFileBatchBackend, 아니면 OpenAIBatchBackend
+    """
+    config = load_runtime_config('bulk')
+    if config.get('backend', 'openai') == 'local':
+        return LocalFileBatchBackend(os.path.join(resolve_project_path(config.get('job_dir', 'cache/bulk')), 'local_backend'))
+    return OpenAIBatchBackend(completion_window=config.get('completion_window', '24h'))
+
+
+def _message_to_dict(message: BaseMessage) -> Dict[str, Any]:
+    return {"role": _ROLES.get(message.type, message.type), "content": message.content}
+
+
+def build_chat_request(
+    custom_id: str,
+    module_name: str,
+    prompt_file_name: str,
+    variables: Dict[str, Any],
+    schema: Type[BaseModel],
+) -> Dict[str, Any]:
+    """
+    대화형 단계와 같은 프롬프트와 모델 설정으로 배치 요청 한 줄을 만듭니다.
+
+    Args:
+        custom_id (str): 결과와 요청을 연결할 ID
+        module_name (str): config/model_config.yaml의 모듈명
+        prompt_file_name (str): 프롬프트 YAML 파일명
+        variables (Dict[str, Any]): 프롬프트 변수
+        schema (Type[BaseModel]): 출력 스키마 (JSON 스키마 response_format으로 전달)
+
+    Returns:
+        Dict[str, Any]: OpenAI Batch API 요청 (custom_id, method, url, body)
+    """
+    model_config = load_model_config(module_name)
+    function = convert_to_openai_tool(schema)["function"]
+    body = {
+        "model": model_config.get('model') or model_config.get('model_name'),
+        "messages": [_message_to_dict(m) for m in get_prompt_template(prompt_file_name).format_messages(**variables)],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": function["name"], "description": function.get("description", ""), "schema": function["parameters"]},
+        },
+    }
+    body.update({key: model_config[key] for key in _BODY_KEYS if key in model_config})
+    return {"custom_id": custom_id, "method": "POST", "url": CHAT_COMPLETIONS_URL, "body": body}
+
+
+def parse_batch_result(line: Dict[str, Any], schema: Type[BaseModel]) -> BaseModel:
+    """
+    결과 파일 한 줄을 스키마로 검증합니다.
+
+    Raises:
+        RuntimeError: 요청이 실패했거나 모델이 응답을 거부한 경우
+        OutputParserException: 응답이 스키마에 맞지 않는 경우
+    """
+    response = line.get("response") or {}
+    if line.get("error") or response.get("status_code") != 200:
+        error = line.get("error") or (response.get("body") or {}).get("error")
+        raise RuntimeError(f"배치 요청 실패: {error}")
+    message = response["body"]["choices"][0]["message"]
+    if message.get("refusal"):
+        raise RuntimeError(f"모델이 응답을 거부했습니다: {message['refusal']}")
+    return parse_structured_text(schema, message.get("content") or "")
+
+
+class BatchJob:
+    """
+    작업 디렉토리 하나에서 진행하는 배치 단계들
+
+    manifest.json에 단계별 배치 ID를 기록하고, 결과 파일을 받은 단계는 다시 제출하지 않습니다.
+    작업 디렉토리는 같은 기사 목록의 백필 한 번에만 사용해야 합니다.
+    """
+
+    def __init__(self, job_dir: str, backend: BatchBackend, poll_interval: float = 60.0):
+        """
+        Args:
+            job_dir (str): 요청/결과 파일과 manifest.json을 보관할 디렉토리
+            backend (BatchBackend): 배치 백엔드
+            poll_interval (float): 배치 상태 확인 간격 (초)
+        """
+        self.job_dir = job_dir
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self._manifest_path = os.path.join(job_dir, "manifest.json")
+        self._lock = threading.Lock()
+        os.makedirs(job_dir, exist_ok=True)
+        self.manifest: Dict[str, Any] = {}
+        if os.path.exists(self._manifest_path):
+            with open(self._manifest_path, "r", encoding="utf-8") as file:
+                self.manifest = json.load(file)
+
+    def _save_manifest(self):
+        with self._lock:
+            tmp_path = self._manifest_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self.manifest, file, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._manifest_path)
+
+    def check_urls(self, urls: List[str]):
+        """
+        작업 디렉토리가 같은 기사 목록으로 시작되었는지 확인하고 기록합니다.
+
+        Raises:
+            ValueError: 다른 기사 목록으로 시작된 작업 디렉토리인 경우
+        """
+        recorded = self.manifest.get("urls")
+        if recorded is None:
+            self.manifest["urls"] = list(urls)
+            self._save_manifest()
+        elif recorded != list(urls):
+            raise ValueError(f"작업 디렉토리 '{self.job_dir}'는 다른 기사 목록으로 시작된 작업입니다.")
+
+    async def run_stage(
+        self,
+        stage: str,
+        requests: List[Dict[str, Any]],
+        schema: Type[BaseModel],
+    ) -> Dict[str, Union[BaseModel, Exception]]:
+        """
+        한 단계의 요청을 배치로 제출하고 결과를 기다립니다.
+
+        이전 실행에서 이미 제출했거나 결과를 받은 단계는 이어서 사용합니다.
+
+        Args:
+            stage (str): 단계 이름 (파일명과 manifest 키로 사용)
+            requests (List[Dict[str, Any]]): build_chat_request로 만든 요청 목록
+            schema (Type[BaseModel]): 출력 스키마
+
+        Returns:
+            Dict[str, Union[BaseModel, Exception]]: custom_id별 검증된 결과 또는 오류
+        """
+        if not requests:
+            return {}
+
+        input_path = os.path.join(self.job_dir, f"{stage}.input.jsonl")
+        output_path = os.path.join(self.job_dir, f"{stage}.output.jsonl")
+        entry = self.manifest.setdefault("stages", {}).get(stage)
+
+        if entry is None:
+            with open(input_path, "w", encoding="utf-8") as file:
+                for request in requests:
+                    file.write(json.dumps(request, ensure_ascii=False) + "\n")
+            batch_id = await asyncio.to_thread(self.backend.submit, input_path)
+            entry = {"batch_id": batch_id, "requests": len(requests), "status": "submitted"}
+            self.manifest["stages"][stage] = entry
+            self._save_manifest()
+            print(f"📤 배치 제출: {stage} ({len(requests)}개 요청, {batch_id})")
+        else:
+            print(f"⏯️ 제출된 배치 이어서 사용: {stage} ({entry['batch_id']})")
+
+        if entry["status"] != COMPLETED:
+            while True:
+                status = await asyncio.to_thread(self.backend.status, entry["batch_id"])
+                if status == COMPLETED:
+                    break
+                if status in FAILED_STATUSES:
+                    # 다시 실행하면 새로 제출하도록 기록을 지움
+                    del self.manifest["stages"][stage]
+                    self._save_manifest()
+                    raise RuntimeError(f"배치 {entry['batch_id']} ({stage}) 상태: {status}")
+                print(f"⏳ 배치 대기 중: {stage} ({status})")
+                await asyncio.sleep(self.poll_interval)
+            await asyncio.to_thread(self.backend.download, entry["batch_id"], output_path)
+            entry["status"] = COMPLETED
+            self._save_manifest()
+
+        results: Dict[str, Union[BaseModel, Exception]] = {}
+        with open(output_path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                try:
+                    results[data["custom_id"]] = parse_batch_result(data, schema)
+                except Exception as e:
+                    results[data["custom_id"]] = e
+        for request in requests:
+            results.setdefault(request["custom_id"], RuntimeError("배치 결과에 응답이 없습니다"))
+        print(f"📥 배치 결과: {stage} (성공 {sum(not isinstance(r, Exception) for r in results.values())}/{len(requests)})")
+        return results
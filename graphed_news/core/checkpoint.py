@@ -0,0 +1,175 @@
+"""
+워크플로우 체크포인트 모듈
+
+실패한 기사 처리를 마지막으로 완료된 노드부터 재개할 수 있도록
+LangGraph 체크포인트(SQLite)와 개별 답변 저장소를 제공합니다.
+"""
+import asyncio
+import atexit
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import aiosqlite
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from .utils import load_runtime_config, resolve_project_path
+
+# 아직 닫지 않은 체크포인터와 생성한 이벤트 루프 (프로세스 종료 시 정리)
+_open_checkpointers: List[Tuple[asyncio.AbstractEventLoop, AsyncSqliteSaver]] = []
+_checkpointers_lock = threading.Lock()
+
+
+def get_checkpoint_path() -> Optional[str]:
+    """
+    config/runtime_config.yaml의 checkpoint 설정에서 SQLite 파일 경로를 반환합니다.
+
+    Returns:
+        Optional[str]: 체크포인트가 비활성화되어 있으면 None
+    """
+    config = load_runtime_config('checkpoint')
+    if not config.get('enabled', False):
+        return None
+    return resolve_project_path(config.get('path', 'cache/checkpoints.sqlite3'))
+
+
+async def create_checkpointer(path: str) -> AsyncSqliteSaver:
+    """
+    현재 이벤트 루프에서 사용할 SQLite 체크포인터를 생성합니다.
+
+    AsyncSqliteSaver는 생성한 이벤트 루프에 묶이므로 루프마다 따로 만들어야 하며,
+    연결 스레드가 프로세스 종료를 막지 않도록 루프를 닫기 전에 close_checkpointer로 닫아야 합니다.
+
+    Args:
+        path (str): SQLite 파일 경로
+
+    Returns:
+        AsyncSqliteSaver: 체크포인터
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = await aiosqlite.connect(path)
+    try:
+        checkpointer = AsyncSqliteSaver(conn)
+        await checkpointer.setup()
+    except BaseException:
+        await conn.close()
+        raise
+    with _checkpointers_lock:
+        _open_checkpointers.append((asyncio.get_running_loop(), checkpointer))
+    return checkpointer
+
+
+async def close_checkpointer(checkpointer: AsyncSqliteSaver):
+    """체크포인터의 SQLite 연결(과 연결 스레드)을 닫습니다."""
+    with _checkpointers_lock:
+        _open_checkpointers[:] = [item for item in _open_checkpointers if item[1] is not checkpointer]
+    await checkpointer.conn.close()
+
+
+def _close_all_checkpointers():
+    """
+    프로세스 종료 시 닫히지 않은 체크포인터를 닫습니다.
+
+    aiosqlite 연결 스레드는 데몬 스레드가 아니므로 인터프리터가 스레드를 기다리기 전에 실행되어야 합니다.
+    연결은 스레드에서 동작하므로 생성한 루프가 이미 닫혔으면 새 루프에서 닫습니다.
+    """
+    with _checkpointers_lock:
+        checkpointers = list(_open_checkpointers)
+        _open_checkpointers.clear()
+    for loop, checkpointer in checkpointers:
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(checkpointer.conn.close(), loop).result(timeout=10)
+            else:
+                asyncio.run(checkpointer.conn.close())
+        except Exception as e:
+            print(f"⚠️ 체크포인터 종료 중 오류: {e}")
+
+
+# threading._register_atexit(3.9+)은 비데몬 스레드를 기다리기 전에 실행됨
+getattr(threading, "_register_atexit", atexit.register)(_close_all_checkpointers)
+
+
+class AnswerStore:
+    """
+    기사별로 완료된 질문/키워드 답변을 저장하는 저장소
+
+    노드가 중간에 실패해도 이미 받은 답변은 재실행 시 다시 생성하지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (체크포인트 파일과 같아도 됨)
+        """
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS completed_answers (
+                article_key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                item TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                PRIMARY KEY (article_key, kind, item)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def load(self, article_key: str, kind: str) -> Dict[str, str]:
+        """
+        저장된 답변을 불러옵니다.
+
+        Args:
+            article_key (str): 기사 키 (정규 URL)
+            kind (str): 'qa' 또는 'ka'
+
+        Returns:
+            Dict[str, str]: {질문 또는 키워드: 답변}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item, answer FROM completed_answers WHERE article_key = ? AND kind = ?",
+                (article_key, kind),
+            ).fetchall()
+        return dict(rows)
+
+    def save(self, article_key: str, kind: str, item: str, answer: str):
+        """답변 하나를 저장합니다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completed_answers (article_key, kind, item, answer) VALUES (?, ?, ?, ?)",
+                (article_key, kind, item, answer),
+            )
+            self._conn.commit()
+
+    def clear(self, article_key: str):
+        """기사 처리가 끝나면 해당 기사의 답변을 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM completed_answers WHERE article_key = ?", (article_key,))
+            self._conn.commit()
+
+
+_answer_store: Optional[AnswerStore] = None
+_answer_store_lock = threading.Lock()
+
+
+def get_answer_store() -> Optional[AnswerStore]:
+    """
+    체크포인트 설정으로 만든 프로세스 전역 답변 저장소를 반환합니다.
+
+    Returns:
+        Optional[AnswerStore]: 체크포인트가 비활성화되어 있으면 None
+    """
+    global _answer_store
+    path = get_checkpoint_path()
+    if path is None:
+        return None
+    if _answer_store is None:
+        with _answer_store_lock:
+            if _answer_store is None:
+                _answer_store = AnswerStore(path)
+    return _answer_store
@@ -0,0 +1,276 @@
+"""
+크롤링 본문 정리 모듈
+
+크롤링한 마크다운을 모델에 보내기 전에 규칙 기반으로 내비게이션, 관련 기사 목록,
+댓글/공유 위젯, 언론사 저작권 문구 등 기사 외 내용을 제거하여 입력 토큰을 줄이고,
+지나치게 긴 페이지는 제목과 앞부분 문단을 남기고 잘라냅니다. 긴 본문을 여러 번에
+나누어 추출할 수 있도록 문단 단위로 겹치게 나누는 기능도 제공합니다.
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .utils import estimate_tokens, load_runtime_config
+
+_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_BARE_URL = re.compile(r"https?://\S+")
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+")
+
+# 언론사 하단 문구, 위젯 등 (config/runtime_config.yaml의 content_cleaner.drop_patterns로 덮어쓸 수 있음)
+_DEFAULT_DROP_PATTERNS = [
+    r"무단\s*전재",
+    r"재배포\s*금지",
+    r"저작권자\s*[ⓒ©]",
+    r"^\s*(?:Copyright|COPYRIGHT)\b",
+    r"^\s*[ⓒ©]",
+    # 제보 안내, 구독 안내와 위젯은 그 문구로 시작하거나 그 문구만 있는 짧은 줄만 제거 (본문 문단은 유지)
+    r"^[\W_]{0,5}기사\s*제보.{0,60}$",
+    r"^.{0,20}구독(?:하기|하세요|해주세요)[\s!.]*$",
+    r"^\s*(?:(?:댓글|공유하기|좋아요|추천해요|본문\s*듣기|글자\s*크기|인쇄하기|스크랩)\s*\d*\s*)+$",
+]
+
+
+class CleaningStats(NamedTuple):
+    """정리 단계에서 제거한 양"""
+    removed_chars: int
+    removed_tokens: int
+    removed_lines: int
+
+
+def _link_density(line: str) -> float:
+    """줄에서 링크(텍스트와 주소)가 차지하는 글자 비율"""
+    stripped = line.strip()
+    if not stripped:
+        return 0.0
+    linked = sum(len(match.group(0)) for match in _LINK.finditer(stripped))
+    linked += sum(len(match.group(0)) for match in _BARE_URL.finditer(_LINK.sub("", stripped)))
+    return linked / len(stripped)
+
+
+def _normalize_line(line: str) -> str:
+    return _LIST_MARKER.sub("", _LINK.sub(r"\1", line)).strip()
+
+
+def _split_blocks(markdown: str) -> List[List[str]]:
+    """빈 줄로 구분된 블록 목록"""
+    blocks, current = [], []
+    for line in markdown.splitlines():
+        if line.strip():
+            current.append(line)
+        elif current:
+            blocks.append(current)
+            current = []
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def clean_content(markdown: str, config: Optional[Dict[str, Any]] = None) -> Tuple[str, CleaningStats]:
+    """
+    크롤링한 마크다운에서 기사 외 내용을 제거합니다.
+
+    규칙:
+    - 링크가 대부분인 블록/줄(메뉴, 관련 기사 목록) 제거
+    - 여러 번 반복되는 짧은 줄(상/하단 메뉴) 제거, 제목(헤딩)은 유지
+    - 이미지와 언론사 하단 문구, 댓글/공유 위젯 줄 제거
+    - 남은 링크는 텍스트만 유지
+
+    정리 결과가 min_keep_chars보다 짧아지면 규칙이 본문까지 지운 것으로 보고 원문을 반환합니다.
+
+    Args:
+        markdown (str): 크롤링한 마크다운
+        config (Dict[str, Any], optional): 정리 설정. 없으면 runtime_config.yaml의 content_cleaner 섹션
+
+    Returns:
+        Tuple[str, CleaningStats]: (정리된 마크다운, 제거한 글자/토큰/줄 수)
+    """
+    config = load_runtime_config('content_cleaner') if config is None else config
+    if not markdown or not config.get('enabled', True):
+        return markdown, CleaningStats(0, 0, 0)
+
+    max_link_density = config.get('max_link_density', 0.5)
+    max_repeated_chars = config.get('max_repeated_line_chars', 30)
+    min_keep_chars = config.get('min_keep_chars', 200)
+    drop_patterns = [re.compile(pattern) for pattern in config.get('drop_patterns') or _DEFAULT_DROP_PATTERNS]
+
+    lines = [line for line in markdown.splitlines() if line.strip()]
+    counts = Counter(_normalize_line(line) for line in lines)
+    # 제목(헤딩)은 상단과 본문에 함께 나오는 경우가 많아 반복 규칙에서 제외
+    repeated = {
+        text for text, count in counts.items()
+        if count > 1 and len(text) <= max_repeated_chars and not text.startswith("#")
+    }
+
+    kept_blocks, removed_lines = [], 0
+    for block in _split_blocks(markdown):
+        block_text = "\n".join(block)
+        if len(block) > 1 and _link_density(block_text.replace("\n", " ")) > max_link_density:
+            removed_lines += len(block)
+            continue
+
+        kept = []
+        for line in block:
+            text = _normalize_line(_IMAGE.sub("", line))
+            if (
+                not text
+                or _link_density(line) > max_link_density
+                or text in repeated
+                or any(pattern.search(text) for pattern in drop_patterns)
+            ):
+                removed_lines += 1
+                continue
+            kept.append(_LINK.sub(r"\1", _IMAGE.sub("", line)).rstrip())
+        if kept:
+            kept_blocks.append("\n".join(kept))
+
+    cleaned = "\n\n".join(kept_blocks)
+    if len(cleaned) < min(min_keep_chars, len(markdown)):
+        return markdown, CleaningStats(0, 0, 0)
+
+    return cleaned, CleaningStats(
+        removed_chars=len(markdown) - len(cleaned),
+        removed_tokens=max(0, estimate_tokens(markdown) - estimate_tokens(cleaned)),
+        removed_lines=removed_lines,
+    )
+
+
+# 잘린 본문 끝에 붙이는 표시 (캐시에 저장된 본문에서도 잘림 여부를 알 수 있도록 유지)
+TRUNCATION_MARKER = "\n\n(이하 내용은 길이 제한으로 생략되었습니다)"
+
+
+def is_truncated(markdown: Optional[str]) -> bool:
+    """limit_content로 잘린 본문인지 확인합니다."""
+    return bool(markdown) and markdown.endswith(TRUNCATION_MARKER)
+
+
+def _within_limits(text: str, max_chars: Optional[int], max_tokens: Optional[int]) -> bool:
+    return (max_chars is None or len(text) <= max_chars) and (max_tokens is None or estimate_tokens(text) <= max_tokens)
+
+
+def _longest_prefix(text: str, max_chars: Optional[int], max_tokens: Optional[int]) -> str:
+    """글자 수/토큰 제한 안에 들어가는 가장 긴 앞부분"""
+    end = len(text) if max_chars is None else min(len(text), max_chars)
+    if max_tokens is not None and estimate_tokens(text[:end]) > max_tokens:
+        # 토큰 수는 길이에 따라 단조 증가하므로 이분 탐색
+        low, high = 0, end
+        while low < high:
+            middle = (low + high + 1) // 2
+            if estimate_tokens(text[:middle]) <= max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        end = low
+    return text[:end]
+
+
+def limit_content(markdown: str, max_chars: Optional[int] = None, max_tokens: Optional[int] = None) -> Tuple[str, bool]:
+    """
+    본문이 글자 수/토큰 제한을 넘으면 제목과 앞부분 문단을 남기고 잘라냅니다.
+
+    먼저 clean_content로 기사 외 내용을 제거해 보고, 그래도 넘으면 첫 헤딩(제목)을 유지한 채
+    앞에서부터 블록을 채우고, 제한을 넘는 첫 블록은 남은 글자/토큰 예산만큼 잘라서 포함합니다.
+    잘린 본문 끝에는 TRUNCATION_MARKER를 붙이며, 표시를 포함해도 두 제한을 모두 지킵니다.
+
+    Args:
+        markdown (str): 크롤링한 마크다운
+        max_chars (int, optional): 최대 글자 수
+        max_tokens (int, optional): 최대 예상 토큰 수
+
+    Returns:
+        Tuple[str, bool]: (제한 안의 본문, 잘렸는지 여부)
+    """
+    if not markdown or _within_limits(markdown, max_chars, max_tokens):
+        return markdown, False
+
+    cleaned, _ = clean_content(markdown)
+    if _within_limits(cleaned, max_chars, max_tokens):
+        return cleaned, False
+
+    budget_chars = None if max_chars is None else max(0, max_chars - len(TRUNCATION_MARKER))
+    budget_tokens = None if max_tokens is None else max(0, max_tokens - estimate_tokens(TRUNCATION_MARKER))
+    blocks = ["\n".join(block) for block in _split_blocks(cleaned)]
+    title = next((block for block in blocks if block.lstrip().startswith("#")), None)
+
+    kept: List[str] = [title] if title else []
+    for block in blocks:
+        if block is title:
+            continue
+        kept.append(block)
+        if not _within_limits("\n\n".join(kept), budget_chars, budget_tokens):
+            # 제한을 넘는 블록은 아래에서 남은 예산만큼만 남김
+            break
+
+    limited = _longest_prefix("\n\n".join(kept), budget_chars, budget_tokens).rstrip()
+    return limited + TRUNCATION_MARKER, True
+
+
+def _split_long_block(block: str, max_tokens: int) -> List[str]:
+    """한 블록이 max_tokens를 넘으면 줄, 그래도 넘으면 글자 단위로 나눕니다."""
+    pieces: List[str] = []
+    current = ""
+    for line in block.splitlines():
+        while estimate_tokens(line) > max_tokens:
+            # 토큰 수는 글자 수 이하이므로 max_tokens 글자씩 자르면 제한을 넘지 않음
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:max_tokens])
+            line = line[max_tokens:]
+        candidate = f"{current}\n{line}" if current else line
+        if current and estimate_tokens(candidate) > max_tokens:
+            pieces.append(current)
+            current = line
+        else:
+            current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_into_chunks(markdown: str, chunk_tokens: int, overlap_tokens: int = 0) -> List[str]:
+    """
+    본문을 문단(빈 줄로 구분된 블록) 단위로 chunk_tokens 이하의 조각으로 나눕니다.
+
+    각 조각은 앞 조각의 마지막 문단들을 overlap_tokens 이내에서 다시 포함하여
+    경계에 걸친 문맥이 끊기지 않도록 합니다.
+
+    Args:
+        markdown (str): 본문
+        chunk_tokens (int): 조각당 최대 예상 토큰 수
+        overlap_tokens (int): 앞 조각과 겹칠 최대 예상 토큰 수
+
+    Returns:
+        List[str]: 조각 목록 (본문이 chunk_tokens 이하이면 본문 하나)
+    """
+    if estimate_tokens(markdown) <= chunk_tokens:
+        return [markdown]
+
+    blocks: List[str] = []
+    for block in _split_blocks(markdown):
+        blocks.extend(_split_long_block("\n".join(block), chunk_tokens))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    fresh = False  # 현재 조각에 겹침이 아닌 새 문단이 있는지
+    for block in blocks:
+        block_tokens = estimate_tokens(block)
+        if current and fresh and current_tokens + block_tokens > chunk_tokens:
+            chunks.append("\n\n".join(current))
+            # 다음 조각은 끝 문단들을 겹침 예산과 새 문단이 들어갈 공간 안에서 다시 포함
+            overlap: List[str] = []
+            overlap_size = 0
+            for previous in reversed(current):
+                size = estimate_tokens(previous)
+                if overlap_size + size > min(overlap_tokens, chunk_tokens - block_tokens):
+                    break
+                overlap.insert(0, previous)
+                overlap_size += size
+            current, current_tokens, fresh = overlap, overlap_size, False
+        current.append(block)
+        current_tokens += block_tokens
+        fresh = True
+    if current and fresh:
+        chunks.append("\n\n".join(current))
+    return chunks
@@ -0,0 +1,180 @@
+"""
+크롤링 결과 캐시 모듈
+
+재분석이나 재시도 때 같은 기사 페이지를 다시 렌더링하지 않도록 정규 URL별로
+크롤링한 마크다운과 수집 시각, 검증자(ETag/Last-Modified, 내용 해시)를 저장합니다.
+TTL 안의 항목은 그대로 사용하고, 지난 항목은 조건부 요청으로 재검증합니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+from .result_cache import content_hash
+from .url_canonicalizer import canonicalize_url
+from .utils import load_runtime_config, resolve_project_path
+
+
+class CachedPage(NamedTuple):
+    """캐시에 저장된 크롤링 결과"""
+    markdown: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: str
+    fetched_at: float
+    fresh: bool
+
+
+class CrawlCache:
+    """
+    SQLite 기반 크롤링 결과 캐시
+
+    전체 마크다운 크기가 max_bytes를 넘으면 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            ttl_seconds (float, optional): 재검증 없이 사용할 기간 (초). 없으면 항상 그대로 사용
+            max_bytes (int, optional): 저장할 마크다운의 최대 총 크기. 없으면 제한 없음
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0, "evicted": 0}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                markdown TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        저장된 크롤링 결과를 조회합니다.
+
+        Args:
+            url (str): 기사 URL (내부에서 정규 URL로 변환)
+
+        Returns:
+            Optional[CachedPage]: 저장된 결과 (TTL 안이면 fresh=True), 없으면 None
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT markdown, etag, last_modified, content_hash, fetched_at FROM pages WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, key))
+            self._conn.commit()
+        fresh = self.ttl_seconds is None or now - row[4] <= self.ttl_seconds
+        if fresh:
+            self.stats["hits"] += 1
+        return CachedPage(*row, fresh=fresh)
+
+    def is_fresh(self, url: str) -> bool:
+        """통계나 접근 시각을 바꾸지 않고 TTL 안의 항목이 있는지 확인합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at FROM pages WHERE url = ?", (canonicalize_url(url),)).fetchone()
+        return row is not None and (self.ttl_seconds is None or time.time() - row[0] <= self.ttl_seconds)
+
+    def put(self, url: str, markdown: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        크롤링 결과를 저장하고 용량을 넘는 항목을 정리합니다.
+
+        Args:
+            url (str): 기사 URL (내부에서 정규 URL로 변환)
+            markdown (str): 크롤링한 마크다운
+            etag (str, optional): 응답의 ETag
+            last_modified (str, optional): 응답의 Last-Modified
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+        markdown = str(markdown)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO pages
+                    (url, markdown, etag, last_modified, content_hash, size, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, markdown, etag, last_modified, content_hash(markdown), len(markdown.encode("utf-8")), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def mark_revalidated(self, url: str):
+        """조건부 요청으로 내용이 바뀌지 않았음을 확인한 항목의 수집 시각을 갱신합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, canonicalize_url(url)),
+            )
+            self._conn.commit()
+            self.stats["revalidated"] += 1
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT url, size FROM pages ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM pages WHERE url = ?", (key,))
+            total -= size
+            self.stats["evicted"] += 1
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.commit()
+
+
+_crawl_cache: Optional[CrawlCache] = None
+_crawl_cache_lock = threading.Lock()
+
+
+def get_crawl_cache() -> Optional[CrawlCache]:
+    """
+    config/runtime_config.yaml의 crawl_cache 설정으로 만든 프로세스 전역 캐시를 반환합니다.
+
+    Returns:
+        Optional[CrawlCache]: 캐시가 비활성화되어 있으면 None
+    """
+    global _crawl_cache
+    config = load_runtime_config('crawl_cache')
+    if not config.get('enabled', False):
+        return None
+    if _crawl_cache is None:
+        with _crawl_cache_lock:
+            if _crawl_cache is None:
+                _crawl_cache = CrawlCache(
+                    resolve_project_path(config.get('path', 'cache/crawl.sqlite3')),
+                    ttl_seconds=config.get('ttl_seconds'),
+                    max_bytes=config.get('max_bytes'),
+                )
+    return _crawl_cache
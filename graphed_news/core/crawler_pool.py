@@ -0,0 +1,282 @@
+"""
+브라우저 크롤러 풀 모듈
+
+URL마다 헤드리스 Chromium을 띄웠다 종료하지 않도록 미리 실행해 둔 AsyncWebCrawler를
+동시에 실행되는 crawl_news 호출에 나누어 줍니다. 일정 페이지 수를 처리했거나
+브라우저가 죽은 크롤러는 교체하고, 프로세스 종료 시 모든 브라우저를 닫습니다.
+기본 텍스트 전용 프로필은 이미지/폰트/미디어와 광고·분석 요청을 차단합니다.
+"""
+import asyncio
+import atexit
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from crawl4ai import AsyncWebCrawler
+from crawl4ai.async_configs import BrowserConfig
+
+from .utils import load_runtime_config
+
+# 텍스트 전용 프로필 기본값 (config/runtime_config.yaml의 browser_profile로 덮어쓸 수 있음)
+_DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+_DEFAULT_BLOCKED_HOSTS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "facebook.net",
+    "scorecardresearch.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "dable.io",
+    "mobon.net",
+]
+
+
+def load_browser_profile() -> Dict[str, Any]:
+    """
+    config/runtime_config.yaml의 browser_profile 설정을 기본값과 합쳐 반환합니다.
+
+    Returns:
+        Dict[str, Any]: text_only, light_mode, blocked_resource_types, blocked_hosts, wait_until, page_timeout
+    """
+    config = load_runtime_config('browser_profile')
+    return {
+        "text_only": config.get('text_only', True),
+        "light_mode": config.get('light_mode', True),
+        "blocked_resource_types": set(config.get('blocked_resource_types') or _DEFAULT_BLOCKED_RESOURCE_TYPES),
+        "blocked_hosts": tuple(config.get('blocked_hosts') or _DEFAULT_BLOCKED_HOSTS),
+        "wait_until": config.get('wait_until', 'domcontentloaded'),
+        "page_timeout": config.get('page_timeout', 30000),
+    }
+
+
+def build_browser_config(profile: Optional[Dict[str, Any]] = None) -> BrowserConfig:
+    """
+    프로필에 맞는 BrowserConfig를 생성합니다.
+
+    crawl4ai의 text_mode는 자바스크립트까지 끄므로 사용하지 않고,
+    light_mode(백그라운드 기능 비활성화)만 켠 뒤 리소스 차단은 요청 단위로 처리합니다.
+    """
+    profile = profile or load_browser_profile()
+    if not profile["text_only"]:
+        return BrowserConfig()
+    return BrowserConfig(light_mode=profile["light_mode"])
+
+
+def install_resource_blocking(crawler: AsyncWebCrawler, profile: Optional[Dict[str, Any]] = None):
+    """
+    새 페이지마다 이미지/폰트/미디어와 광고·분석 도메인 요청을 네트워크 단계에서 차단하는 훅을 등록합니다.
+
+    Args:
+        crawler (AsyncWebCrawler): 시작 전 크롤러
+        profile (Dict[str, Any], optional): 브라우저 프로필. 없으면 설정 파일에서 읽음
+    """
+    profile = profile or load_browser_profile()
+    if not profile["text_only"]:
+        return
+    blocked_types = profile["blocked_resource_types"]
+    blocked_hosts = profile["blocked_hosts"]
+
+    async def handle_route(route):
+        request = route.request
+        host = (urlsplit(request.url).hostname or "").lower()
+        if request.resource_type in blocked_types or any(
+            host == blocked or host.endswith("." + blocked) for blocked in blocked_hosts
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def on_page_context_created(page, **kwargs):
+        await page.route("**/*", handle_route)
+        return page
+
+    crawler.crawler_strategy.set_hook("on_page_context_created", on_page_context_created)
+
+
+class _PooledCrawler:
+    """풀에서 관리하는 크롤러와 처리한 페이지 수"""
+
+    def __init__(self, crawler: AsyncWebCrawler):
+        self.crawler = crawler
+        self.pages = 0
+
+
+def _is_alive(crawler: AsyncWebCrawler) -> bool:
+    """크롤러의 브라우저 프로세스가 아직 연결되어 있는지 확인합니다."""
+    browser = getattr(getattr(getattr(crawler, "crawler_strategy", None), "browser_manager", None), "browser", None)
+    if browser is None:
+        return getattr(crawler, "ready", False)
+    try:
+        return browser.is_connected()
+    except Exception:
+        return False
+
+
+class CrawlerPool:
+    """
+    실행 중인 AsyncWebCrawler 풀
+
+    크롤러는 처음 필요할 때 size개까지 만들어지며, 모두 사용 중이면 반환될 때까지 기다립니다.
+    Playwright 객체는 생성한 이벤트 루프에 묶이므로 풀도 루프마다 따로 사용해야 합니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_crawler: Optional[int] = 50,
+        browser_config_factory: Callable[[], BrowserConfig] = build_browser_config,
+        setup_crawler: Optional[Callable[[AsyncWebCrawler], None]] = install_resource_blocking,
+    ):
+        """
+        Args:
+            size (int): 동시에 실행해 둘 최대 크롤러(브라우저) 수
+            max_pages_per_crawler (int, optional): 이 페이지 수를 처리한 크롤러는 교체. 없으면 교체하지 않음
+            browser_config_factory (Callable): 새 크롤러에 사용할 BrowserConfig 생성 함수
+            setup_crawler (Callable, optional): 시작 전 크롤러에 훅 등을 등록하는 함수
+        """
+        self.size = max(1, size)
+        self.max_pages_per_crawler = max_pages_per_crawler
+        self.browser_config_factory = browser_config_factory
+        self.setup_crawler = setup_crawler
+        self._idle: List[_PooledCrawler] = []
+        self._members: List[_PooledCrawler] = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self.stats: Dict[str, int] = {"started": 0, "recycled": 0, "crashed": 0, "pages": 0}
+
+    async def _start_crawler(self) -> _PooledCrawler:
+        crawler = AsyncWebCrawler(config=self.browser_config_factory())
+        if self.setup_crawler is not None:
+            self.setup_crawler(crawler)
+        await crawler.start()
+        member = _PooledCrawler(crawler)
+        self._members.append(member)
+        self.stats["started"] += 1
+        return member
+
+    async def _discard(self, member: _PooledCrawler):
+        if member in self._members:
+            self._members.remove(member)
+        try:
+            await member.crawler.close()
+        except Exception as e:
+            print(f"⚠️ 크롤러 종료 중 오류: {e}")
+
+    async def _acquire_member(self) -> _PooledCrawler:
+        if self._closed:
+            raise RuntimeError("CrawlerPool is closed")
+        if self._idle:
+            return self._idle.pop()
+        # 세마포어가 동시 사용 수를 제한하므로 새 브라우저는 size개를 넘지 않습니다
+        return await self._start_crawler()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncWebCrawler]:
+        """
+        풀에서 크롤러를 하나 빌려옵니다.
+
+        블록 안에서 예외가 나거나 브라우저가 끊긴 크롤러는 닫고 버리며,
+        max_pages_per_crawler에 도달한 크롤러는 닫고 다음 요청 때 새로 만듭니다.
+
+        Yields:
+            AsyncWebCrawler: 시작된 크롤러
+        """
+        async with self._slots:
+            member = await self._acquire_member()
+            healthy = False
+            try:
+                yield member.crawler
+                healthy = True
+            finally:
+                member.pages += 1
+                self.stats["pages"] += 1
+                if not healthy or not _is_alive(member.crawler):
+                    self.stats["crashed"] += 1
+                    await self._discard(member)
+                elif self._closed or (self.max_pages_per_crawler and member.pages >= self.max_pages_per_crawler):
+                    self.stats["recycled"] += 1
+                    await self._discard(member)
+                else:
+                    self._idle.append(member)
+
+    async def warm_up(self, count: Optional[int] = None):
+        """
+        크롤러를 미리 시작해 둡니다.
+
+        Args:
+            count (int, optional): 시작할 크롤러 수. 없으면 풀 크기만큼
+        """
+        async with self._lock:
+            target = min(self.size, count or self.size)
+            while len(self._members) < target:
+                self._idle.append(await self._start_crawler())
+
+    async def close(self):
+        """사용 중이지 않은 크롤러를 모두 닫고, 사용 중인 크롤러는 반환될 때 닫습니다."""
+        async with self._lock:
+            self._closed = True
+            while self._idle:
+                await self._discard(self._idle.pop())
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, CrawlerPool]" = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_crawler_pool() -> CrawlerPool:
+    """
+    현재 이벤트 루프의 크롤러 풀을 반환합니다.
+
+    config/runtime_config.yaml의 crawler_pool 설정(size, max_pages_per_crawler)을 사용합니다.
+
+    Returns:
+        CrawlerPool: 현재 루프에 묶인 크롤러 풀
+    """
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.get(loop)
+        if pool is None or pool._closed:
+            config = load_runtime_config('crawler_pool')
+            pool = CrawlerPool(
+                size=config.get('size', 2),
+                max_pages_per_crawler=config.get('max_pages_per_crawler', 50),
+            )
+            _pools[loop] = pool
+    return pool
+
+
+async def close_crawler_pool():
+    """현재 이벤트 루프의 크롤러 풀을 닫습니다. (asyncio.run 종료 전에 호출)"""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+
+
+def _close_all_pools():
+    """프로세스 종료 시 아직 동작 중인 루프의 크롤러 풀을 닫습니다."""
+    with _pools_lock:
+        pools = list(_pools.items())
+        _pools.clear()
+    for loop, pool in pools:
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(pool.close(), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(pool.close())
+        except Exception as e:
+            print(f"⚠️ 크롤러 풀 종료 중 오류: {e}")
+
+
+atexit.register(_close_all_pools)
@@ -0,0 +1,167 @@
+"""
+HTTP 기사 수집 모듈
+
+서버에서 렌더링되는 허용 도메인(네이버 뉴스 등)은 헤드리스 브라우저 없이
+공유 HTTP 클라이언트로 HTML을 받아옵니다. 본문 영역이 없거나 허용 목록에 없는
+도메인이면 None을 반환하여 브라우저 크롤링으로 넘어가게 합니다.
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+from .utils import load_runtime_config
+
+_DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+
+class FetchedPage(NamedTuple):
+    """HTTP로 받은 기사 페이지"""
+    html: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    not_modified: bool = False
+    truncated: bool = False
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def _fetch_config() -> Dict[str, Any]:
+    return load_runtime_config('http_fetch')
+
+
+def domain_rule(url: str) -> Optional[Dict[str, Any]]:
+    """
+    URL의 호스트에 해당하는 허용 목록 규칙을 반환합니다.
+
+    Args:
+        url (str): 기사 URL
+
+    Returns:
+        Optional[Dict[str, Any]]: {"content_selector": 본문 CSS 선택자}, HTTP 수집이 꺼져 있거나 목록에 없으면 None
+    """
+    config = _fetch_config()
+    if not config.get('enabled', False):
+        return None
+    host = (urlsplit(url).hostname or "").lower()
+    rule = (config.get('domains') or {}).get(host)
+    if rule is None:
+        return None
+    return rule or {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 공유하는 HTTP 클라이언트를 반환합니다.
+
+    커넥션 풀은 생성한 이벤트 루프에 묶이므로 루프마다 하나씩 만듭니다.
+
+    Returns:
+        httpx.AsyncClient: Keep-Alive 커넥션을 재사용하는 클라이언트
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            config = _fetch_config()
+            client = httpx.AsyncClient(
+                timeout=config.get('timeout', 10),
+                follow_redirects=True,
+                headers={"User-Agent": config.get('user_agent') or _DEFAULT_USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=config.get('max_connections', 20),
+                    max_keepalive_connections=config.get('max_keepalive_connections', 10),
+                ),
+            )
+            _clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    """현재 이벤트 루프의 HTTP 클라이언트를 닫습니다."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def has_content(html: str, selector: Optional[str]) -> bool:
+    """
+    HTML에 본문 영역이 있고 비어 있지 않은지 확인합니다.
+
+    Args:
+        html (str): 페이지 HTML
+        selector (str, optional): 본문 CSS 선택자. 없으면 HTML이 비어 있지 않은지만 확인
+
+    Returns:
+        bool: 본문이 있으면 True
+    """
+    if not selector:
+        return bool(html.strip())
+    node = BeautifulSoup(html, "lxml").select_one(selector)
+    return node is not None and bool(node.get_text(strip=True))
+
+
+async def fetch_page(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+) -> Optional[FetchedPage]:
+    """
+    허용 도메인의 기사 HTML을 브라우저 없이 가져옵니다.
+
+    검증자를 넘기면 조건부 요청을 보내고, 304 응답이면 not_modified=True를 반환합니다.
+    응답 본문은 스트리밍으로 읽으며 max_bytes를 넘는 부분은 받지 않습니다. (truncated=True)
+
+    Args:
+        url (str): 기사 URL
+        etag (str, optional): 이전 응답의 ETag
+        last_modified (str, optional): 이전 응답의 Last-Modified
+        max_bytes (int, optional): 읽을 최대 HTML 바이트 수
+
+    Returns:
+        Optional[FetchedPage]: 본문이 있는 페이지, 허용 목록에 없거나 요청 실패/본문 없음이면 None
+    """
+    rule = domain_rule(url)
+    if rule is None:
+        return None
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        async with get_http_client().stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                return FetchedPage(None, etag, last_modified, not_modified=True)
+            response.raise_for_status()
+
+            body, truncated = bytearray(), False
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if max_bytes and len(body) > max_bytes:
+                    del body[max_bytes:]
+                    truncated = True
+                    break
+            html = bytes(body).decode(response.encoding or "utf-8", errors="replace")
+    except httpx.HTTPError as e:
+        print(f"⚠️ HTTP 수집 실패, 브라우저로 전환: {url} ({type(e).__name__}: {e})")
+        return None
+
+    if not await asyncio.to_thread(has_content, html, rule.get('content_selector')):
+        print(f"⚠️ 본문 영역 없음, 브라우저로 전환: {url}")
+        return None
+    return FetchedPage(html, response.headers.get("ETag"), response.headers.get("Last-Modified"), truncated=truncated)
@@ -0,0 +1,184 @@
+"""
+LLM 응답 캐시 모듈
+
+크래시 후 재실행이나 설정 변경 후 같은 기사를 다시 처리할 때 동일한 모델 호출을
+반복하지 않도록, 렌더링된 메시지와 모델 설정(모델명, temperature, 출력 스키마 등)의
+해시를 키로 응답을 SQLite 파일에 저장합니다. config/model_config.yaml에서
+cache: true로 지정한 모듈만 사용합니다.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+
+from .tracing import current_span
+from .utils import load_runtime_config, resolve_project_path
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    """렌더링된 메시지와 모델 설정 문자열로 캐시 키를 만듭니다."""
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+def _loads(value: str) -> Any:
+    with warnings.catch_warnings():
+        # langchain_core.load.loads의 베타 경고 무시
+        warnings.simplefilter("ignore")
+        return loads(value)
+
+
+def _without_usage(generations: Sequence[Any]) -> list:
+    """캐시에서 꺼낸 응답은 토큰을 쓰지 않았으므로 사용량을 0으로 바꿉니다."""
+    result = []
+    for generation in generations:
+        message = getattr(generation, "message", None)
+        if isinstance(message, AIMessage) and message.usage_metadata:
+            generation = generation.model_copy(update={
+                "message": message.model_copy(update={
+                    "usage_metadata": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0},
+                }),
+            })
+        result.append(generation)
+    return result
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    SQLite 기반 LLM 응답 캐시
+
+    LangChain 모델의 cache 필드에 넘겨 사용합니다. 전체 응답 크기가 max_bytes를 넘으면
+    오래 사용되지 않은 항목부터 삭제하며, 조회 결과를 현재 추적 구간에
+    llm_cache_hit / llm_cache_miss로 기록합니다.
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            max_bytes (int, optional): 저장할 응답의 최대 총 크기. 없으면 제한 없음
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evicted": 0}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                generations TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _record(self, hit: bool):
+        self.stats["hits" if hit else "misses"] += 1
+        span = current_span()
+        if span is not None:
+            span.count("llm_cache_hit" if hit else "llm_cache_miss")
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """
+        저장된 응답을 조회합니다.
+
+        Args:
+            prompt (str): 직렬화된 메시지
+            llm_string (str): 모델 설정과 호출 인자(출력 스키마 포함)를 직렬화한 문자열
+
+        Returns:
+            Optional[RETURN_VAL_TYPE]: 저장된 응답 (토큰 사용량은 0), 없으면 None
+        """
+        key = cache_key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute("SELECT generations FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                self._conn.commit()
+        if row is None:
+            self._record(False)
+            return None
+        try:
+            generations = _without_usage(_loads(row[0]))
+        except Exception as e:
+            print(f"⚠️ LLM 캐시 항목을 읽을 수 없어 무시합니다: {e}")
+            self._record(False)
+            return None
+        self._record(True)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """
+        응답을 저장하고 용량을 넘는 항목을 정리합니다.
+
+        Args:
+            prompt (str): 직렬화된 메시지
+            llm_string (str): 모델 설정과 호출 인자를 직렬화한 문자열
+            return_val (RETURN_VAL_TYPE): 모델 응답
+        """
+        value = dumps(list(return_val))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, generations, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (cache_key(prompt, llm_string), value, len(value.encode("utf-8")), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.stats["evicted"] += 1
+
+    def clear(self, **kwargs: Any) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+_llm_cache: Optional[SQLiteLLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[SQLiteLLMCache]:
+    """
+    config/runtime_config.yaml의 llm_cache 설정으로 만든 프로세스 전역 캐시를 반환합니다.
+
+    Returns:
+        Optional[SQLiteLLMCache]: 캐시가 비활성화되어 있으면 None
+    """
+    global _llm_cache
+    config = load_runtime_config('llm_cache')
+    if not config.get('enabled', False):
+        return None
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = SQLiteLLMCache(
+                    resolve_project_path(config.get('path', 'cache/llm.sqlite3')),
+                    max_bytes=config.get('max_bytes'),
+                )
+    return _llm_cache
@@ -0,0 +1,370 @@
+"""
+LLM/검색 호출 스케줄러 모듈
+
+core/의 모든 모델 호출과 검색 호출은 이 스케줄러를 거칩니다.
+config/model_config.yaml의 rate_limits로 모델(또는 도구)별 토큰 버킷을 만들고,
+priorities에 정의된 단계별 우선순위에 따라 대기 중인 호출 순서를 정합니다.
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_openai import ChatOpenAI
+from pydantic import Field
+
+from .llm_cache import get_llm_cache
+from .tracing import current_span
+from .utils import estimate_tokens, get_chat_client, load_model_config, load_scheduler_config
+
+class TokenBucket:
+    """분당 한도를 초당 보충량으로 환산한 토큰 버킷"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.refill_rate = per_minute / 60.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간 (0이면 즉시 가능)"""
+        self._refill()
+        # 버킷 용량보다 큰 요청은 가득 찼을 때 통과시켜 영원히 막히지 않도록 합니다
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def take(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float):
+        """예상치와 실제 사용량의 차이를 반영 (음수면 되돌려 줌)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class _Limiter:
+    """모델(또는 도구) 하나의 한도와 대기열"""
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None, max_concurrency: Optional[int] = None):
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.waiters: List[tuple] = []
+        # 대기 중인 호출을 깨우는 함수 (ticket별)
+        self.wakers: Dict[tuple, Callable[[], None]] = {}
+        # 지표
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+        self.max_queue_depth = 0
+
+    def wait_time(self, ticket: tuple, tokens: int) -> Optional[float]:
+        """
+        ticket이 지금 실행 가능한지 확인합니다.
+
+        Returns:
+            Optional[float]: 0이면 즉시 실행 가능, 양수면 예상 대기 시간, None이면 순서/동시성 대기
+        """
+        if self.waiters[0] != ticket:
+            return None
+        if self.max_concurrency and self.in_flight >= self.max_concurrency:
+            return None
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens and tokens:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+
+class Slot:
+    """획득한 실행 허가. 실제 사용 토큰 수를 기록하면 해제 시 TPM 버킷에 반영됩니다."""
+
+    def __init__(self, key: str, estimated_tokens: int):
+        self.key = key
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: Optional[int] = None
+        self.wait_seconds = 0.0
+
+
+def _record_wait(slot: Slot):
+    """현재 추적 구간에 스케줄러 대기 시간을 기록"""
+    span = current_span()
+    if span is not None:
+        span.record(scheduler_wait=slot.wait_seconds)
+
+
+class LLMScheduler:
+    """
+    모델/도구별 토큰 버킷과 우선순위 대기열을 관리하는 스케줄러
+
+    동기 호출(스레드)과 비동기 호출(이벤트 루프) 모두에서 사용할 수 있도록 상태는 스레드 락으로 보호합니다.
+    대기 중인 호출은 대기열 맨 앞이 되거나 동시 실행 슬롯이 비면 깨우고,
+    버킷이 다시 찰 때까지는 계산한 시간만큼만 잠듭니다.
+    """
+
+    def __init__(self, rate_limits: Optional[Dict[str, Dict[str, Any]]] = None, priorities: Optional[Dict[str, int]] = None):
+        self.rate_limits = rate_limits or {}
+        self.priorities = priorities or {}
+        self._limiters: Dict[str, _Limiter] = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    def priority_for(self, module_name: str) -> int:
+        """모듈(단계)의 우선순위"""
+        return int(self.priorities.get(module_name, self.priorities.get('default', 0)))
+
+    def _limiter(self, key: str) -> _Limiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limits = self.rate_limits.get(key, {})
+            limiter = _Limiter(limits.get('rpm'), limits.get('tpm'), limits.get('max_concurrency'))
+            self._limiters[key] = limiter
+        return limiter
+
+    def _enqueue(self, key: str, priority: int, waker: Callable[[], None]) -> tuple:
+        with self._lock:
+            limiter = self._limiter(key)
+            # 우선순위가 높을수록, 같으면 먼저 온 호출이 앞에 섭니다
+            ticket = (-priority, next(self._sequence))
+            heapq.heappush(limiter.waiters, ticket)
+            limiter.wakers[ticket] = waker
+            limiter.max_queue_depth = max(limiter.max_queue_depth, len(limiter.waiters))
+            return ticket
+
+    @staticmethod
+    def _wake_head(limiter: _Limiter):
+        """대기열 맨 앞의 호출을 깨웁니다. (락을 잡은 상태에서 호출)"""
+        if limiter.waiters:
+            try:
+                limiter.wakers[limiter.waiters[0]]()
+            except RuntimeError:
+                # 대기 중인 호출의 이벤트 루프가 이미 닫힌 경우
+                pass
+
+    def _try_acquire(self, key: str, ticket: tuple, tokens: int) -> Optional[float]:
+        """
+        실행 허가를 시도합니다.
+
+        Returns:
+            Optional[float]: 0이면 허가 획득, 양수면 버킷이 찰 때까지 기다릴 시간,
+            None이면 앞선 호출이나 동시 실행 슬롯을 기다려야 함 (깨울 때까지 대기)
+        """
+        with self._lock:
+            limiter = self._limiters[key]
+            wait = limiter.wait_time(ticket, tokens)
+            if wait is None or wait > 0:
+                return wait
+            heapq.heappop(limiter.waiters)
+            del limiter.wakers[ticket]
+            if limiter.requests:
+                limiter.requests.take(1)
+            if limiter.tokens and tokens:
+                limiter.tokens.take(tokens)
+            limiter.in_flight += 1
+            limiter.total_requests += 1
+            # 다음 호출도 남은 한도 안에서 바로 실행될 수 있음
+            self._wake_head(limiter)
+            return 0.0
+
+    def _cancel(self, key: str, ticket: tuple):
+        with self._lock:
+            limiter = self._limiters[key]
+            limiter.wakers.pop(ticket, None)
+            if ticket in limiter.waiters:
+                limiter.waiters.remove(ticket)
+                heapq.heapify(limiter.waiters)
+                self._wake_head(limiter)
+
+    def _release(self, slot: Slot):
+        with self._lock:
+            limiter = self._limiters[slot.key]
+            limiter.in_flight -= 1
+            limiter.total_wait_seconds += slot.wait_seconds
+            if limiter.tokens and slot.used_tokens is not None:
+                limiter.tokens.adjust(slot.used_tokens - slot.estimated_tokens)
+            self._wake_head(limiter)
+
+    @asynccontextmanager
+    async def slot(self, key: str, priority: int = 0, tokens: int = 0) -> AsyncIterator[Slot]:
+        """
+        비동기 호출용 실행 허가
+
+        Args:
+            key (str): 한도를 적용할 모델명 또는 도구명 (예: 'gpt-4.1', 'tavily')
+            priority (int): 우선순위 (클수록 먼저)
+            tokens (int): TPM 버킷에서 미리 차감할 예상 토큰 수
+        """
+        if key not in self.rate_limits:
+            # 한도가 설정되지 않은 모델은 대기열 없이 바로 실행
+            yield Slot(key, tokens)
+            return
+
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        ticket = self._enqueue(key, priority, lambda: loop.call_soon_threadsafe(wake.set))
+        started = time.monotonic()
+        try:
+            while True:
+                wake.clear()
+                wait = self._try_acquire(key, ticket, tokens)
+                if wait == 0:
+                    break
+                try:
+                    await asyncio.wait_for(wake.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._cancel(key, ticket)
+            raise
+
+        slot = Slot(key, tokens)
+        slot.wait_seconds = time.monotonic() - started
+        _record_wait(slot)
+        try:
+            yield slot
+        finally:
+            self._release(slot)
+
+    @contextmanager
+    def slot_sync(self, key: str, priority: int = 0, tokens: int = 0) -> Iterator[Slot]:
+        """동기 호출용 실행 허가 (인자는 slot과 동일)"""
+        if key not in self.rate_limits:
+            yield Slot(key, tokens)
+            return
+
+        wake = threading.Event()
+        ticket = self._enqueue(key, priority, wake.set)
+        started = time.monotonic()
+        try:
+            while True:
+                wake.clear()
+                wait = self._try_acquire(key, ticket, tokens)
+                if wait == 0:
+                    break
+                wake.wait(wait)
+        except BaseException:
+            self._cancel(key, ticket)
+            raise
+
+        slot = Slot(key, tokens)
+        slot.wait_seconds = time.monotonic() - started
+        _record_wait(slot)
+        try:
+            yield slot
+        finally:
+            self._release(slot)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        모델/도구별 대기열 지표를 반환합니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 키별 queue_depth, in_flight, max_queue_depth,
+            total_requests, avg_wait_seconds
+        """
+        with self._lock:
+            return {
+                key: {
+                    "queue_depth": len(limiter.waiters),
+                    "in_flight": limiter.in_flight,
+                    "max_queue_depth": limiter.max_queue_depth,
+                    "total_requests": limiter.total_requests,
+                    "avg_wait_seconds": limiter.total_wait_seconds / limiter.total_requests if limiter.total_requests else 0.0,
+                }
+                for key, limiter in self._limiters.items()
+            }
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """config/model_config.yaml 설정으로 만든 프로세스 전역 스케줄러를 반환합니다."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                config = load_scheduler_config()
+                _scheduler = LLMScheduler(config["rate_limits"], config["priorities"])
+    return _scheduler
+
+
+def _estimate_message_tokens(messages: List[BaseMessage]) -> int:
+    return sum(estimate_tokens(message.content if isinstance(message.content, str) else str(message.content)) for message in messages)
+
+
+def _used_tokens(result: ChatResult) -> Optional[int]:
+    token_usage = (result.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("total_tokens")
+
+
+class ScheduledChatOpenAI(ChatOpenAI):
+    """모든 요청이 LLMScheduler를 거치는 ChatOpenAI"""
+
+    schedule_priority: int = Field(default=0, description="스케줄러 우선순위 (클수록 먼저)")
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.streaming:
+            # 스트리밍은 _stream에서 허가를 받습니다
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        with get_scheduler().slot_sync(self.model_name, self.schedule_priority, _estimate_message_tokens(messages)) as slot:
+            result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            slot.used_tokens = _used_tokens(result)
+            return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.streaming:
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        async with get_scheduler().slot(self.model_name, self.schedule_priority, _estimate_message_tokens(messages)) as slot:
+            result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            slot.used_tokens = _used_tokens(result)
+            return result
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any):
+        with get_scheduler().slot_sync(self.model_name, self.schedule_priority, _estimate_message_tokens(messages)):
+            yield from super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any):
+        async with get_scheduler().slot(self.model_name, self.schedule_priority, _estimate_message_tokens(messages)):
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+
+
+def create_chat_model(module_name: str) -> ScheduledChatOpenAI:
+    """
+    모듈 설정과 단계 우선순위를 적용한 스케줄러 경유 ChatOpenAI를 반환합니다.
+    
+    같은 설정의 모듈은 utils.get_chat_client를 통해 하나의 인스턴스와 커넥션 풀을 공유합니다.
+
+    모듈 설정에 cache: true가 있으면 LLM 응답 캐시를 사용하며, 캐시된 응답은 스케줄러를 거치지 않습니다.
+
+    Args:
+        module_name (str): config/model_config.yaml의 모듈명 (예: 'news_processor')
+
+    Returns:
+        ScheduledChatOpenAI: 스케줄러를 거쳐 호출되는 모델 클라이언트
+    """
+    model_config = dict(load_model_config(module_name))
+    # 전역 캐시(set_llm_cache)는 사용하지 않고, 지정한 모듈에만 캐시 인스턴스를 넘깁니다
+    llm_cache = get_llm_cache() if model_config.pop('cache', False) else None
+    return get_chat_client(
+        model_config,
+        ScheduledChatOpenAI,
+        schedule_priority=get_scheduler().priority_for(module_name),
+        cache=llm_cache or False,
+    )
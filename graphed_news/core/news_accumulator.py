@@ -3,9 +3,9 @@
 """  
 from typing import List, Dict, Any, Optional  
 from pydantic import BaseModel, Field  
-from langchain_core.prompts import ChatPromptTemplate  
-from langchain_openai import ChatOpenAI  
-from .utils import load_model_config, load_prompt  
+from .llm_scheduler import create_chat_model  
+from .tracing import current_callbacks  
+from .utils import get_prompt_template  
 
   
 class FinalReport(BaseModel):  
@@ -30,27 +30,29 @@ class NewsAccumulator:
             model_name (str): 사용할 OpenAI 모델명  
             temperature (float): 생성 다양성 조절 값  
         """  
-        config = load_model_config('news_accumulator')
-        self.llm = ChatOpenAI(**config)  
+        # 마지막 단계이므로 스케줄러에서 가장 높은 우선순위를 받습니다
+        self.llm = create_chat_model('news_accumulator')  
+        # 구조화된 출력을 위한 LLM 설정 (실행마다 다시 만들지 않음)
+        self.structured_llm = self.llm.with_structured_output(FinalReport)
       
     def _format_qa(self, answers: List[Dict[str, str]]) -> str:  
         """질의응답 목록을 문자열 형태로 변환"""  
         return "\n".join([f"Q: {list(item.keys())[0]}\nA: {list(item.values())[0]}" for item in answers])  
   
-    def _generate_structured_report(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> FinalReport:  
-        """최종 요약 생성"""            
-        prompt_template = load_prompt('news_accumulator_prompt.yaml')
-        prompt = ChatPromptTemplate.from_template(prompt_template)  
-          
-        # 구조화된 출력을 위한 LLM 설정
-        structured_llm = self.llm.with_structured_output(FinalReport)
-
-        # 실제 입력 데이터 준비
-        input_data = {
+    def prompt_input(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> Dict[str, str]:  
+        """보고서 프롬프트(news_accumulator_prompt.yaml)에 넣을 입력 데이터 (배치 요청에서도 사용)"""  
+        return {
             "extracted_content": news_content['content'],  
             "qa": self._format_qa(qa),
             "ka": self._format_qa(ka)
         }
+  
+    def _prepare_report_chain(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]):  
+        """보고서 생성 체인과 입력 데이터 준비"""            
+        prompt = get_prompt_template('news_accumulator_prompt.yaml')
+
+        # 실제 입력 데이터 준비
+        input_data = self.prompt_input(news_content, qa, ka)
         
         """debug용: 프롬프트 포맷팅 확인"""
         # 실제 프롬프트 포맷팅해서 확인
@@ -66,13 +68,28 @@ class NewsAccumulator:
         print("=" * 80)
         """debug용: 프롬프트 포맷팅 확인"""
         
-        chain = prompt | structured_llm  
-        result = chain.invoke(input_data)  
-            
+        return prompt | self.structured_llm, input_data
+
+    def _to_report(self, result) -> FinalReport:
+        """LLM 결과를 FinalReport로 정규화"""
         # 결과가 딕셔너리인 경우 FinalReport로 변환
         if isinstance(result, dict):
             return FinalReport(**result)
         return result
+
+    def _generate_structured_report(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> FinalReport:  
+        """최종 요약 생성"""            
+        chain, input_data = self._prepare_report_chain(news_content, qa, ka)
+        result = chain.invoke(input_data, config={"callbacks": current_callbacks()})  
+            
+        return self._to_report(result)
+
+    async def _agenerate_structured_report(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> FinalReport:  
+        """최종 요약 생성 (비동기)"""            
+        chain, input_data = self._prepare_report_chain(news_content, qa, ka)
+        result = await chain.ainvoke(input_data, config={"callbacks": current_callbacks()})  
+            
+        return self._to_report(result)
             
     def process(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> str:  
         """  
@@ -87,6 +104,25 @@ class NewsAccumulator:
         """  
         report = self._generate_structured_report(news_content, qa, ka)  
 
+        return self.render_report(news_content, report)
+
+    async def process_async(self, news_content: Dict[str, Any], qa: List[Dict[str, str]], ka: List[Dict[str, str]]) -> str:  
+        """  
+        process의 비동기 버전  
+          
+        Args:  
+            news_content (Dict[str, Any]): 정제된 뉴스 기사 내용  
+            answers (List[Dict[str, str]]): 질문과 답변 쌍의 목록  
+              
+        Returns:  
+            str: 마크다운 형식의 최종 보고서  
+        """  
+        report = await self._agenerate_structured_report(news_content, qa, ka)  
+
+        return self.render_report(news_content, report)
+
+    def render_report(self, news_content: Dict[str, Any], report: FinalReport) -> str:  
+        """구조화된 보고서를 마크다운 문자열로 변환 (배치 결과에서도 사용)"""  
         # 최종 보고서를 문자열로 변환하여 반환
         doc = f"""
 ### {news_content['topic']}
@@ -1,31 +1,230 @@
 """
 뉴스 기사 크롤링 모듈
 """
-from crawl4ai import AsyncWebCrawler
-from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
-async def crawl_news(url):
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+from .content_cleaner import TRUNCATION_MARKER, limit_content
+from .crawl_cache import get_crawl_cache
+from .crawler_pool import get_crawler_pool, load_browser_profile
+from .http_fetcher import fetch_page
+from .result_cache import content_hash
+from .tracing import current_span
+from .utils import load_runtime_config
+
+
+class CrawlError(RuntimeError):
+    """페이지를 크롤링하지 못했거나 본문이 비어 있는 경우"""
+
+
+def _build_run_config() -> CrawlerRunConfig:
+    """브라우저/HTTP 수집 경로가 공유하는 crawl4ai 추출 설정"""
+    profile = load_browser_profile()
+    return CrawlerRunConfig(
+        # 텍스트만 필요하므로 DOMContentLoaded 이후 바로 추출 (이미지 로딩 대기 없음)
+        wait_until=profile["wait_until"],
+        page_timeout=profile["page_timeout"],
+        wait_for_images=False,
+        excluded_tags=['form', 'header', 'footer', 'nav'],
+        keep_data_attributes=False,
+        only_text=True,
+        exclude_external_links=True,    
+        exclude_social_media_links=True,
+        exclude_external_images=True
+    )
+
+
+def html_to_markdown(url: str, html: str, run_config: CrawlerRunConfig) -> str:
+    """
+    브라우저 크롤링과 같은 스크래핑 전략과 마크다운 생성기로 HTML을 마크다운으로 변환합니다.
+    
+    Args:
+        url (str): 기사 URL (상대 링크 기준)
+        html (str): 페이지 HTML
+        run_config (CrawlerRunConfig): 추출 설정
+        
+    Returns:
+        str: 마크다운 텍스트
+    """
+    params = run_config.__dict__.copy()
+    params.pop("url", None)
+    scraped = run_config.scraping_strategy.scrap(url, html, **params)
+    markdown_generator = run_config.markdown_generator or DefaultMarkdownGenerator()
+    return markdown_generator.generate_markdown(input_html=scraped.cleaned_html, base_url=url).raw_markdown
+
+
+async def crawl_news(url, force_refresh=False):
     """
     웹 페이지의 내용을 크롤링하여 마크다운 형식으로 반환합니다.
     
+    크롤링 캐시에 TTL 안의 결과가 있으면 그대로 반환하고, 지난 결과는 조건부 요청으로 재검증합니다.
+    허용 도메인은 HTTP로 HTML을 받아 바로 변환하고, 그 외 도메인이나 본문을 찾지 못한 경우
+    현재 이벤트 루프의 크롤러 풀에서 브라우저를 빌려 크롤링합니다.
+    runtime_config.yaml의 crawl_limits(HTML 바이트, 마크다운 글자 수, 예상 토큰 수)를 넘는 페이지는
+    제목과 앞부분 문단만 남기고 잘라내며, 끝에 TRUNCATION_MARKER를 붙입니다.
+    
     Args:
         url (str): 크롤링할 웹 페이지의 URL
+        force_refresh (bool): True이면 캐시를 무시하고 다시 크롤링
         
     Returns:
         str: 크롤링된 내용의 마크다운 텍스트
+        
+    Raises:
+        CrawlError: 브라우저 크롤링이 실패했거나 본문이 비어 있는 경우
     """
-    browser_config = BrowserConfig()  # Default browser configuration
-    run_config = CrawlerRunConfig(
-        excluded_tags=['form', 'header', 'footer', 'nav'],
-        keep_data_attributes=False,
-        only_text=True,
-        exclude_external_links=True,    
-        exclude_social_media_links=True,
-        exclude_external_images=True
-    )
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-        result = await crawler.arun(
-            url=url,
-            config=run_config
-        )
-        return result.markdown
+    run_config = _build_run_config()
+    limits = load_runtime_config('crawl_limits')
+    max_html_bytes = limits.get('max_html_bytes')
+    span = current_span()
+    cache = get_crawl_cache()
+
+    def count(name):
+        if span is not None:
+            span.count(name)
+
+    cached = cache.get(url) if cache is not None and not force_refresh else None
+    if cached is not None and cached.fresh:
+        count("crawl_cache_hit")
+        return cached.markdown
+    if cache is not None:
+        count("crawl_cache_miss")
+
+    markdown, etag, last_modified, html_truncated = None, None, None, False
+    if cached is not None:
+        page = await fetch_page(url, cached.etag, cached.last_modified, max_bytes=max_html_bytes)
+    else:
+        page = await fetch_page(url, max_bytes=max_html_bytes)
+    if page is not None and page.not_modified:
+        cache.mark_revalidated(url)
+        count("crawl_cache_revalidated")
+        return cached.markdown
+    if page is not None:
+        converted = await asyncio.to_thread(html_to_markdown, url, page.html, run_config)
+        if converted.strip():
+            count("crawl_http")
+            markdown, etag, last_modified = converted, page.etag, page.last_modified
+            html_truncated = page.truncated
+        else:
+            print(f"⚠️ 변환된 본문이 비어 있음, 브라우저로 전환: {url}")
+
+    if markdown is None:
+        count("crawl_browser")
+        async with get_crawler_pool().acquire() as crawler:
+            result = await crawler.arun(
+                url=url,
+                config=run_config
+            )
+        if not result.success:
+            raise CrawlError(f"크롤링 실패: {url} (status={result.status_code}, {result.error_message})")
+        markdown = result.markdown
+        html = result.html or ""
+        if max_html_bytes and len(html) > max_html_bytes // 4 and len(html.encode("utf-8")) > max_html_bytes:
+            # 브라우저는 이미 전체를 받았으므로 앞부분 HTML만 다시 변환하여 결과 크기를 제한
+            html = html.encode("utf-8")[:max_html_bytes].decode("utf-8", errors="ignore")
+            markdown = await asyncio.to_thread(html_to_markdown, url, html, run_config)
+            html_truncated = True
+
+    if not markdown or not str(markdown).strip():
+        raise CrawlError(f"크롤링한 본문이 비어 있습니다: {url}")
+
+    markdown, truncated = limit_content(str(markdown), limits.get('max_markdown_chars'), limits.get('max_tokens'))
+    if html_truncated and not truncated:
+        markdown += TRUNCATION_MARKER
+    if truncated or html_truncated:
+        count("crawl_truncated")
+        print(f"✂️ 크롤링 결과가 길어 앞부분만 사용: {url} ({len(markdown)}자)")
+
+    if cache is not None:
+        if cached is not None and content_hash(str(markdown)) == cached.content_hash and not (etag or last_modified):
+            # 검증자가 없는 응답은 내용 해시가 같으면 재검증된 것으로 봅니다
+            cache.mark_revalidated(url)
+        else:
+            cache.put(url, markdown, etag, last_modified)
+    return markdown
+
+
+class _HostLimiter:
+    """호스트별 동시 요청 수와 요청 시작 간격 제한"""
+
+    def __init__(self, max_concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.delay = delay
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        """이전 요청 시작 후 delay초가 지날 때까지 기다립니다."""
+        async with self._lock:
+            wait = self._next_start - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = time.monotonic() + self.delay
+
+
+async def crawl_many(
+    urls: Iterable[str],
+    max_concurrency: Optional[int] = None,
+    per_host_concurrency: Optional[int] = None,
+    per_host_delay: Optional[float] = None,
+    force_refresh: bool = False,
+    crawl: Optional[Callable[..., Awaitable[str]]] = None,
+) -> AsyncIterator[Tuple[str, Union[str, Exception]]]:
+    """
+    여러 URL을 동시에 크롤링하고 끝나는 순서대로 결과를 반환합니다.
+    
+    각 페이지는 crawl_news를 거치므로 크롤링 캐시, HTTP 수집, 공유 브라우저 풀을 그대로 사용합니다.
+    크롤링 캐시에 TTL 안의 결과가 있는 URL은 호스트에 요청하지 않으므로 제한 없이 바로 처리합니다.
+    제한 값을 주지 않으면 config/runtime_config.yaml의 crawl_many 설정을 사용합니다.
+    
+    Args:
+        urls (Iterable[str]): 크롤링할 URL 목록
+        max_concurrency (int, optional): 전체 동시 크롤링 수
+        per_host_concurrency (int, optional): 호스트별 동시 크롤링 수
+        per_host_delay (float, optional): 같은 호스트에 요청을 시작하는 최소 간격 (초)
+        force_refresh (bool): True이면 크롤링 캐시를 무시
+        crawl (Callable, optional): 페이지 하나를 크롤링할 함수. 없으면 crawl_news
+        
+    Yields:
+        Tuple[str, Union[str, Exception]]: (URL, 마크다운 또는 발생한 예외)
+    """
+    config = load_runtime_config('crawl_many')
+    max_concurrency = max_concurrency or config.get('max_concurrency', 8)
+    per_host_concurrency = per_host_concurrency or config.get('per_host_concurrency', 2)
+    per_host_delay = config.get('per_host_delay', 0.5) if per_host_delay is None else per_host_delay
+    crawl = crawl or crawl_news
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    hosts: Dict[str, _HostLimiter] = {}
+    cache = get_crawl_cache() if not force_refresh else None
+
+    async def crawl_one(url: str) -> Tuple[str, Union[str, Exception]]:
+        if cache is not None and cache.is_fresh(url):
+            try:
+                return url, await crawl(url, force_refresh=force_refresh)
+            except Exception as e:
+                return url, e
+
+        host = (urlsplit(url).hostname or "").lower()
+        limiter = hosts.setdefault(host, _HostLimiter(per_host_concurrency, per_host_delay))
+        async with limiter.semaphore:
+            # 전체 슬롯을 얻은 뒤 간격을 맞춰야 슬롯을 기다리던 같은 호스트 요청이 한꺼번에 시작되지 않음
+            async with semaphore:
+                await limiter.wait_turn()
+                try:
+                    return url, await crawl(url, force_refresh=force_refresh)
+                except Exception as e:
+                    return url, e
+
+    tasks = [asyncio.ensure_future(crawl_one(url)) for url in urls]
+    try:
+        for next_page in asyncio.as_completed(tasks):
+            yield await next_page
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,56 @@
+"""
+뉴스 정제, 주제/키워드 추출과 질문 생성을 한 번의 호출로 처리하는 모듈
+
+news_processor와 news_question_generator를 차례로 호출하면 정제된 기사가
+질문 생성 호출의 입력으로 다시 전송되므로, 두 단계를 하나의 구조화된 호출로 합쳐
+기사마다 왕복 한 번과 기사 입력 토큰 한 벌을 줄입니다.
+"""
+from typing import List
+from pydantic import Field
+from .llm_scheduler import create_chat_model
+from .news_processor import NewsArticle, ainvoke_chunked, invoke_chunked
+from .structured_output import build_structured_chain
+from .utils import get_prompt_template
+
+class NewsAnalysis(NewsArticle):
+    questions: List[str] = Field(description="List of questions about the news article")
+
+def _build_fused_chain():
+    """정제 + 질문 생성 체인(프롬프트 | JSON 스키마 출력 LLM)을 구성합니다."""
+    # config의 모델 설정과 단계 우선순위로 스케줄러 경유 모델 생성
+    llm = create_chat_model('news_fused_extractor')
+    
+    # 프롬프트 템플릿 (파일이 바뀔 때만 다시 생성)
+    prompt = get_prompt_template('news_fused_extractor_prompt.yaml')
+    
+    # 체인 구성 - 형식 지침 대신 모델의 JSON 스키마 출력 사용
+    return build_structured_chain(prompt, llm, NewsAnalysis)
+
+def extract_news_and_questions(raw_content: str) -> NewsAnalysis:
+    """
+    LLM 한 번으로 뉴스 내용을 정제하고 주제, 키워드, 질문을 생성합니다.
+    긴 본문은 news_processor와 같이 조각별로 추출한 뒤 합칩니다.
+    
+    Args:
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        NewsAnalysis: 정제된 뉴스 기사와 질문 (topic, keywords, content, questions)
+    """
+    chain = _build_fused_chain()
+
+    return invoke_chunked(chain, raw_content)
+
+async def extract_news_and_questions_async(raw_content: str) -> NewsAnalysis:
+    """
+    extract_news_and_questions의 비동기 버전입니다.
+    
+    Args:
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        NewsAnalysis: 정제된 뉴스 기사와 질문 (topic, keywords, content, questions)
+    """
+    chain = _build_fused_chain()
+
+    return await ainvoke_chunked(chain, raw_content)
@@ -1,41 +1,186 @@
 """
 뉴스 정제 및 주제, 키워드 추출 모듈
+
+본문이 chunked_extraction.max_tokens를 넘으면 문단 단위로 겹치게 나누어 조각별로
+동시에 추출한 뒤 하나의 결과로 합칩니다. (map-reduce)
 """
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
-from typing import List
+import re
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Sequence
 from pydantic import BaseModel, Field
-from .utils import load_prompt, load_model_config
+from langchain_core.runnables import Runnable
+from .content_cleaner import split_into_chunks
+from .llm_scheduler import create_chat_model
+from .structured_output import build_structured_chain
+from .tracing import current_callbacks, current_span
+from .utils import estimate_tokens, get_prompt_template, load_runtime_config
 
 class NewsArticle(BaseModel):
     topic: str = Field(description="Topics for news articles")
     keywords: List[str] = Field(description="Key words or sentences extracted from articles to search for news on similar topics")
     content: str = Field(description="Refined news article content")
 
+def _build_extraction_chain():
+    """뉴스 정제 체인(프롬프트 | JSON 스키마 출력 LLM)을 구성합니다."""
+    # config의 모델 설정과 단계 우선순위로 스케줄러 경유 모델 생성
+    llm = create_chat_model('news_processor')
+    
+    # 프롬프트 템플릿 (파일이 바뀔 때만 다시 생성)
+    prompt = get_prompt_template('news_processor_prompt.yaml')
+    
+    # 체인 구성 - 형식 지침 대신 모델의 JSON 스키마 출력 사용
+    return build_structured_chain(prompt, llm, NewsArticle)
+
 def extract_news_content(raw_content: str) -> NewsArticle:
     """
     LLM을 사용하여 뉴스 내용에서 필요한 부분만 추출합니다.
     
+    긴 본문은 겹치는 조각으로 나누어 추출한 뒤 합치고, 짧은 본문은 한 번에 추출합니다.
+    
     Args:
         raw_content (str): 뉴스 내용 (마크다운 형식)
         
     Returns:
         NewsArticle: 필요한 부분만 추출된 뉴스 기사 객체 (topic, keywords, content)
     """
-    # config에서 모델 설정 불러오기
-    model_config = load_model_config('news_processor')
+    chain = _build_extraction_chain()
+
+    return invoke_chunked(chain, raw_content)
+
+async def extract_news_content_async(raw_content: str) -> NewsArticle:
+    """
+    extract_news_content의 비동기 버전입니다. 호출한 이벤트 루프 위에서 LLM을 호출합니다.
     
-    llm = ChatOpenAI(**model_config)
+    Args:
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        NewsArticle: 필요한 부분만 추출된 뉴스 기사 객체 (topic, keywords, content)
+    """
+    chain = _build_extraction_chain()
+
+    return await ainvoke_chunked(chain, raw_content)
+
+
+def split_for_extraction(raw_content: str) -> List[str]:
+    """
+    추출 호출 단위로 본문을 나눕니다.
     
-    # Pydantic 출력 파서 설정
-    article_parser = PydanticOutputParser(pydantic_object=NewsArticle)
+    config/runtime_config.yaml의 chunked_extraction.max_tokens 이하인 본문은 나누지 않습니다.
     
-    # YAML 파일에서 프롬프트 템플릿 불러오기
-    prompt_template = load_prompt('news_processor_prompt.yaml')
-    prompt = ChatPromptTemplate.from_template(prompt_template)
+    Args:
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        List[str]: 조각 목록 (짧은 본문이면 본문 하나)
+    """
+    config = load_runtime_config('chunked_extraction')
+    if not config.get('enabled', True) or estimate_tokens(raw_content) <= config.get('max_tokens', 12000):
+        return [raw_content]
+    return split_into_chunks(raw_content, config.get('chunk_tokens', 6000), config.get('overlap_tokens', 300))
+
+def _normalize(item: str) -> str:
+    return re.sub(r"\s+", " ", item).strip().lower()
+
+def _dedupe(items: Sequence[str], limit: Optional[int] = None) -> List[str]:
+    """공백/대소문자 차이를 무시하고 중복을 제거합니다. (처음 나온 순서 유지)"""
+    seen, result = set(), []
+    for item in items:
+        key = _normalize(item)
+        if key and key not in seen:
+            seen.add(key)
+            result.append(item.strip())
+    return result[:limit] if limit else result
+
+def _rank(items: Sequence[str], limit: Optional[int] = None) -> List[str]:
+    """여러 조각에 나온 항목을 먼저, 같으면 먼저 나온 순서로 정렬하여 limit개까지 반환합니다."""
+    first: Dict[str, str] = {}
+    counts: Dict[str, int] = {}
+    for item in items:
+        key = _normalize(item)
+        if key:
+            first.setdefault(key, item.strip())
+            counts[key] = counts.get(key, 0) + 1
+    ranked = [first[key] for key in sorted(counts, key=lambda key: -counts[key])]
+    return ranked[:limit] if limit else ranked
+
+def merge_articles(articles: Sequence[NewsArticle]) -> NewsArticle:
+    """
+    조각별 추출 결과를 하나로 합칩니다.
     
-    # 체인 구성 - 형식 지침 포함
-    chain = prompt.partial(format_instructions=article_parser.get_format_instructions()) | llm | article_parser
+    주제는 제목이 있는 첫 조각의 것을 사용하고, 키워드는 여러 조각에서 나온 순서대로,
+    본문은 겹친 문단을 제거하여 이어 붙입니다. 질문 등 다른 목록 필드는 조각별 결과를 번갈아 모아
+    키워드와 같은 방식으로 정렬하고, 한 번의 호출에서 나온 최대 개수까지만 남깁니다.
+    (조각 수만큼 질문이 늘어나 답변 에이전트 호출이 불어나지 않도록)
+    
+    Args:
+        articles (Sequence[NewsArticle]): 조각 순서대로의 추출 결과
+        
+    Returns:
+        NewsArticle: 합친 결과 (첫 결과와 같은 타입)
+    """
+    config = load_runtime_config('chunked_extraction')
+    keywords = [keyword for article in articles for keyword in _dedupe(article.keywords)]
+    
+    paragraphs = [paragraph for article in articles for paragraph in re.split(r"\n\s*\n", article.content)]
+    
+    merged: Dict[str, Any] = {
+        "topic": articles[0].topic,
+        "keywords": _rank(keywords, config.get('max_keywords', 10)),
+        "content": "\n\n".join(_dedupe(paragraphs)),
+    }
+    schema = type(articles[0])
+    for name in schema.model_fields:
+        if name not in merged:
+            values = [getattr(article, name) for article in articles]
+            if isinstance(values[0], list):
+                lists = [_dedupe(value) for value in values]
+                interleaved = [item for group in zip_longest(*lists) for item in group if item is not None]
+                merged[name] = _rank(interleaved, max(len(value) for value in lists))
+            else:
+                merged[name] = values[0]
+    return schema(**merged)
+
+def _batch_config(chunks: List[str]) -> Dict[str, Any]:
+    print(f"✂️ 긴 기사를 {len(chunks)}개 조각으로 나누어 추출")
+    span = current_span()
+    if span is not None:
+        span.count("extract_chunks", len(chunks))
+    return {
+        "callbacks": current_callbacks(),
+        "max_concurrency": load_runtime_config('chunked_extraction').get('max_concurrency', 4),
+    }
 
-    return chain.invoke({"raw_content": raw_content})
+def invoke_chunked(chain: Runnable, raw_content: str) -> NewsArticle:
+    """
+    추출 체인을 실행합니다. 긴 본문은 조각별로 실행한 뒤 merge_articles로 합칩니다.
+    
+    Args:
+        chain (Runnable): {"raw_content"}를 받아 NewsArticle(또는 하위 타입)을 반환하는 체인
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        NewsArticle: 추출 결과
+    """
+    chunks = split_for_extraction(raw_content)
+    if len(chunks) == 1:
+        return chain.invoke({"raw_content": raw_content}, config={"callbacks": current_callbacks()})
+    results = chain.batch([{"raw_content": chunk} for chunk in chunks], config=_batch_config(chunks))
+    return merge_articles(results)
+
+async def ainvoke_chunked(chain: Runnable, raw_content: str) -> NewsArticle:
+    """
+    invoke_chunked의 비동기 버전입니다. 조각들은 동시에 추출합니다.
+    
+    Args:
+        chain (Runnable): {"raw_content"}를 받아 NewsArticle(또는 하위 타입)을 반환하는 체인
+        raw_content (str): 뉴스 내용 (마크다운 형식)
+        
+    Returns:
+        NewsArticle: 추출 결과
+    """
+    chunks = split_for_extraction(raw_content)
+    if len(chunks) == 1:
+        return await chain.ainvoke({"raw_content": raw_content}, config={"callbacks": current_callbacks()})
+    results = await chain.abatch([{"raw_content": chunk} for chunk in chunks], config=_batch_config(chunks))
+    return merge_articles(results)
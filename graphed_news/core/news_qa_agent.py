@@ -2,78 +2,141 @@
 뉴스 기사 질문에 답변하는 에이전트 모듈 (LangGraph 버전)  
 """  
 from dotenv import load_dotenv  
-from langchain_openai import ChatOpenAI  
 from langchain_core.tools import Tool  
 from langgraph.prebuilt import create_react_agent  
 from langchain_community.tools.tavily_search import TavilySearchResults  
 from langgraph.checkpoint.memory import MemorySaver  
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import asyncio  
-from .utils import load_model_config, load_prompt  
+from .llm_scheduler import create_chat_model, get_scheduler  
+from .tracing import current_callbacks, trace_span  
+from .utils import load_prompt  
   
 load_dotenv()  
   
 def get_background_info_search(query: str) -> str:  
     """Searches for background information related to a question."""  
     search = TavilySearchResults()  
-    results = search.run(query)  
+    with get_scheduler().slot_sync("tavily"):  
+        results = search.run(query)  
+    return results  
+  
+async def aget_background_info_search(query: str) -> str:  
+    """Searches for background information related to a question without blocking the event loop."""  
+    search = TavilySearchResults()  
+    async with get_scheduler().slot("tavily"):  
+        results = await search.arun(query)  
     return results  
   
 class NewsQnAAgent:  
-    def __init__(self):  
+    def __init__(self, max_concurrency: int = 5):  
         """  
         뉴스 QnA 에이전트 초기화 (LangGraph 버전)  
+  
+        Args:  
+            max_concurrency (int): 기사 하나에서 동시에 실행할 최대 질문 수  
         """  
-        model_config = load_model_config('news_qa_agent')  
-          
-        self.llm = ChatOpenAI(**model_config)  
+        self.max_concurrency = max_concurrency  
+        self.llm = create_chat_model('news_qa_agent')  
         self.tools = [  
             Tool(  
                 name="search_background_information",
                 func=get_background_info_search,  
+                coroutine=aget_background_info_search,  
                 description="Useful for finding background information, context, or explanations for concepts mentioned in the question",  
             )  
         ]
           
+        # 에이전트가 재사용될 때 대화 기록이 쌓이지 않도록 답변 후 스레드를 삭제합니다  
+        self.checkpointer = MemorySaver()  
+          
         # LangGraph의 create_react_agent 사용  
         self.graph = create_react_agent(  
             model=self.llm,  
             tools=self.tools,  
-            checkpointer=MemorySaver(),  # 상태 지속성  
+            checkpointer=self.checkpointer,  # 상태 지속성  
             debug=True  
         )  
   
-    def answer_question(self, news_content: str, question: str, thread_id: Optional[str] = None):  
-        """  
-        뉴스 기사에 대한 질문에 답변합니다.  
-        """  
+    def _build_prompt(self, news_content: str, question: str) -> str:  
+        """에이전트에 전달할 프롬프트를 구성합니다."""  
         # YAML 파일에서 프롬프트 템플릿 불러오기
         prompt_template = load_prompt('news_qa_agent_prompt.yaml')
-        context_prompt = prompt_template.format(
+        return prompt_template.format(
             news_content=news_content,
             question=question
-        )  
+        )
+  
+    def answer_question(self, news_content: str, question: str, thread_id: Optional[str] = None):  
+        """  
+        뉴스 기사에 대한 질문에 답변합니다.  
+        """  
+        context_prompt = self._build_prompt(news_content, question)  
                     
         result = self.graph.invoke(  
             {"messages": [{"role": "user", "content": context_prompt}]},  
-            config={"configurable": {"thread_id": thread_id or "default"}}  
+            config={"configurable": {"thread_id": thread_id or "default"}, "callbacks": current_callbacks()}  
+        )  
+          
+        return result["messages"][-1].content  
+  
+    async def answer_question_async(self, news_content: str, question: str, thread_id: Optional[str] = None):  
+        """  
+        뉴스 기사에 대한 질문에 답변합니다. (비동기)  
+        """  
+        context_prompt = self._build_prompt(news_content, question)  
+                    
+        result = await self.graph.ainvoke(  
+            {"messages": [{"role": "user", "content": context_prompt}]},  
+            config={"configurable": {"thread_id": thread_id or "default"}, "callbacks": current_callbacks()}  
         )  
           
         return result["messages"][-1].content  
   
-    async def process_questions_async(self, news_content: str, questions: List[str]) -> List[Dict[str, str]]:  
+    async def process_questions_async(  
+        self,  
+        news_content: str,  
+        questions: List[str],  
+        thread_prefix: str = "thread",  
+        on_result: Optional[Callable[[Dict[str, str]], None]] = None,  
+        completed: Optional[Dict[str, str]] = None,  
+        on_answer: Optional[Callable[[str, str], None]] = None,  
+    ) -> List[Dict[str, str]]:  
         """  
         뉴스 기사에 대한 여러 질문에 답변합니다. (비동기 병렬 처리)  
+        thread_prefix는 에이전트 스레드 ID 접두사로, 에이전트를 여러 기사가 공유할 때 기사마다 달라야 합니다.  
+        on_result가 주어지면 각 {question: 답변} 쌍이 완료되는 즉시 호출합니다.  
+        completed에 이미 답변이 있는 question은 다시 실행하지 않고, on_answer는 새로 생성에 성공한 답변마다 (question, 답변)으로 호출합니다.  
         """  
         if not questions:  
             return []  
           
+        semaphore = asyncio.Semaphore(self.max_concurrency)  
+        completed = completed or {}  
+          
         async def answer_single_question(question: str, index: int):  
+            if question in completed:  
+                pair = {question: completed[question]}  
+                if on_result:  
+                    on_result(pair)  
+                return pair  
+              
+            thread_id = f"{thread_prefix}_{index}"  
             try:  
-                answer = self.answer_question(news_content, question, f"thread_{index}")  
-                return {question: answer}  
+                async with semaphore:  
+                    with trace_span(question, "qa"):  
+                        answer = await self.answer_question_async(news_content, question, thread_id)  
+                pair = {question: answer}  
+                if on_answer:  
+                    on_answer(question, answer)  
             except Exception as e:  
-                return {question: f"답변 생성 중 오류가 발생했습니다: {str(e)}"}  
+                pair = {question: f"답변 생성 중 오류가 발생했습니다: {str(e)}"}  
+            finally:  
+                self.checkpointer.delete_thread(thread_id)  
+              
+            if on_result:  
+                on_result(pair)  
+            return pair  
           
         tasks = [answer_single_question(q, i) for i, q in enumerate(questions)]  
         results = await asyncio.gather(*tasks)  
@@ -1,16 +1,27 @@
 """
 뉴스 기사에 대한 질문 생성 모듈
 """
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 from typing import List
 from pydantic import BaseModel, Field
-from .utils import load_prompt, load_model_config
+from .llm_scheduler import create_chat_model
+from .structured_output import build_structured_chain
+from .tracing import current_callbacks
+from .utils import get_prompt_template
 
 class QuestionList(BaseModel):
     questions: List[str] = Field(description="List of questions about the news article")
 
+def _build_question_chain():
+    """질문 생성 체인(프롬프트 | JSON 스키마 출력 LLM)을 구성합니다."""
+    # 프롬프트 템플릿 (파일이 바뀔 때만 다시 생성)
+    question_prompt = get_prompt_template('news_question_generator_prompt.yaml')
+
+    # config의 모델 설정과 단계 우선순위로 스케줄러 경유 모델 생성
+    llm = create_chat_model('news_question_generator')
+
+    # 체인 구성 - 형식 지침 대신 모델의 JSON 스키마 출력 사용
+    return build_structured_chain(question_prompt, llm, QuestionList)
+
 def generate_questions(content):
     """
     뉴스 기사 내용에 대한 질문 목록을 생성합니다.
@@ -21,20 +32,20 @@ def generate_questions(content):
     Returns:
         List[str]: 생성된 질문 목록
     """
-    # 출력 파서 설정
-    question_parser = PydanticOutputParser(pydantic_object=QuestionList)
+    question_chain = _build_question_chain()
 
-    # YAML 파일에서 프롬프트 템플릿 불러오기
-    prompt_template = load_prompt('news_question_generator_prompt.yaml')
-    question_prompt = ChatPromptTemplate.from_template(prompt_template)
+    return question_chain.invoke({"content": content}, config={"callbacks": current_callbacks()})
 
-    # config에서 모델 설정 불러오기
-    model_config = load_model_config('news_question_generator')
+async def generate_questions_async(content):
+    """
+    generate_questions의 비동기 버전입니다.
     
-    # LLM 설정
-    llm = ChatOpenAI(**model_config)
-
-    # 체인 구성
-    question_chain = question_prompt.partial(format_instructions=question_parser.get_format_instructions()) | llm | question_parser
+    Args:
+        content (str): 정제된 뉴스 기사 내용
+        
+    Returns:
+        List[str]: 생성된 질문 목록
+    """
+    question_chain = _build_question_chain()
 
-    return question_chain.invoke({"content": content})
+    return await question_chain.ainvoke({"content": content}, config={"callbacks": current_callbacks()})
@@ -0,0 +1,178 @@
+"""
+기사 처리 결과 캐시 모듈
+
+같은 기사(정규 URL)의 본문이 바뀌지 않았다면 저장된 최종 상태를
+그대로 돌려주어 모델 호출 없이 결과를 반환합니다. 본문은 content_cleaner로 정리한 뒤 비교하므로
+광고, 관련 기사 목록, 메뉴처럼 기사 외 영역만 바뀐 페이지도 캐시에 적중합니다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .content_cleaner import clean_content
+from .url_canonicalizer import canonicalize_url
+from .utils import load_runtime_config, resolve_project_path
+
+# 캐시에 저장하는 워크플로우 상태 필드
+CACHED_FIELDS = ("extracted_content", "questions", "qa_pairs", "ka_pairs", "final_result")
+
+
+def content_hash(content: str) -> str:
+    """내용의 SHA-256 해시"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def article_hash(crawled_content: str) -> str:
+    """
+    결과 캐시 키로 쓰는 기사 본문 해시
+
+    Args:
+        crawled_content (str): 크롤링한 마크다운
+
+    Returns:
+        str: content_cleaner로 기사 외 내용을 제거한 본문의 SHA-256 해시
+    """
+    cleaned_content, _ = clean_content(crawled_content)
+    return content_hash(cleaned_content)
+
+
+class ResultCache:
+    """
+    SQLite 기반 기사 처리 결과 캐시
+
+    TTL이 지난 항목은 조회 시 무시되고, 저장 시 만료 항목과 최대 개수를 넘는
+    오래 사용되지 않은 항목을 정리합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            ttl_seconds (float, optional): 항목 유효 기간 (초). 없으면 만료되지 않음
+            max_entries (int, optional): 최대 항목 수. 없으면 제한 없음
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                state TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (url, content_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, url: str, crawled_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 최종 상태를 조회합니다.
+
+        Args:
+            url (str): 기사 URL (내부에서 정규 URL로 변환)
+            crawled_hash (str): 기사 본문 해시 (article_hash)
+
+        Returns:
+            Optional[Dict[str, Any]]: CACHED_FIELDS로 구성된 상태, 없거나 만료되면 None
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, created_at FROM results WHERE url = ? AND content_hash = ?",
+                (key, crawled_hash),
+            ).fetchone()
+            if row is None:
+                return None
+            if self._is_expired(row[1], now):
+                self._conn.execute("DELETE FROM results WHERE url = ? AND content_hash = ?", (key, crawled_hash))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE results SET accessed_at = ? WHERE url = ? AND content_hash = ?",
+                (now, key, crawled_hash),
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, url: str, crawled_hash: str, state: Dict[str, Any]):
+        """
+        최종 상태를 저장하고 만료/초과 항목을 정리합니다.
+
+        Args:
+            url (str): 기사 URL (내부에서 정규 URL로 변환)
+            crawled_hash (str): 기사 본문 해시 (article_hash)
+            state (Dict[str, Any]): 워크플로우 상태 (CACHED_FIELDS만 저장)
+        """
+        key = canonicalize_url(url)
+        now = time.time()
+        payload = json.dumps({field: state[field] for field in CACHED_FIELDS}, ensure_ascii=False)
+        with self._lock:
+            # 같은 기사의 이전 내용 결과는 더 이상 쓰이지 않으므로 교체합니다
+            self._conn.execute("DELETE FROM results WHERE url = ?", (key,))
+            self._conn.execute(
+                "INSERT INTO results (url, content_hash, state, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, crawled_hash, payload, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,))
+        if self.max_entries is not None:
+            self._conn.execute(
+                """
+                DELETE FROM results WHERE rowid IN (
+                    SELECT rowid FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    config/runtime_config.yaml의 result_cache 설정으로 만든 프로세스 전역 캐시를 반환합니다.
+
+    Returns:
+        Optional[ResultCache]: 캐시가 비활성화되어 있으면 None
+    """
+    global _result_cache
+    config = load_runtime_config('result_cache')
+    if not config.get('enabled', False):
+        return None
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = ResultCache(
+                    resolve_project_path(config.get('path', 'cache/results.sqlite3')),
+                    ttl_seconds=config.get('ttl_seconds'),
+                    max_entries=config.get('max_entries'),
+                )
+    return _result_cache
@@ -0,0 +1,121 @@
+"""
+구조화된 출력 모듈
+
+프롬프트에 형식 지침을 붙여 자유 텍스트를 파싱하는 대신 모델의 JSON 스키마 출력
+(response_format)을 사용합니다. 스키마 검증에 실패한 응답은 코드 블록, 앞뒤 설명,
+끝의 쉼표 등을 정리하여 로컬에서 한 번 더 검증하고, 그 결과를 추적 구간에
+structured_output_repaired / structured_output_failed로 기록합니다.
+"""
+import json
+import re
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models import BaseChatModel
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel, ValidationError
+
+from .tracing import current_span
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+def repair_json(text: str) -> Optional[Any]:
+    """
+    모델이 반환한 JSON 텍스트를 정리하여 파싱합니다.
+
+    코드 블록 안의 내용, 첫 '{'부터 마지막 '}'까지만 남기고 끝의 쉼표를 제거합니다.
+
+    Args:
+        text (str): 모델 응답 텍스트
+
+    Returns:
+        Optional[Any]: 파싱 결과, 정리해도 JSON이 아니면 None
+    """
+    if not text:
+        return None
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    candidate = _TRAILING_COMMA.sub(r"\1", text[start:end + 1])
+    try:
+        return json.loads(candidate, strict=False)
+    except json.JSONDecodeError:
+        return None
+
+
+def _count(name: str):
+    span = current_span()
+    if span is not None:
+        span.count(name)
+
+
+def parse_structured_text(schema: Type[SchemaT], text: str, parsing_error: Any = None) -> SchemaT:
+    """
+    모델 응답 텍스트를 스키마로 검증합니다. 실패하면 텍스트를 정리하여 한 번 더 검증합니다.
+
+    Args:
+        schema (Type[BaseModel]): 출력 스키마
+        text (str): 모델 응답 텍스트
+        parsing_error (Any, optional): 이미 발생한 파싱 오류 (오류 메시지에 포함)
+
+    Returns:
+        BaseModel: 검증된 schema 인스턴스
+
+    Raises:
+        OutputParserException: 정리해도 스키마에 맞지 않는 경우
+    """
+    if parsing_error is None:
+        try:
+            return schema.model_validate_json(text)
+        except ValidationError as e:
+            parsing_error = e
+
+    data = repair_json(text)
+    if data is not None:
+        try:
+            parsed = schema.model_validate(data)
+        except ValidationError:
+            parsed = None
+        if parsed is not None:
+            _count("structured_output_repaired")
+            return parsed
+
+    _count("structured_output_failed")
+    raise OutputParserException(
+        f"{schema.__name__} 구조화된 출력을 읽을 수 없습니다: {parsing_error}",
+        llm_output=text,
+    )
+
+
+def _resolve(schema: Type[SchemaT], result: Dict[str, Any]) -> SchemaT:
+    """include_raw 결과에서 검증된 객체를 꺼내고, 실패하면 원문을 정리하여 다시 검증합니다."""
+    if result.get("parsed") is not None:
+        return result["parsed"]
+
+    raw = result.get("raw")
+    text = raw.content if isinstance(getattr(raw, "content", None), str) else ""
+    return parse_structured_text(schema, text, result.get("parsing_error") or "parsed=None")
+
+
+def build_structured_chain(prompt: ChatPromptTemplate, llm: BaseChatModel, schema: Type[SchemaT]) -> Runnable:
+    """
+    프롬프트 | JSON 스키마 출력 모델 | 복구 단계로 이어지는 체인을 만듭니다.
+
+    Args:
+        prompt (ChatPromptTemplate): 형식 지침 없이 입력만 채우는 프롬프트
+        llm (BaseChatModel): 모델 클라이언트
+        schema (Type[BaseModel]): 출력 스키마
+
+    Returns:
+        Runnable: schema 인스턴스를 반환하는 체인
+    """
+    structured_llm = llm.with_structured_output(schema, method="json_schema", include_raw=True)
+    return prompt | structured_llm | RunnableLambda(lambda result: _resolve(schema, result))
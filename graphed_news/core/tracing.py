@@ -0,0 +1,235 @@
+"""
+워크플로우 실행 추적 모듈
+
+노드별, 질문/키워드별로 실행 시간, 모델 호출 수, 도구 호출 수, 토큰 사용량을 기록합니다.
+현재 실행 중인 추적 정보는 ContextVar로 전달되므로 각 모듈은 current_callbacks()를
+LLM/그래프 호출 설정에 넘기기만 하면 됩니다.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("graphed_news_trace", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("graphed_news_span", default=None)
+
+
+class Span:
+    """하나의 노드 또는 질문/키워드 처리 구간"""
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"] = None):
+        self.name = name
+        self.kind = kind
+        self.parent = parent
+        self.started_at = time.time()
+        self.wall_time = 0.0
+        self.llm_calls = 0
+        self.tool_calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.scheduler_wait = 0.0
+        self.counters: Dict[str, int] = {}
+        self.error: Optional[str] = None
+        self.handler = SpanCallbackHandler(self)
+        self._lock = threading.Lock()
+
+    def _chain(self) -> Iterator["Span"]:
+        span = self
+        while span is not None:
+            yield span
+            span = span.parent
+
+    def record(self, llm_calls: int = 0, tool_calls: int = 0, input_tokens: int = 0, output_tokens: int = 0, scheduler_wait: float = 0.0):
+        """이 구간과 상위 구간에 사용량을 더합니다."""
+        for span in self._chain():
+            with span._lock:
+                span.llm_calls += llm_calls
+                span.tool_calls += tool_calls
+                span.input_tokens += input_tokens
+                span.output_tokens += output_tokens
+                span.scheduler_wait += scheduler_wait
+
+    def count(self, name: str, amount: int = 1):
+        """이 구간과 상위 구간의 사용자 정의 카운터를 증가시킵니다."""
+        for span in self._chain():
+            with span._lock:
+                span.counters[name] = span.counters.get(name, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "kind": self.kind,
+            "parent": self.parent.name if self.parent else None,
+            "started_at": self.started_at,
+            "wall_time": round(self.wall_time, 4),
+            "llm_calls": self.llm_calls,
+            "tool_calls": self.tool_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.input_tokens + self.output_tokens,
+            "scheduler_wait": round(self.scheduler_wait, 4),
+            "error": self.error,
+        }
+        if self.counters:
+            data["counters"] = dict(self.counters)
+            cache_lookups = self.counters.get("llm_cache_hit", 0) + self.counters.get("llm_cache_miss", 0)
+            if cache_lookups:
+                data["llm_cache_hit_rate"] = round(self.counters.get("llm_cache_hit", 0) / cache_lookups, 4)
+        return data
+
+
+class SpanCallbackHandler(BaseCallbackHandler):
+    """LangChain 콜백으로 모델/도구 호출과 토큰 사용량을 Span에 기록"""
+
+    # 비동기 실행에서도 스레드 풀을 거치지 않고 바로 호출
+    run_inline = True
+
+    def __init__(self, span: Span):
+        self.span = span
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[Any], **kwargs: Any) -> None:
+        self.span.record(llm_calls=1)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any) -> None:
+        self.span.record(llm_calls=1)
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        input_tokens, output_tokens = 0, 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    output_tokens += usage.get("output_tokens", 0)
+        if not (input_tokens or output_tokens):
+            token_usage = (response.llm_output or {}).get("token_usage") or {}
+            input_tokens = token_usage.get("prompt_tokens", 0)
+            output_tokens = token_usage.get("completion_tokens", 0)
+        self.span.record(input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        self.span.record(tool_calls=1)
+
+
+class RunTrace:
+    """기사 한 건의 실행 추적 정보"""
+
+    def __init__(self, url: str):
+        self.run_id = uuid.uuid4().hex
+        self.url = url
+        self.started_at = time.time()
+        self.wall_time = 0.0
+        self.root = Span("workflow", "workflow")
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """구조화된 추적 정보"""
+        root = self.root.to_dict()
+        root["wall_time"] = round(self.wall_time, 4)
+        return {
+            "run_id": self.run_id,
+            "url": self.url,
+            "started_at": self.started_at,
+            "totals": root,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+    def export_jsonl(self, path: str):
+        """구간마다 한 줄씩 JSON Lines 파일에 추가합니다."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = self.to_dict()
+        with open(path, "a", encoding="utf-8") as file:
+            for span in data["spans"]:
+                file.write(json.dumps({"run_id": self.run_id, "url": self.url, **span}, ensure_ascii=False) + "\n")
+            file.write(json.dumps({"run_id": self.run_id, "url": self.url, **data["totals"]}, ensure_ascii=False) + "\n")
+
+
+@contextmanager
+def start_trace(url: str) -> Iterator[RunTrace]:
+    """
+    현재 컨텍스트(태스크)에서 기사 한 건의 추적을 시작합니다.
+
+    Args:
+        url (str): 기사 URL
+
+    Yields:
+        RunTrace: 추적 정보 (종료 시 전체 실행 시간 기록)
+    """
+    trace = RunTrace(url)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    started = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.wall_time = time.perf_counter() - started
+        try:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+        except ValueError:
+            # 비동기 제너레이터가 다른 컨텍스트에서 닫힌 경우
+            _current_span.set(None)
+            _current_trace.set(None)
+
+
+@contextmanager
+def trace_span(name: str, kind: str) -> Iterator[Optional[Span]]:
+    """
+    현재 추적 안에 하위 구간을 만듭니다. 추적 중이 아니면 아무것도 기록하지 않습니다.
+
+    Args:
+        name (str): 구간 이름 (노드명, 질문, 키워드 등)
+        kind (str): 구간 종류 ('node', 'qa', 'ka' 등)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    span = Span(name, kind, parent=_current_span.get())
+    trace.add(span)
+    token = _current_span.set(span)
+    started = time.perf_counter()
+    try:
+        yield span
+    except Exception as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.wall_time = time.perf_counter() - started
+        _current_span.reset(token)
+
+
+def traced_node(name: str, node: Callable) -> Callable:
+    """비동기 노드 함수를 trace_span으로 감쌉니다. (StreamWriter 주입을 위해 시그니처 유지)"""
+
+    @functools.wraps(node)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with trace_span(name, "node"):
+            return await node(*args, **kwargs)
+
+    return wrapper
+
+
+def current_span() -> Optional[Span]:
+    """현재 구간 (추적 중이 아니면 None)"""
+    return _current_span.get()
+
+
+def current_callbacks() -> List[BaseCallbackHandler]:
+    """현재 구간에 기록하는 LangChain 콜백 목록 (추적 중이 아니면 빈 목록)"""
+    span = _current_span.get()
+    return [span.handler] if span is not None else []
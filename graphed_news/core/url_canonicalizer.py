@@ -0,0 +1,115 @@
+"""
+기사 URL 정규화 모듈
+
+같은 기사가 섹션 파라미터, 모바일/PC 경로, 추적용 파라미터 등으로 서로 다른 URL로
+들어오므로 언론사별 규칙으로 하나의 정규 URL로 바꿉니다. 정규 URL은 크롤링,
+캐시, 체크포인트, 진행 중인 요청 병합의 키로 사용됩니다.
+"""
+import re
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 기사 내용과 무관한 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    모든 URL에 공통으로 적용하는 정규화입니다.
+
+    스킴/호스트 소문자화, 프래그먼트와 추적용 파라미터 제거, 쿼리 정렬을 수행합니다.
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_") and key not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+_NAVER_ARTICLE_PATH = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)$")
+_NAVER_READ_PATH = re.compile(r"^/(?:main/)?read\.(?:naver|nhn)$")
+
+
+def _naver_news(host: str, path: str, query: str) -> Optional[str]:
+    """
+    네이버 뉴스 기사 URL을 https://n.news.naver.com/mnews/article/{oid}/{aid}로 통일합니다.
+
+    n.news.naver.com/article, news.naver.com/main/read.naver?oid=&aid=, m.news.naver.com/read.nhn 등을 처리합니다.
+    """
+    if host not in ("n.news.naver.com", "news.naver.com", "m.news.naver.com"):
+        return None
+    match = _NAVER_ARTICLE_PATH.match(path)
+    if match:
+        oid, aid = match.groups()
+    elif _NAVER_READ_PATH.match(path):
+        params = parse_qs(query)
+        if not (params.get("oid") and params.get("aid")):
+            return None
+        oid, aid = params["oid"][0], params["aid"][0]
+    else:
+        return None
+    return f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
+
+
+_DAUM_ARTICLE_PATH = re.compile(r"^/v/(\w+)$")
+
+
+def _daum_news(host: str, path: str, query: str) -> Optional[str]:
+    """다음 뉴스 기사 URL(v.daum.net, m.v.daum.net)을 https://v.daum.net/v/{id}로 통일합니다."""
+    if host not in ("v.daum.net", "m.v.daum.net"):
+        return None
+    match = _DAUM_ARTICLE_PATH.match(path)
+    return f"https://v.daum.net/v/{match.group(1)}" if match else None
+
+
+# 언론사/포털별 규칙 (호스트, 경로, 쿼리를 받아 정규 URL 또는 None 반환)
+PUBLISHER_RULES: List[Callable[[str, str, str], Optional[str]]] = [
+    _naver_news,
+    _daum_news,
+]
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    기사 URL을 정규 URL로 변환합니다.
+
+    공통 정규화 후 언론사별 규칙을 차례로 적용하며, 맞는 규칙이 없으면 공통 정규화 결과를 반환합니다.
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규 URL
+    """
+    normalized = normalize_url(url)
+    parts = urlsplit(normalized)
+    host = (parts.hostname or "").lower()
+    for rule in PUBLISHER_RULES:
+        canonical = rule(host, parts.path, parts.query)
+        if canonical:
+            return canonical
+    return normalized
+
+
+def canonical_groups(urls: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    URL 목록을 정규 URL별로 묶습니다. (입력 순서 유지)
+
+    Args:
+        urls (List[str]): 원본 URL 목록
+
+    Returns:
+        List[Tuple[str, List[str]]]: [(정규 URL, 원본 URL 목록)]
+    """
+    groups = {}
+    for url in urls:
+        groups.setdefault(canonicalize_url(url), []).append(url)
+    return list(groups.items())
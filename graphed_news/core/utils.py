@@ -1,15 +1,102 @@
 """
 유틸리티 함수들
 """
+import asyncio
 import yaml
 import os
-from typing import Dict, Any
+import json
+import threading
+import time
+import weakref
+from typing import Dict, Any, Optional, Tuple, Type
+
+import httpx
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_openai import ChatOpenAI
+
+
+# 설정/프롬프트 파일의 변경 여부(mtime)를 다시 확인하기까지의 최소 간격 (초)
+_STAT_INTERVAL = 2.0
+
+
+class _YamlRegistry:
+    """
+    YAML 파일을 한 번만 파싱해 두는 레지스트리
+    
+    파일별로 파싱 결과와 mtime을 보관하고, _STAT_INTERVAL마다 한 번만 mtime을 확인하여
+    파일이 바뀌었을 때만 다시 파싱합니다. 그 사이의 호출은 파일에 접근하지 않습니다.
+    반환한 값은 공유되므로 호출한 쪽에서 수정하면 안 됩니다.
+    """
+    
+    def __init__(self, stat_interval: float = _STAT_INTERVAL):
+        self.stat_interval = stat_interval
+        self._entries: Dict[str, Tuple[float, float, Any]] = {}  # path -> (mtime, 확인 시각, 데이터)
+        self._lock = threading.Lock()
+    
+    def load(self, path: str) -> Tuple[Any, float]:
+        """
+        파일의 파싱 결과를 반환합니다.
+        
+        Args:
+            path (str): YAML 파일 경로
+            
+        Returns:
+            Tuple[Any, float]: (파싱 결과, 파싱한 파일의 mtime)
+            
+        Raises:
+            FileNotFoundError: 파일을 찾을 수 없는 경우
+        """
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if entry is not None and now - entry[1] < self.stat_interval:
+            return entry[2], entry[0]
+        
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry[1] < self.stat_interval:
+                return entry[2], entry[0]
+            mtime = os.stat(path).st_mtime
+            if entry is not None and entry[0] == mtime:
+                data = entry[2]
+            else:
+                with open(path, 'r', encoding='utf-8') as file:
+                    data = yaml.safe_load(file)
+            self._entries[path] = (mtime, now, data)
+            return data, mtime
+    
+    def clear(self):
+        """모든 항목 삭제 (다음 호출 때 다시 파싱)"""
+        with self._lock:
+            self._entries.clear()
+
+
+_yaml_registry = _YamlRegistry()
+
+
+def _prompt_path(prompt_file_name: str) -> str:
+    # prompts 디렉토리 경로 고정
+    return os.path.join(get_project_dir(), 'prompts', prompt_file_name)
+
+
+def _load_prompt_entry(prompt_file_name: str) -> Tuple[str, float]:
+    prompt_file_path = _prompt_path(prompt_file_name)
+    try:
+        prompt_data, mtime = _yaml_registry.load(prompt_file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML 파일 '{prompt_file_path}'를 찾을 수 없습니다.")
+    
+    # 딕셔너리인 경우 첫 번째 값 반환, 아니면 그대로 반환
+    if isinstance(prompt_data, dict):
+        return list(prompt_data.values())[0], mtime
+    return prompt_data, mtime
 
 
 def load_prompt(prompt_file_name: str) -> str:
     """
     YAML 파일에서 프롬프트를 불러오는 범용 함수입니다.
     
+    파일은 한 번만 파싱하며, 파일이 수정되면 다음 호출 때 다시 읽습니다.
+    
     Args:
         prompt_file_name (str): YAML 파일명 (예: 'news_processor_prompt.yaml')
         
@@ -19,23 +106,55 @@ def load_prompt(prompt_file_name: str) -> str:
     Raises:
         FileNotFoundError: YAML 파일을 찾을 수 없는 경우
     """
-    # prompts 디렉토리 경로 고정
-    current_dir = os.path.dirname(__file__)
-    prompts_dir = os.path.join(os.path.dirname(current_dir), 'prompts')
-    prompt_file_path = os.path.join(prompts_dir, prompt_file_name)
+    return _load_prompt_entry(prompt_file_name)[0]
+
+
+_prompt_templates: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[float, ChatPromptTemplate]] = {}
+
+
+def get_prompt_template(prompt_file_name: str, **partial_variables: str) -> ChatPromptTemplate:
+    """
+    프롬프트 파일로 만든 ChatPromptTemplate을 반환합니다.
     
-    try:
-        with open(prompt_file_path, 'r', encoding='utf-8') as file:
-            prompt_data = yaml.safe_load(file)
-        
-        # 딕셔너리인 경우 첫 번째 값 반환, 아니면 그대로 반환
-        if isinstance(prompt_data, dict):
-            return list(prompt_data.values())[0]
-        else:
-            return prompt_data
+    형식 지침 등 고정된 변수는 미리 채워 둔 템플릿을 재사용하며, 프롬프트 파일이 수정되면 다시 만듭니다.
+    
+    Args:
+        prompt_file_name (str): YAML 파일명 (예: 'news_processor_prompt.yaml')
+        **partial_variables: 미리 채울 변수 (예: format_instructions)
         
+    Returns:
+        ChatPromptTemplate: 컴파일된 프롬프트 템플릿
+    """
+    key = (prompt_file_name, tuple(sorted(partial_variables.items())))
+    prompt_template, mtime = _load_prompt_entry(prompt_file_name)
+    cached = _prompt_templates.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    prompt = ChatPromptTemplate.from_template(prompt_template)
+    if partial_variables:
+        prompt = prompt.partial(**partial_variables)
+    _prompt_templates[key] = (mtime, prompt)
+    return prompt
+
+
+def _load_config_file(file_name: str) -> Dict[str, Any]:
+    """config 디렉토리의 YAML 파일 전체를 불러옵니다. (레지스트리에 캐시)"""
+    config_file_path = os.path.join(get_project_dir(), 'config', file_name)
+    try:
+        return _yaml_registry.load(config_file_path)[0] or {}
     except FileNotFoundError:
-        raise FileNotFoundError(f"YAML 파일 '{prompt_file_path}'를 찾을 수 없습니다.")
+        raise FileNotFoundError(f"config 파일 '{config_file_path}'를 찾을 수 없습니다.")
+
+
+def _load_model_config_file() -> Dict[str, Any]:
+    """
+    config/model_config.yaml 전체를 불러옵니다.
+    
+    Raises:
+        FileNotFoundError: config 파일을 찾을 수 없는 경우
+    """
+    return _load_config_file('model_config.yaml')
 
 
 def load_model_config(module_name: str) -> Dict[str, Any]:
@@ -52,22 +171,185 @@ def load_model_config(module_name: str) -> Dict[str, Any]:
         FileNotFoundError: config 파일을 찾을 수 없는 경우
         KeyError: 지정된 모듈 설정을 찾을 수 없는 경우
     """
-    # config 디렉토리 경로
-    current_dir = os.path.dirname(__file__)
-    config_dir = os.path.join(os.path.dirname(current_dir), 'config')
-    config_file_path = os.path.join(config_dir, 'model_config.yaml')
+    config_data = _load_model_config_file()
     
-    try:
-        with open(config_file_path, 'r', encoding='utf-8') as file:
-            config_data = yaml.safe_load(file)
+    # 모듈별 설정이 있으면 반환, 없으면 기본 설정 반환
+    if module_name in config_data.get('models', {}):
+        return config_data['models'][module_name]
+    elif 'default' in config_data:
+        return config_data['default']
+    else:
+        raise KeyError(f"모듈 '{module_name}' 설정과 기본 설정을 찾을 수 없습니다.")
+
+
+def load_scheduler_config() -> Dict[str, Any]:
+    """
+    config/model_config.yaml에서 호출 한도와 단계별 우선순위 설정을 불러옵니다.
+    
+    Returns:
+        Dict[str, Any]: {"rate_limits": 모델/도구별 한도, "priorities": 모듈별 우선순위}
+    """
+    config_data = _load_model_config_file()
+    
+    return {
+        "rate_limits": config_data.get('rate_limits') or {},
+        "priorities": config_data.get('priorities') or {}
+    }
+
+
+def load_runtime_config(section: str) -> Dict[str, Any]:
+    """
+    config/runtime_config.yaml에서 특정 섹션의 런타임 설정을 불러옵니다.
+    
+    파일은 한 번만 파싱하며, 파일이 수정되면 다음 호출 때 다시 읽습니다.
+    
+    Args:
+        section (str): 섹션명 (예: 'result_cache')
         
-        # 모듈별 설정이 있으면 반환, 없으면 기본 설정 반환
-        if module_name in config_data.get('models', {}):
-            return config_data['models'][module_name]
-        elif 'default' in config_data:
-            return config_data['default']
-        else:
-            raise KeyError(f"모듈 '{module_name}' 설정과 기본 설정을 찾을 수 없습니다.")
-            
-    except FileNotFoundError:
-        raise FileNotFoundError(f"config 파일 '{config_file_path}'를 찾을 수 없습니다.")
\ No newline at end of file
+    Returns:
+        Dict[str, Any]: 설정 딕셔너리 (섹션이 없으면 빈 딕셔너리)
+        
+    Raises:
+        FileNotFoundError: config 파일을 찾을 수 없는 경우
+    """
+    return _load_config_file('runtime_config.yaml').get(section) or {}
+
+
+def get_project_dir() -> str:
+    """graphed_news 프로젝트 디렉토리 경로를 반환합니다."""
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_project_path(path: str) -> str:
+    """
+    설정 파일의 경로를 절대 경로로 변환합니다.
+    
+    Args:
+        path (str): 절대 경로 또는 프로젝트 디렉토리 기준 상대 경로
+        
+    Returns:
+        str: 절대 경로
+    """
+    if os.path.isabs(path):
+        return path
+    return os.path.join(get_project_dir(), path)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 텍스트의 토큰 수를 어림합니다.
+    
+    한글 등 비 ASCII 문자는 문자당 약 1토큰, ASCII 문자는 약 4자당 1토큰으로 계산합니다.
+    
+    Args:
+        text (str): 토큰 수를 어림할 텍스트
+        
+    Returns:
+        int: 어림한 토큰 수
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4
+
+
+class LoopLocalAsyncClient(httpx.AsyncClient):
+    """
+    실행 중인 이벤트 루프마다 별도의 커넥션 풀로 요청을 보내는 비동기 HTTP 클라이언트
+    
+    httpx.AsyncClient의 커넥션은 처음 사용한 이벤트 루프에 묶이므로, core/http_fetcher.py처럼
+    루프별 클라이언트를 만들어 두고 요청을 현재 루프의 클라이언트로 위임합니다.
+    모델 클라이언트는 생성 시점에 이 객체 하나를 받아 두고 어느 루프에서든 사용할 수 있습니다.
+    """
+    
+    def __init__(self, **kwargs: Any):
+        """
+        Args:
+            **kwargs: 루프별 httpx.AsyncClient 생성 인자 (limits, timeout 등)
+        """
+        super().__init__(**kwargs)
+        self._client_options = kwargs
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        self._loop_clients_lock = threading.Lock()
+    
+    def _loop_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._loop_clients_lock:
+            client = self._loop_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(**self._client_options)
+                self._loop_clients[loop] = client
+        return client
+    
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await self._loop_client().send(request, **kwargs)
+    
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 커넥션 풀을 닫습니다. (다른 루프의 풀과 공유 객체는 계속 사용 가능)"""
+        loop = asyncio.get_running_loop()
+        with self._loop_clients_lock:
+            client = self._loop_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_http_clients: Optional[Tuple[httpx.Client, LoopLocalAsyncClient]] = None
+_chat_clients: Dict[Tuple[type, str], ChatOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_shared_http_clients() -> Tuple[httpx.Client, LoopLocalAsyncClient]:
+    """
+    모든 모델 클라이언트가 공유하는 HTTP 클라이언트(동기/비동기)를 반환합니다.
+    
+    config/model_config.yaml의 http_client 설정으로 커넥션 수와 Keep-Alive를 조정합니다.
+    비동기 클라이언트는 이벤트 루프별로 커넥션 풀을 나누므로 백그라운드 루프와
+    호출자의 루프(analyze_articles_async, 배치/대량 처리, 벤치마크)에서 함께 사용할 수 있습니다.
+    
+    Returns:
+        Tuple[httpx.Client, LoopLocalAsyncClient]: Keep-Alive 커넥션 풀을 가진 클라이언트
+    """
+    global _http_clients
+    if _http_clients is None:
+        with _clients_lock:
+            if _http_clients is None:
+                config = _load_model_config_file().get('http_client') or {}
+                limits = httpx.Limits(
+                    max_connections=config.get('max_connections', 100),
+                    max_keepalive_connections=config.get('max_keepalive_connections', 20),
+                    keepalive_expiry=config.get('keepalive_expiry', 30),
+                )
+                timeout = httpx.Timeout(config.get('timeout', 60), connect=config.get('connect_timeout', 10))
+                _http_clients = (
+                    httpx.Client(limits=limits, timeout=timeout),
+                    LoopLocalAsyncClient(limits=limits, timeout=timeout),
+                )
+    return _http_clients
+
+
+def get_chat_client(model_config: Dict[str, Any], client_class: Type[ChatOpenAI] = ChatOpenAI, **kwargs: Any) -> ChatOpenAI:
+    """
+    모델 설정별로 공유되는 ChatOpenAI 클라이언트를 반환합니다.
+    
+    같은 설정(모델 설정과 추가 인자)이면 같은 인스턴스를 돌려주며, 모든 인스턴스는
+    get_shared_http_clients()의 커넥션 풀을 사용하므로 TLS 연결을 재사용합니다.
+    
+    Args:
+        model_config (Dict[str, Any]): load_model_config()로 불러온 모델 설정
+        client_class (Type[ChatOpenAI]): 생성할 클라이언트 클래스 (ChatOpenAI 하위 클래스)
+        **kwargs: 클라이언트 생성 시 추가 인자 (캐시 키에 포함)
+        
+    Returns:
+        ChatOpenAI: 공유 클라이언트
+    """
+    options = {**model_config, **kwargs}
+    key = (client_class, json.dumps(options, sort_keys=True, default=str))
+    client = _chat_clients.get(key)
+    if client is None:
+        http_client, http_async_client = get_shared_http_clients()
+        with _clients_lock:
+            client = _chat_clients.get(key)
+            if client is None:
+                client = client_class(**options, http_client=http_client, http_async_client=http_async_client)
+                _chat_clients[key] = client
+    return client
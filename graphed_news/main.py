@@ -2,22 +2,44 @@
 뉴스 기사 크롤링 및 증강 메인 모듈 - LangGraph 워크플로우 버전
 """
 import asyncio
-from typing import Dict, Any, List, TypedDict
+import atexit
+import contextlib
+import threading
+import uuid
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, TypedDict, Union
 
+from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import StreamWriter
 
-from core.news_crawler import crawl_news
-from core.news_processor import extract_news_content
-from core.news_question_generator import generate_questions
+from core.news_crawler import crawl_many, crawl_news
+from core.crawler_pool import close_crawler_pool, get_crawler_pool
+from core.news_processor import NewsArticle, extract_news_content_async, merge_articles, split_for_extraction
+from core.news_fused_extractor import NewsAnalysis, extract_news_and_questions_async
+from core.news_question_generator import QuestionList, generate_questions_async
 from core.news_qa_agent import NewsQnAAgent
 from core.news_ka_agent import NewsKnAAgent
-from core.news_accumulator import NewsAccumulator
+from core.news_accumulator import FinalReport, NewsAccumulator
+from core.batch_jobs import BatchBackend, BatchJob, build_chat_request, get_batch_backend
+from core.llm_scheduler import get_scheduler
+from core.result_cache import article_hash, get_result_cache
+from core.url_canonicalizer import canonical_groups, canonicalize_url
+from core.checkpoint import close_checkpointer, create_checkpointer, get_answer_store, get_checkpoint_path
+from core.content_cleaner import clean_content, is_truncated
+from core.tracing import RunTrace, current_span, start_trace, traced_node
+from core.http_fetcher import close_http_client
+from core.utils import get_shared_http_clients, load_runtime_config, resolve_project_path
 
 
 class NewsAnalysisState(TypedDict):
     """뉴스 처리 워크플로우 상태"""
     url: str
+    force_refresh: bool
     crawled_content: str
+    truncated: bool
+    content_hash: str
+    cache_hit: bool
     extracted_content: Dict[str, Any]
     questions: List[str]
     qa_pairs: List[Dict[str, str]]
@@ -26,34 +48,110 @@ class NewsAnalysisState(TypedDict):
     
 
 class NewsAnalysisGraph:
-    """LangGraph 기반 뉴스 처리 워크플로우"""
+    """
+    LangGraph 기반 뉴스 처리 워크플로우
+    
+    모든 노드는 비동기 함수이므로 app.ainvoke / app.astream으로 실행합니다.
+    노드가 이벤트 루프를 직접 만들지 않으므로 호출자의 이벤트 루프 하나로
+    여러 기사의 워크플로우를 동시에 실행할 수 있습니다.
+    
+    체크포인트가 활성화되어 있으면 get_app()이 기사(정규화된 URL)별 스레드로
+    상태를 저장하는 그래프를 반환하므로, 실패한 실행은 마지막 완료 노드부터 재개됩니다.
+    
+    fused=True이면 extract_content 노드가 정제/키워드 추출과 질문 생성을 한 번의 모델 호출로
+    처리하고 곧바로 답변/키워드 설명 단계로 넘어갑니다. generate_questions 노드는 남겨 두어
+    기본 구성으로 저장된 체크포인트도 재개할 수 있습니다.
+    """
     
-    def __init__(self):
-        """워크플로우 초기화"""
+    def __init__(self, fused: bool = False):
+        """
+        워크플로우 초기화
+        
+        Args:
+            fused (bool): 정제와 질문 생성을 한 번의 모델 호출로 처리할지 여부
+        """
+        self.fused = fused
         self.qa_agent = NewsQnAAgent()
         self.ka_agent = NewsKnAAgent()
         self.accumulator = NewsAccumulator()
-        self.app = self._build_workflow_graph()
+        self.builder = self._build_workflow_graph()
+        self.app = self.builder.compile()
+        # 체크포인터는 이벤트 루프에 묶이므로 루프별로 컴파일한 그래프를 보관
+        self._checkpointed_apps = weakref.WeakKeyDictionary()
+        self._checkpointed_app_locks = weakref.WeakKeyDictionary()
     
-    def _crawl_news_node(self, state: NewsAnalysisState):
-        """1단계: 뉴스 크롤링 노드"""
-        print(f"🕷️ 뉴스 기사 크롤링: {state['url']}")
+    async def get_app(self):
+        """
+        현재 이벤트 루프에서 실행할 컴파일된 그래프를 반환합니다.
         
-        # 비동기 함수를 동기적으로 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            crawled_content = loop.run_until_complete(crawl_news(state["url"]))
-        finally:
-            loop.close()
+        Returns:
+            CompiledStateGraph: 체크포인트가 활성화되어 있으면 SQLite 체크포인터가 연결된 그래프
+        """
+        checkpoint_path = get_checkpoint_path()
+        if checkpoint_path is None:
+            return self.app
         
-        return {"crawled_content": crawled_content}
+        loop = asyncio.get_running_loop()
+        lock = self._checkpointed_app_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            app = self._checkpointed_apps.get(loop)
+            if app is None:
+                checkpointer = await create_checkpointer(checkpoint_path)
+                app = self.builder.compile(checkpointer=checkpointer)
+                self._checkpointed_apps[loop] = app
+        return app
     
-    def _extract_content_node(self, state: NewsAnalysisState):
-        """2단계: 뉴스 내용 정제 및 키워드 추출 노드"""
+    async def close(self):
+        """현재 이벤트 루프에서 컴파일한 그래프의 체크포인터를 닫습니다. (다음 get_app에서 다시 생성)"""
+        loop = asyncio.get_running_loop()
+        lock = self._checkpointed_app_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            app = self._checkpointed_apps.pop(loop, None)
+            if app is not None:
+                await close_checkpointer(app.checkpointer)
+    
+    async def _crawl_news_node(self, state: NewsAnalysisState):
+        """1단계: 뉴스 크롤링 노드 (배치 처리에서 미리 크롤링한 내용이 있으면 그대로 사용)"""
+        if state.get("crawled_content") is not None:
+            print(f"📥 미리 크롤링된 내용 사용: {state['url']}")
+            crawled_content = state["crawled_content"]
+        else:
+            print(f"🕷️ 뉴스 기사 크롤링: {state['url']}")
+            crawled_content = await crawl_news(state["url"], force_refresh=state.get("force_refresh", False))
+        crawled_hash = article_hash(crawled_content)
+        truncated = is_truncated(crawled_content)
+        
+        # 같은 기사 내용으로 처리한 결과가 있으면 모델 호출 없이 재사용
+        result_cache = get_result_cache()
+        if result_cache and not state.get("force_refresh"):
+            cached_state = result_cache.get(state["url"], crawled_hash)
+            if cached_state:
+                print("♻️ 캐시된 처리 결과 사용")
+                return {"crawled_content": crawled_content, "content_hash": crawled_hash, "truncated": truncated, "cache_hit": True, **cached_state}
+        
+        return {"crawled_content": crawled_content, "content_hash": crawled_hash, "truncated": truncated, "cache_hit": False}
+    
+    async def _extract_content_node(self, state: NewsAnalysisState):
+        """2단계: 뉴스 내용 정제 및 키워드 추출 노드 (대량 처리에서 배치로 추출한 내용이 있으면 그대로 사용)"""
+        if state.get("extracted_content") is not None:
+            print("📥 배치로 추출된 내용 사용")
+            return {}
+        
         print("📝 뉴스 정제 및 주제, 키워드 추출")
         
-        extracted_result = extract_news_content(state["crawled_content"])
+        # 모델 호출 전에 메뉴, 관련 기사, 저작권 문구 등을 규칙 기반으로 제거
+        cleaned_content, cleaning = clean_content(state["crawled_content"])
+        if cleaning.removed_chars:
+            print(f"🧹 기사 외 내용 제거: {cleaning.removed_chars}자, 약 {cleaning.removed_tokens}토큰, {cleaning.removed_lines}줄")
+            span = current_span()
+            if span is not None:
+                span.count("cleaned_chars", cleaning.removed_chars)
+                span.count("cleaned_tokens", cleaning.removed_tokens)
+        
+        if self.fused:
+            extracted_result = await extract_news_and_questions_async(cleaned_content)
+        else:
+            extracted_result = await extract_news_content_async(cleaned_content)
         
         extracted_content = {
             "content": extracted_result.content,
@@ -64,13 +162,18 @@ class NewsAnalysisGraph:
         print(f"📌 주제: {extracted_result.topic}")
         print(f"🔍 키워드: {', '.join(extracted_result.keywords)}")
         
-        return {"extracted_content": extracted_content}
+        # 통합 구성이 아니면 이전 실행의 질문이 남지 않도록 비워 두고 다음 단계에서 생성
+        questions = extracted_result.questions if self.fused else None
+        return {"extracted_content": extracted_content, "questions": questions}
     
-    def _generate_questions_node(self, state: NewsAnalysisState):
-        """3단계: 질문 생성 노드"""
+    async def _generate_questions_node(self, state: NewsAnalysisState):
+        """3단계: 질문 생성 노드 (이미 생성된 질문이 있으면 그대로 사용)"""
+        if state.get("questions") is not None:
+            return {}
+        
         print("❓ 질문 생성")
         
-        question_result = generate_questions(state["extracted_content"]["content"])
+        question_result = await generate_questions_async(state["extracted_content"]["content"])
         questions = question_result.questions if hasattr(question_result, 'questions') else question_result
         
         print(f"📋 생성된 질문 수: {len(questions)}")
@@ -79,108 +182,303 @@ class NewsAnalysisGraph:
         
         return {"questions": questions}
     
-    def _answer_questions_node(self, state: NewsAnalysisState):
+    async def _answer_questions_node(self, state: NewsAnalysisState, writer: StreamWriter):
         """4단계: 질문 답변 노드"""
         print("💬 질문에 대한 답변 생성")
         
-        # 비동기 함수를 동기적으로 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            qa_pairs = loop.run_until_complete(
-                self.qa_agent.process_questions_async(
-                    state["extracted_content"]["content"], 
-                    state["questions"]
-                )
-            )
-        finally:
-            loop.close()
+        # 이전 실행에서 완료된 답변은 재사용하고, 새 답변은 완료되는 즉시 저장
+        article_key = canonicalize_url(state["url"])
+        answer_store = get_answer_store()
+        
+        # 스트리밍 모드에서는 답변이 완료되는 즉시 전달
+        qa_pairs = await self.qa_agent.process_questions_async(
+            state["extracted_content"]["content"], 
+            state["questions"],
+            thread_prefix=f"qa_{uuid.uuid4().hex}",
+            on_result=lambda qa_pair: writer({"type": "qa_pair", "qa_pair": qa_pair}),
+            completed=answer_store.load(article_key, "qa") if answer_store else None,
+            on_answer=(lambda question, answer: answer_store.save(article_key, "qa", question, answer)) if answer_store else None
+        )
         
         print(f"✅ 답변 완료: {len(qa_pairs)}개 질문")
         
         return {"qa_pairs": qa_pairs}
     
-    def _answer_keywords_node(self, state: NewsAnalysisState):
-        """4단계: 질문 답변 노드"""
-        print("💬 질문에 대한 답변 생성")
+    async def _answer_keywords_node(self, state: NewsAnalysisState, writer: StreamWriter):
+        """4단계: 키워드 설명 노드"""
+        print("💬 키워드에 대한 설명 생성")
         
-        # 비동기 함수를 동기적으로 실행
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            ka_pairs = loop.run_until_complete(
-                self.ka_agent.process_keywords_async(
-                    state["extracted_content"]["content"], 
-                    state["extracted_content"]["keywords"]
-                )
-            )
-        finally:
-            loop.close()
+        article_key = canonicalize_url(state["url"])
+        answer_store = get_answer_store()
+        
+        ka_pairs = await self.ka_agent.process_keywords_async(
+            state["extracted_content"]["content"], 
+            state["extracted_content"]["keywords"],
+            thread_prefix=f"ka_{uuid.uuid4().hex}",
+            on_result=lambda ka_pair: writer({"type": "ka_pair", "ka_pair": ka_pair}),
+            completed=answer_store.load(article_key, "ka") if answer_store else None,
+            on_answer=(lambda keyword, answer: answer_store.save(article_key, "ka", keyword, answer)) if answer_store else None
+        )
         
-        print(f"✅ 답변 완료: {len(ka_pairs)}개 질문")
+        print(f"✅ 설명 완료: {len(ka_pairs)}개 키워드")
         
         return {"ka_pairs": ka_pairs}
     
-    def _accumulate_results_node(self, state: NewsAnalysisState):
-        """5단계: 최종 결과 생성 노드"""
-        print("🔄 최종 결과 생성")
-        
-        final_result = self.accumulator.process(
-            state["extracted_content"],
-            state["qa_pairs"],
-            state["ka_pairs"]
-        )
+    async def _accumulate_results_node(self, state: NewsAnalysisState):
+        """5단계: 최종 결과 생성 노드 (대량 처리에서 배치로 생성한 보고서가 있으면 그대로 사용)"""
+        if state.get("final_result") is not None:
+            print("📥 배치로 생성된 최종 결과 사용")
+            final_result = state["final_result"]
+        else:
+            print("🔄 최종 결과 생성")
+            
+            final_result = await self.accumulator.process_async(
+                state["extracted_content"],
+                state["qa_pairs"],
+                state["ka_pairs"]
+            )
+            
+            print("✨ 최종 결과 생성 완료")
         
-        print("✨ 최종 결과 생성 완료")
+        result_cache = get_result_cache()
+        if result_cache:
+            result_cache.put(state["url"], state["content_hash"], {**state, "final_result": final_result})
         
         return {"final_result": final_result}
     
+    def _route_after_crawl(self, state: NewsAnalysisState):
+        """캐시 적중 시 나머지 단계를 건너뜀"""
+        return END if state.get("cache_hit") else "extract_content"
+    
     def _build_workflow_graph(self):
         """워크플로우 그래프 구축"""
         workflow_builder = StateGraph(NewsAnalysisState)
         
-        # 노드 추가
-        workflow_builder.add_node("crawl_news", self._crawl_news_node)
-        workflow_builder.add_node("extract_content", self._extract_content_node)
-        workflow_builder.add_node("generate_questions", self._generate_questions_node)
-        workflow_builder.add_node("answer_questions", self._answer_questions_node)
-        workflow_builder.add_node("answer_keywords", self._answer_keywords_node)
-        workflow_builder.add_node("accumulate_results", self._accumulate_results_node)
+        # 노드 추가 (노드별 실행 시간과 모델/도구 호출을 추적)
+        workflow_builder.add_node("crawl_news", traced_node("crawl_news", self._crawl_news_node))
+        workflow_builder.add_node("extract_content", traced_node("extract_content", self._extract_content_node))
+        workflow_builder.add_node("generate_questions", traced_node("generate_questions", self._generate_questions_node))
+        workflow_builder.add_node("answer_questions", traced_node("answer_questions", self._answer_questions_node))
+        workflow_builder.add_node("answer_keywords", traced_node("answer_keywords", self._answer_keywords_node))
+        workflow_builder.add_node("accumulate_results", traced_node("accumulate_results", self._accumulate_results_node))
         
         # 엣지 연결 (순차적 실행)
         workflow_builder.add_edge(START, "crawl_news")
-        workflow_builder.add_edge("crawl_news", "extract_content")
-        workflow_builder.add_edge("extract_content", "generate_questions")
+        workflow_builder.add_conditional_edges("crawl_news", self._route_after_crawl, ["extract_content", END])
+        if self.fused:
+            # 질문이 정제 단계에서 생성되므로 답변 단계를 키워드 설명과 같은 단계에서 시작
+            workflow_builder.add_edge("extract_content", "answer_questions")
+        else:
+            workflow_builder.add_edge("extract_content", "generate_questions")
         workflow_builder.add_edge("extract_content", "answer_keywords")
         workflow_builder.add_edge("generate_questions", "answer_questions")
         workflow_builder.add_edge(["answer_questions", "answer_keywords"], "accumulate_results")  
         workflow_builder.add_edge("accumulate_results", END)
         
-        return workflow_builder.compile()
+        return workflow_builder
 
 
-def analyze_articles(url: str):
+# 프로세스 전역 워크플로우와 동기 호출용 이벤트 루프
+_workflow: Optional[NewsAnalysisGraph] = None
+_workflow_lock = threading.Lock()
+_runner_loop: Optional[asyncio.AbstractEventLoop] = None
+_runner_lock = threading.Lock()
+
+
+def get_workflow() -> NewsAnalysisGraph:
     """
-    뉴스 기사 URL을 처리하여 증강된 결과를 반환합니다.
+    프로세스 전역에서 공유하는 워크플로우 인스턴스를 반환합니다.
+    
+    LLM 클라이언트, ReAct 에이전트 그래프, Accumulator, 컴파일된 StateGraph는
+    처음 호출될 때 한 번만 생성되며 이후 모든 기사 처리에서 재사용됩니다.
+    runtime_config.yaml의 workflow.fused가 켜져 있으면 정제/질문 생성 통합 구성을 사용합니다.
+    여러 스레드에서 동시에 호출해도 안전합니다.
     
-    Args:
-        url (str): 처리할 뉴스 기사 URL
-        
     Returns:
-        Dict[str, Any]: 처리 결과
+        NewsAnalysisGraph: 공유 워크플로우 인스턴스
     """
-    workflow = NewsAnalysisGraph()
+    global _workflow
+    if _workflow is None:
+        with _workflow_lock:
+            if _workflow is None:
+                _workflow = NewsAnalysisGraph(fused=load_runtime_config('workflow').get('fused', False))
+    return _workflow
 
-    print("🚀 뉴스 처리 워크플로우 시작")
-    print("=" * 50)
 
-    initial_state = {"url": url}
-    final_state = workflow.app.invoke(initial_state)
+def _get_runner_loop() -> asyncio.AbstractEventLoop:
+    """동기 호출자가 공유하는 백그라운드 이벤트 루프를 반환합니다."""
+    global _runner_loop
+    if _runner_loop is None:
+        with _runner_lock:
+            if _runner_loop is None:
+                loop = asyncio.new_event_loop()
 
-    print("=" * 50)
-    print("🎉 워크플로우 완료")
+                def start_loop(loop):
+                    asyncio.set_event_loop(loop)
+                    loop.run_forever()
+
+                # 백그라운드 스레드에서 이벤트 루프 실행
+                threading.Thread(target=start_loop, args=(loop,), daemon=True, name="news-workflow-loop").start()
+                _runner_loop = loop
+    return _runner_loop
+
+
+def warm_up() -> NewsAnalysisGraph:
+    """
+    프로세스 시작 시 공유 워크플로우와 백그라운드 이벤트 루프를 미리 준비합니다.
+    
+    CLI, post_reports.py, 서버 등 진입점에서 한 번 호출하면
+    첫 요청부터 기사당 오버헤드가 모델 호출만 남습니다.
+    
+    runtime_config.yaml의 crawler_pool.warm_up이 켜져 있으면 크롤러 브라우저도 미리 시작합니다.
+    
+    Returns:
+        NewsAnalysisGraph: 공유 워크플로우 인스턴스
+    """
+    loop = _get_runner_loop()
+    if load_runtime_config('crawler_pool').get('warm_up', False):
+        asyncio.run_coroutine_threadsafe(_warm_up_crawlers(), loop).result()
+    return get_workflow()
+
+
+async def _warm_up_crawlers():
+    await get_crawler_pool().warm_up()
+
+
+async def close_loop_resources(workflow: Optional[NewsAnalysisGraph] = None):
+    """
+    현재 이벤트 루프에 묶인 자원(체크포인터, 크롤러 풀, HTTP 커넥션 풀)을 닫습니다.
+    
+    asyncio.run 등 호출자의 루프에서 analyze_articles_async를 직접 실행했다면 루프가 끝나기 전에 호출합니다.
+    
+    Args:
+        workflow (NewsAnalysisGraph, optional): 공유 워크플로우 외에 함께 정리할 워크플로우
+    """
+    for graph in {id(graph): graph for graph in (workflow, _workflow) if graph is not None}.values():
+        await graph.close()
+    await close_crawler_pool()
+    await close_http_client()
+    await get_shared_http_clients()[1].aclose()
+
+
+# 배치/대량 처리가 진행 중인 호출자 루프별 실행 수
+_loop_users: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+
+@contextlib.asynccontextmanager
+async def _closing_loop_resources(workflow: NewsAnalysisGraph):
+    """
+    호출자의 루프(asyncio.run 등)에서 실행한 배치/대량 처리가 모두 끝나면 그 루프의 자원을 닫습니다.
+    
+    백그라운드 루프의 자원은 이후 요청에서 계속 사용하므로 닫지 않습니다.
+    """
+    loop = asyncio.get_running_loop()
+    if loop is _runner_loop:
+        yield
+        return
+    _loop_users[loop] = _loop_users.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _loop_users[loop] -= 1
+        if not _loop_users[loop]:
+            del _loop_users[loop]
+            await close_loop_resources(workflow)
+
+
+def shutdown():
+    """
+    백그라운드 이벤트 루프의 자원을 닫고 루프를 멈춥니다.
     
-    # 최종 결과 정리
+    프로세스 종료 시 자동으로 호출되며, 이후 동기 호출이 들어오면 새 루프를 시작합니다.
+    """
+    global _runner_loop
+    with _runner_lock:
+        loop, _runner_loop = _runner_loop, None
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_loop_resources(), loop).result(timeout=30)
+    except Exception as e:
+        print(f"⚠️ 백그라운드 루프 자원 정리 중 오류: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+
+# 체크포인터 연결 스레드가 종료를 막지 않도록 비데몬 스레드를 기다리기 전에 정리 (Python 3.9+)
+getattr(threading, "_register_atexit", atexit.register)(shutdown)
+
+
+def _initial_state(
+    url: str,
+    force_refresh: bool,
+    crawled_content: Optional[str],
+    prefilled: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    워크플로우 입력 상태
+    
+    미리 채운 값(크롤링 내용, 배치로 추출한 내용/질문/최종 결과)이 있는 단계는 모델을 호출하지 않습니다.
+    같은 스레드에 이전 실행의 값이 남아 있어도 재사용되지 않도록 나머지는 None으로 초기화합니다.
+    """
+    initial_state = {
+        "url": url,
+        "force_refresh": force_refresh,
+        "crawled_content": crawled_content,
+        "extracted_content": None,
+        "questions": None,
+        "final_result": None,
+    }
+    initial_state.update(prefilled or {})
+    return initial_state
+
+
+def _run_config(url: str) -> Dict[str, Any]:
+    """기사별 체크포인트 스레드 설정"""
+    return {"configurable": {"thread_id": canonicalize_url(url)}}
+
+
+async def _prepare_run(app, url: str, initial_state: Dict[str, Any]):
+    """
+    이전에 실패한 실행이 있으면 재개, 없으면 새로 시작할 입력을 결정합니다.
+    
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Dict[str, Any]]: (그래프 입력, 지금까지의 상태)
+    """
+    if app.checkpointer is None:
+        return initial_state, dict(initial_state)
+    
+    if not initial_state.get("force_refresh"):
+        snapshot = await app.aget_state(_run_config(url))
+        if snapshot.next:
+            print(f"⏯️ 이전 실행 재개: {', '.join(snapshot.next)}")
+            return None, dict(snapshot.values)
+    
+    # 새로 시작하는 실행(force_refresh 포함)은 이전 실행에서 저장된 답변을 재사용하지 않음
+    answer_store = get_answer_store()
+    if answer_store:
+        answer_store.clear(canonicalize_url(url))
+    return initial_state, dict(initial_state)
+
+
+async def _finish_run(app, url: str):
+    """성공한 실행의 체크포인트와 저장된 개별 답변을 정리합니다."""
+    if app.checkpointer is None:
+        return
+    await app.checkpointer.adelete_thread(canonicalize_url(url))
+    answer_store = get_answer_store()
+    if answer_store:
+        answer_store.clear(canonicalize_url(url))
+
+
+def _export_trace(trace: RunTrace):
+    """runtime_config.yaml의 tracing.export_path가 설정되어 있으면 추적 정보를 JSON Lines로 저장"""
+    export_path = load_runtime_config('tracing').get('export_path')
+    if export_path:
+        trace.export_jsonl(resolve_project_path(export_path))
+
+
+def _build_results(url: str, final_state: Dict[str, Any], trace: Optional[RunTrace] = None) -> Dict[str, Any]:
+    """워크플로우 최종 상태를 결과 딕셔너리로 정리"""
     return {
         "url": url,
         "original_content": final_state["crawled_content"],
@@ -188,10 +486,655 @@ def analyze_articles(url: str):
         "questions": final_state["questions"],
         "qa_pairs": final_state["qa_pairs"],
         "ka_pairs": final_state["ka_pairs"],
-        "final_result": final_state["final_result"]
+        "final_result": final_state["final_result"],
+        "cache_hit": final_state.get("cache_hit", False),
+        "truncated": final_state.get("truncated", False),
+        "trace": trace.to_dict() if trace else None
     }
 
 
+async def analyze_articles_async(
+    url: str,
+    workflow: Optional[NewsAnalysisGraph] = None,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    force_refresh: bool = False,
+    crawled_content: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    뉴스 기사 URL을 처리하여 증강된 결과를 반환합니다. (비동기)
+    
+    호출자의 이벤트 루프에서 실행되므로 asyncio.gather 등으로
+    여러 기사를 하나의 루프에서 동시에 처리할 수 있습니다.
+    URL은 정규 URL로 바꿔 처리하며, 같은 정규 URL의 요청이 동시에 들어오면 스트리밍 여부와
+    관계없이 하나의 실행을 공유하여 같은 결과를 받습니다. (결과의 url은 요청한 URL)
+    force_refresh 요청은 진행 중인 일반 실행이 끝난 뒤 새로 처리합니다.
+    
+    Args:
+        url (str): 처리할 뉴스 기사 URL
+        workflow (NewsAnalysisGraph, optional): 사용할 워크플로우. 없으면 공유 워크플로우 사용
+        on_event (Callable, optional): 주어지면 스트리밍 모드로 실행하며 각 진행 이벤트마다 호출
+        force_refresh (bool): True이면 결과 캐시를 무시하고 다시 처리
+        crawled_content (str, optional): 미리 크롤링한 마크다운. 주어지면 크롤링하지 않음
+        
+    Returns:
+        Dict[str, Any]: 처리 결과
+    """
+    if on_event:
+        results = None
+        async for event in analyze_articles_stream(url, workflow, force_refresh=force_refresh, crawled_content=crawled_content):
+            on_event(event)
+            if event["type"] == "completed":
+                results = event["results"]
+        return results
+
+    workflow = workflow or get_workflow()
+    canonical_url = canonicalize_url(url)
+
+    # 같은 정규 URL을 동시에 요청하면 진행 중인 실행(스트리밍 실행 포함) 하나를 함께 기다림
+    run = _join_run(
+        canonical_url, force_refresh,
+        lambda run: _run_workflow(canonical_url, workflow, force_refresh, crawled_content),
+    )
+    run.waiters += 1
+    try:
+        results = await asyncio.shield(run.task)
+    finally:
+        run.release()
+    return {**results, "url": url}
+
+
+class _InFlightRun:
+    """
+    정규 URL별로 진행 중인 워크플로우 실행과 이를 기다리는 호출자 수
+    
+    스트리밍 실행은 지금까지의 이벤트를 보관하고 구독자마다 큐로 나누어 주므로,
+    나중에 합류한 스트리밍 호출자도 처음부터 같은 이벤트를 받습니다.
+    """
+
+    def __init__(self, streaming: bool = False, force_refresh: bool = False):
+        self.task: Optional[asyncio.Future] = None
+        self.waiters = 0
+        self.streaming = streaming
+        self.force_refresh = force_refresh
+        self.events: List[Dict[str, Any]] = []
+        self.finished = False
+        self._subscribers: List[asyncio.Queue] = []
+
+    def publish(self, event: Dict[str, Any]):
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def finish(self):
+        """구독자에게 이벤트가 끝났음을 알립니다. (None)"""
+        self.finished = True
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+        self._subscribers.clear()
+
+    def subscribe(self) -> "asyncio.Queue[Optional[Dict[str, Any]]]":
+        """지금까지의 이벤트가 미리 들어 있는 구독 큐를 반환합니다."""
+        queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        for event in self.events:
+            queue.put_nowait(event)
+        if self.finished:
+            queue.put_nowait(None)
+        else:
+            self._subscribers.append(queue)
+        return queue
+
+    def release(self):
+        """호출자 하나가 빠집니다. 기다리는 호출자가 모두 취소되면 실행도 취소합니다."""
+        self.waiters -= 1
+        if self.waiters == 0 and not self.task.done():
+            self.task.cancel()
+
+
+_inflight_runs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _InFlightRun]]" = weakref.WeakKeyDictionary()
+
+
+def _join_run(
+    canonical_url: str,
+    force_refresh: bool,
+    start: Callable[[_InFlightRun], Awaitable[Dict[str, Any]]],
+    streaming: bool = False,
+) -> _InFlightRun:
+    """
+    같은 정규 URL의 진행 중인 실행을 반환하고, 없으면 start로 새 실행을 시작합니다.
+    
+    체크포인트 스레드(정규 URL)를 하나의 실행만 사용하도록 워크플로우, 스트리밍 여부와 관계없이
+    정규 URL 하나에 실행 하나만 둡니다. force_refresh 요청은 진행 중인 일반 실행의 결과를 받지 않고,
+    그 실행이 끝나기를 기다린 뒤 새 실행을 시작합니다. (이후 합류하는 호출자는 새 실행을 공유)
+    """
+    inflight = _inflight_runs.setdefault(asyncio.get_running_loop(), {})
+    previous = inflight.get(canonical_url)
+    if previous is not None and (previous.force_refresh or not force_refresh):
+        print(f"🔗 진행 중인 같은 기사 처리에 합류: {canonical_url}")
+        return previous
+
+    run = _InFlightRun(streaming, force_refresh)
+
+    async def start_after_previous():
+        if previous is not None:
+            print(f"⏳ 진행 중인 같은 기사 처리가 끝난 뒤 다시 처리: {canonical_url}")
+            await asyncio.wait([previous.task])
+        return await start(run)
+
+    run.task = asyncio.ensure_future(start_after_previous())
+    inflight[canonical_url] = run
+
+    def remove(_):
+        if inflight.get(canonical_url) is run:
+            del inflight[canonical_url]
+
+    run.task.add_done_callback(remove)
+    return run
+
+
+async def _run_workflow(
+    canonical_url: str,
+    workflow: NewsAnalysisGraph,
+    force_refresh: bool,
+    crawled_content: Optional[str],
+) -> Dict[str, Any]:
+    """정규 URL 하나에 대해 워크플로우를 끝까지 실행하고 결과를 정리합니다."""
+    print("🚀 뉴스 처리 워크플로우 시작")
+    print("=" * 50)
+
+    app = await workflow.get_app()
+    initial_state = _initial_state(canonical_url, force_refresh, crawled_content)
+    with start_trace(canonical_url) as trace:
+        run_input, _ = await _prepare_run(app, canonical_url, initial_state)
+        final_state = await app.ainvoke(run_input, _run_config(canonical_url))
+        await _finish_run(app, canonical_url)
+    _export_trace(trace)
+
+    print("=" * 50)
+    print("🎉 워크플로우 완료")
+    
+    # 최종 결과 정리 (노드/질문/키워드별 추적 정보 포함)
+    return _build_results(canonical_url, final_state, trace)
+
+
+def _state_events(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    이미 완료된 상태(캐시 적중, 재개된 실행)를 스트리밍 이벤트 목록으로 변환
+    """
+    events = []
+    if state.get("extracted_content"):
+        events.append({
+            "type": "extracted",
+            "topic": state["extracted_content"]["topic"],
+            "keywords": state["extracted_content"]["keywords"]
+        })
+    if state.get("questions"):
+        events.append({"type": "questions", "questions": state["questions"]})
+    events.extend({"type": "qa_pair", "qa_pair": qa_pair} for qa_pair in state.get("qa_pairs") or [])
+    events.extend({"type": "ka_pair", "ka_pair": ka_pair} for ka_pair in state.get("ka_pairs") or [])
+    if state.get("final_result"):
+        events.append({"type": "final_result", "final_result": state["final_result"]})
+    return events
+
+
+async def _stream_workflow(
+    canonical_url: str,
+    workflow: NewsAnalysisGraph,
+    force_refresh: bool,
+    crawled_content: Optional[str],
+) -> AsyncIterator[Dict[str, Any]]:
+    """정규 URL 하나에 대해 워크플로우를 스트리밍으로 실행하며 진행 이벤트를 내보냅니다."""
+    print("🚀 뉴스 처리 워크플로우 시작 (스트리밍)")
+    print("=" * 50)
+
+    app = await workflow.get_app()
+    initial_state = _initial_state(canonical_url, force_refresh, crawled_content)
+    with start_trace(canonical_url) as trace:
+        run_input, final_state = await _prepare_run(app, canonical_url, initial_state)
+        if run_input is None:
+            # 재개된 실행은 이미 완료된 단계의 결과부터 전달
+            for event in _state_events(final_state):
+                yield event
+        
+        async for mode, chunk in app.astream(run_input, _run_config(canonical_url), stream_mode=["updates", "custom"]):
+            if mode == "custom":
+                yield chunk
+                continue
+        
+            for node_name, update in chunk.items():
+                if not update:
+                    continue
+                final_state.update(update)
+            
+                if node_name == "crawl_news" and update.get("cache_hit"):
+                    for event in _state_events(update):
+                        yield event
+                elif node_name == "extract_content":
+                    yield {
+                        "type": "extracted",
+                        "topic": update["extracted_content"]["topic"],
+                        "keywords": update["extracted_content"]["keywords"]
+                    }
+                    # 통합 구성에서는 질문도 이 단계에서 생성됨
+                    if update.get("questions"):
+                        yield {"type": "questions", "questions": update["questions"]}
+                elif node_name == "generate_questions":
+                    yield {"type": "questions", "questions": update["questions"]}
+                elif node_name == "accumulate_results":
+                    yield {"type": "final_result", "final_result": update["final_result"]}
+
+        await _finish_run(app, canonical_url)
+    _export_trace(trace)
+
+    print("=" * 50)
+    print("🎉 워크플로우 완료")
+
+    yield {"type": "completed", "results": _build_results(canonical_url, final_state, trace)}
+
+
+async def _run_streaming(
+    run: _InFlightRun,
+    canonical_url: str,
+    workflow: NewsAnalysisGraph,
+    force_refresh: bool,
+    crawled_content: Optional[str],
+) -> Dict[str, Any]:
+    """공유 스트리밍 실행: 이벤트를 구독자에게 나누어 주고 최종 결과를 반환합니다."""
+    results = None
+    try:
+        async for event in _stream_workflow(canonical_url, workflow, force_refresh, crawled_content):
+            run.publish(event)
+            if event["type"] == "completed":
+                results = event["results"]
+    finally:
+        run.finish()
+    return results
+
+
+async def analyze_articles_stream(
+    url: str,
+    workflow: Optional[NewsAnalysisGraph] = None,
+    force_refresh: bool = False,
+    crawled_content: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    뉴스 기사를 처리하면서 중간 결과를 이벤트로 즉시 전달합니다.
+    
+    LangGraph의 astream(updates, custom 모드)을 사용하며 다음 순서로 이벤트를 내보냅니다.
+    - {"type": "extracted", "topic", "keywords"}: 내용 정제 직후
+    - {"type": "questions", "questions"}: 질문 생성 직후
+    - {"type": "qa_pair", "qa_pair"} / {"type": "ka_pair", "ka_pair"}: 각 답변이 완료될 때마다
+    - {"type": "final_result", "final_result"}: 최종 보고서 생성 직후
+    - {"type": "completed", "results"}: analyze_articles와 같은 형태의 전체 결과
+    결과 캐시에 적중하거나 실패한 실행을 재개하면 이미 완료된 결과의 이벤트를 먼저 한 번에 내보냅니다.
+    
+    같은 정규 URL의 스트리밍 요청이 동시에 들어오면 하나의 실행을 공유하며, 나중에 합류한 호출자는
+    지금까지의 이벤트를 먼저 받고 이후 이벤트를 함께 받습니다. 진행 중인 일반(analyze_articles_async)
+    실행에 합류하면 실행이 끝난 뒤 완료된 결과의 이벤트를 한 번에 받습니다.
+    
+    Args:
+        url (str): 처리할 뉴스 기사 URL
+        workflow (NewsAnalysisGraph, optional): 사용할 워크플로우. 없으면 공유 워크플로우 사용
+        force_refresh (bool): True이면 결과 캐시를 무시하고 다시 처리
+        crawled_content (str, optional): 미리 크롤링한 마크다운. 주어지면 크롤링하지 않음
+        
+    Yields:
+        Dict[str, Any]: 진행 이벤트
+    """
+    workflow = workflow or get_workflow()
+    # 같은 기사의 다른 URL 변형도 하나의 크롤링/캐시/체크포인트를 사용하도록 정규 URL로 처리
+    canonical_url = canonicalize_url(url)
+    run = _join_run(
+        canonical_url, force_refresh,
+        lambda run: _run_streaming(run, canonical_url, workflow, force_refresh, crawled_content),
+        streaming=True,
+    )
+    run.waiters += 1
+    try:
+        if run.streaming:
+            queue = run.subscribe()
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                if event["type"] == "completed":
+                    event = {"type": "completed", "results": {**event["results"], "url": url}}
+                yield event
+            # 실행이 실패한 경우 예외 전달
+            await asyncio.shield(run.task)
+        else:
+            results = await asyncio.shield(run.task)
+            for event in _state_events(results):
+                yield event
+            yield {"type": "completed", "results": {**results, "url": url}}
+    finally:
+        run.release()
+
+
+def analyze_articles(
+    url: str,
+    on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    force_refresh: bool = False,
+):
+    """
+    뉴스 기사 URL을 처리하여 증강된 결과를 반환합니다.
+    
+    공유 워크플로우의 클라이언트가 항상 같은 이벤트 루프에서 사용되도록
+    백그라운드 루프에서 실행하므로 여러 스레드에서 동시에 호출할 수 있습니다.
+    
+    Args:
+        url (str): 처리할 뉴스 기사 URL
+        on_event (Callable, optional): 진행 이벤트 콜백 (analyze_articles_stream 참고).
+            백그라운드 루프 스레드에서 호출됩니다.
+        force_refresh (bool): True이면 결과 캐시를 무시하고 다시 처리
+        
+    Returns:
+        Dict[str, Any]: 처리 결과
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        analyze_articles_async(url, on_event=on_event, force_refresh=force_refresh),
+        _get_runner_loop()
+    )
+    return future.result()
+
+
+async def analyze_articles_batch(
+    urls: Iterable[str],
+    max_concurrency: int = 4,
+    workflow: Optional[NewsAnalysisGraph] = None,
+    on_progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+    force_refresh: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    여러 뉴스 기사 URL을 하나의 컴파일된 워크플로우로 동시에 처리합니다.
+    
+    기사별 결과는 처리가 끝나는 순서대로 즉시 반환되며, 한 기사의 오류는
+    해당 항목의 error에만 기록되고 나머지 배치는 계속 진행됩니다.
+    크롤링은 crawl_many로 앞서 진행되므로 느린 페이지를 기다리는 동안에도
+    먼저 크롤링된 기사의 모델 단계가 시작됩니다.
+    asyncio.run 등 호출자의 루프에서 실행하면 끝난 뒤 그 루프의 체크포인터, 크롤러 풀, HTTP 커넥션 풀을 닫습니다.
+    
+    Args:
+        urls (Iterable[str]): 처리할 뉴스 기사 URL 목록
+        max_concurrency (int): 모델 단계를 동시에 처리할 최대 기사 수
+        workflow (NewsAnalysisGraph, optional): 사용할 워크플로우. 없으면 공유 워크플로우 사용
+        on_progress (Callable, optional): (완료 수, 전체 수, 항목)을 받는 진행 상황 콜백
+        force_refresh (bool): True이면 크롤링/결과 캐시를 무시하고 다시 처리
+        
+    Yields:
+        Dict[str, Any]: {"url": URL, "result": 처리 결과 또는 None, "error": 오류 메시지 또는 None}
+    """
+    urls = list(urls)
+    total = len(urls)
+    if not total:
+        return
+
+    workflow = workflow or get_workflow()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    finished: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+    analyses: List[asyncio.Future] = []
+
+    def error_item(url: str, error: Exception) -> Dict[str, Any]:
+        return {"url": url, "result": None, "error": f"{type(error).__name__}: {error}"}
+
+    async def analyze_single_article(url: str, crawled_content: str):
+        async with semaphore:
+            try:
+                result = await analyze_articles_async(url, workflow, force_refresh=force_refresh, crawled_content=crawled_content)
+                item = {"url": url, "result": result, "error": None}
+            except Exception as e:
+                item = error_item(url, e)
+        finished.put_nowait(item)
+
+    async def prefetch():
+        # 같은 기사의 URL 변형은 한 번만 크롤링하고, 분석은 analyze_articles_async에서 병합됨
+        groups = dict(canonical_groups(urls))
+        try:
+            # main.crawl_news를 넘겨 크롤링 함수를 교체한 환경(벤치마크 등)에서도 같은 경로를 사용
+            async for canonical_url, page in crawl_many(list(groups), force_refresh=force_refresh, crawl=crawl_news):
+                for url in groups.pop(canonical_url):
+                    if isinstance(page, Exception):
+                        finished.put_nowait(error_item(url, page))
+                    else:
+                        analyses.append(asyncio.ensure_future(analyze_single_article(url, page)))
+        except Exception as e:
+            for pending in groups.values():
+                for url in pending:
+                    finished.put_nowait(error_item(url, e))
+
+    producer = asyncio.ensure_future(prefetch())
+    failed = 0
+    async with _closing_loop_resources(workflow):
+        try:
+            for completed in range(1, total + 1):
+                item = await finished.get()
+                if item["error"]:
+                    failed += 1
+                    print(f"📦 [{completed}/{total}] ❌ {item['url']}: {item['error']}")
+                else:
+                    print(f"📦 [{completed}/{total}] ✅ {item['url']}")
+                print(f"   진행: 성공 {completed - failed}개, 실패 {failed}개, 남은 기사 {total - completed}개")
+                queue_depths = {key: m["queue_depth"] for key, m in get_scheduler().metrics().items() if m["queue_depth"]}
+                if queue_depths:
+                    print(f"   스케줄러 대기열: {queue_depths}")
+            
+                if on_progress:
+                    on_progress(completed, total, item)
+                yield item
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 작업 정리
+            producer.cancel()
+            for task in analyses:
+                task.cancel()
+            # 루프 자원을 닫기 전에 취소한 작업이 정리되기를 기다림
+            await asyncio.gather(producer, *analyses, return_exceptions=True)
+
+
+async def analyze_articles_bulk(
+    urls: Iterable[str],
+    backend: Optional[BatchBackend] = None,
+    job_dir: Optional[str] = None,
+    max_concurrency: int = 4,
+    workflow: Optional[NewsAnalysisGraph] = None,
+    force_refresh: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    대량 백필용 오프라인 처리: 에이전트가 필요 없는 모델 단계를 배치 작업 파일로 처리합니다.
+    
+    정제/키워드 추출(통합 구성이면 질문 포함), 질문 생성, 최종 보고서 요청을 단계별 JSONL 파일로 모아
+    배치 백엔드에 제출하고 결과를 기다립니다. 도구를 사용하는 답변/키워드 설명 에이전트는
+    대화형으로 실행하되, 그래프를 최종 보고서 단계 직전에서 멈춰 두었다가 배치 결과를 상태에 넣고 재개합니다.
+    단계별 제출 상태는 작업 디렉토리의 manifest.json에 기록되므로, 중단된 작업을 같은 URL 목록과
+    작업 디렉토리로 다시 실행하면 제출한 배치를 다시 보내지 않고 이어서 처리합니다.
+    asyncio.run 등 호출자의 루프에서 실행하면 끝난 뒤 그 루프의 체크포인터, 크롤러 풀, HTTP 커넥션 풀을 닫습니다.
+    
+    Args:
+        urls (Iterable[str]): 처리할 뉴스 기사 URL 목록
+        backend (BatchBackend, optional): 배치 백엔드. 없으면 runtime_config.yaml의 bulk 설정 사용
+        job_dir (str, optional): 작업 디렉토리. 없으면 runtime_config.yaml의 bulk.job_dir
+        max_concurrency (int): 에이전트 단계를 동시에 처리할 최대 기사 수
+        workflow (NewsAnalysisGraph, optional): 사용할 워크플로우. 없으면 공유 워크플로우 사용
+        force_refresh (bool): True이면 크롤링/결과 캐시와 멈춰 둔 이전 실행을 무시하고 다시 처리
+        
+    Returns:
+        List[Dict[str, Any]]: 입력 순서대로 {"url": URL, "result": 처리 결과 또는 None, "error": 오류 메시지 또는 None}
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+
+    workflow = workflow or get_workflow()
+    async with _closing_loop_resources(workflow):
+        return await _analyze_articles_bulk(urls, backend, job_dir, max_concurrency, workflow, force_refresh)
+
+
+async def _analyze_articles_bulk(
+    urls: List[str],
+    backend: Optional[BatchBackend],
+    job_dir: Optional[str],
+    max_concurrency: int,
+    workflow: NewsAnalysisGraph,
+    force_refresh: bool,
+) -> List[Dict[str, Any]]:
+    """대량 처리 본문 (인자는 analyze_articles_bulk 참고)"""
+    config = load_runtime_config('bulk')
+    job = BatchJob(
+        resolve_project_path(job_dir or config.get('job_dir', 'cache/bulk')),
+        backend or get_batch_backend(),
+        poll_interval=config.get('poll_interval', 60),
+    )
+    groups = dict(canonical_groups(urls))
+    canonical_urls = list(groups)
+    job.check_urls(canonical_urls)
+    
+    print(f"🚚 대량 처리 시작: 기사 {len(canonical_urls)}개")
+    print("=" * 50)
+    
+    outcomes: Dict[str, Union[Dict[str, Any], Exception]] = {}
+    pages: Dict[str, str] = {}
+    async for canonical_url, page in crawl_many(canonical_urls, force_refresh=force_refresh, crawl=crawl_news):
+        if isinstance(page, Exception):
+            outcomes[canonical_url] = page
+        else:
+            pages[canonical_url] = page
+
+    # 결과 캐시에 있는 기사는 배치 단계 없이 일반 경로로 처리
+    result_cache = get_result_cache()
+    pending: Dict[int, str] = {}
+    for i, canonical_url in enumerate(canonical_urls):
+        if canonical_url not in pages:
+            continue
+        if result_cache and not force_refresh and result_cache.get(canonical_url, article_hash(pages[canonical_url])):
+            try:
+                outcomes[canonical_url] = await analyze_articles_async(canonical_url, workflow, crawled_content=pages[canonical_url])
+            except Exception as e:
+                outcomes[canonical_url] = e
+        else:
+            pending[i] = canonical_url
+    
+    # 1단계 배치: 정제 및 키워드 추출 (긴 기사는 조각별 요청을 합침)
+    if workflow.fused:
+        module_name, prompt_file_name, extract_schema = 'news_fused_extractor', 'news_fused_extractor_prompt.yaml', NewsAnalysis
+    else:
+        module_name, prompt_file_name, extract_schema = 'news_processor', 'news_processor_prompt.yaml', NewsArticle
+    chunk_counts: Dict[int, int] = {}
+    requests = []
+    for i, canonical_url in pending.items():
+        cleaned_content, _ = clean_content(pages[canonical_url])
+        chunks = split_for_extraction(cleaned_content)
+        chunk_counts[i] = len(chunks)
+        requests.extend(
+            build_chat_request(f"extract-{i}-{j}", module_name, prompt_file_name, {"raw_content": chunk}, extract_schema)
+            for j, chunk in enumerate(chunks)
+        )
+    extracted = await job.run_stage("extract", requests, extract_schema)
+    
+    prefilled: Dict[int, Dict[str, Any]] = {}
+    for i, canonical_url in list(pending.items()):
+        parts = [extracted[f"extract-{i}-{j}"] for j in range(chunk_counts[i])]
+        error = next((part for part in parts if isinstance(part, Exception)), None)
+        if error is not None:
+            outcomes[canonical_url] = error
+            del pending[i]
+            continue
+        article = parts[0] if len(parts) == 1 else merge_articles(parts)
+        prefilled[i] = {
+            "extracted_content": {"content": article.content, "topic": article.topic, "keywords": article.keywords},
+            "questions": article.questions if workflow.fused else None,
+        }
+    
+    # 2단계 배치: 질문 생성 (통합 구성에서는 1단계에서 함께 생성됨)
+    if not workflow.fused:
+        requests = [
+            build_chat_request(f"questions-{i}", 'news_question_generator', 'news_question_generator_prompt.yaml',
+                               {"content": prefilled[i]["extracted_content"]["content"]}, QuestionList)
+            for i in pending
+        ]
+        generated = await job.run_stage("questions", requests, QuestionList)
+        for i, canonical_url in list(pending.items()):
+            result = generated[f"questions-{i}"]
+            if isinstance(result, Exception):
+                outcomes[canonical_url] = result
+                del pending[i]
+            else:
+                prefilled[i]["questions"] = result.questions
+    
+    # 에이전트 단계: 최종 보고서 직전에서 멈추는 그래프로 대화형 실행 (같은 체크포인터의 별도 스레드 사용)
+    checkpointer = (await workflow.get_app()).checkpointer or MemorySaver()
+    app = workflow.builder.compile(checkpointer=checkpointer, interrupt_before=["accumulate_results"])
+    semaphore = asyncio.Semaphore(max_concurrency)
+    answer_store = get_answer_store()
+    waiting: Dict[int, Dict[str, Any]] = {}
+    traces: Dict[int, RunTrace] = {}
+
+    def bulk_config(canonical_url: str) -> Dict[str, Any]:
+        return {"configurable": {"thread_id": f"bulk:{canonical_url}"}}
+
+    async def run_agents(i: int, canonical_url: str):
+        run_config = bulk_config(canonical_url)
+        async with semaphore:
+            try:
+                snapshot = await app.aget_state(run_config)
+                if force_refresh or snapshot.next != ("accumulate_results",):
+                    # 같은 배치 결과로 다시 실행하면 저장된 답변을 이어 쓰고, force_refresh이면 버림
+                    if force_refresh and answer_store:
+                        answer_store.clear(canonical_url)
+                    with start_trace(canonical_url) as trace:
+                        await app.ainvoke(_initial_state(canonical_url, force_refresh, pages[canonical_url], prefilled[i]), run_config)
+                    _export_trace(trace)
+                    traces[i] = trace
+                    snapshot = await app.aget_state(run_config)
+                else:
+                    print(f"⏯️ 에이전트 단계까지 완료된 실행 사용: {canonical_url}")
+                
+                if snapshot.next:
+                    waiting[i] = dict(snapshot.values)
+                else:
+                    # 실행 중 결과 캐시에 적중하여 끝난 경우
+                    outcomes[canonical_url] = _build_results(canonical_url, dict(snapshot.values), traces.get(i))
+            except Exception as e:
+                outcomes[canonical_url] = e
+
+    await asyncio.gather(*(run_agents(i, canonical_url) for i, canonical_url in pending.items()))
+    
+    # 3단계 배치: 최종 보고서 생성 후 멈춰 둔 그래프 재개
+    requests = [
+        build_chat_request(f"accumulate-{i}", 'news_accumulator', 'news_accumulator_prompt.yaml',
+                           workflow.accumulator.prompt_input(state["extracted_content"], state["qa_pairs"], state["ka_pairs"]),
+                           FinalReport)
+        for i, state in waiting.items()
+    ]
+    reports = await job.run_stage("accumulate", requests, FinalReport)
+    for i, state in waiting.items():
+        canonical_url = pending[i]
+        report = reports[f"accumulate-{i}"]
+        if isinstance(report, Exception):
+            outcomes[canonical_url] = report
+            continue
+        try:
+            run_config = bulk_config(canonical_url)
+            await app.aupdate_state(run_config, {"final_result": workflow.accumulator.render_report(state["extracted_content"], report)})
+            final_state = await app.ainvoke(None, run_config)
+            await checkpointer.adelete_thread(run_config["configurable"]["thread_id"])
+            if answer_store:
+                answer_store.clear(canonical_url)
+            outcomes[canonical_url] = _build_results(canonical_url, final_state, traces.get(i))
+        except Exception as e:
+            outcomes[canonical_url] = e
+    
+    items = []
+    for url in urls:
+        outcome = outcomes.get(canonicalize_url(url), RuntimeError("처리되지 않았습니다"))
+        if isinstance(outcome, Exception):
+            items.append({"url": url, "result": None, "error": f"{type(outcome).__name__}: {outcome}"})
+        else:
+            items.append({"url": url, "result": {**outcome, "url": url}, "error": None})
+    
+    failed = sum(1 for item in items if item["error"])
+    print("=" * 50)
+    print(f"🎉 대량 처리 완료: 성공 {len(items) - failed}개, 실패 {failed}개")
+    return items
+
+
 def print_results(results: Dict[str, Any]):
     """결과를 보기 좋게 출력"""
     print("\n" + "=" * 60)
@@ -199,6 +1142,8 @@ def print_results(results: Dict[str, Any]):
     print("=" * 60)
     
     print(f"\n🌐 URL: {results['url']}")
+    if results.get('truncated'):
+        print("✂️ 원본이 길어 제목과 앞부분만 분석했습니다")
     
     print(f"\n📰 주제: {results['extracted_content']['topic']}")
     
@@ -235,10 +1180,42 @@ def print_results(results: Dict[str, Any]):
     print(f"   {final_report}")
 
 
+
+def print_stream_event(event: Dict[str, Any]):
+    """analyze_articles_stream 이벤트를 도착하는 대로 출력"""
+    event_type = event["type"]
+    
+    if event_type == "extracted":
+        print(f"\n📰 주제: {event['topic']}")
+        print(f"\n🔍 키워드: {', '.join(event['keywords'])}")
+    
+    elif event_type == "questions":
+        print(f"\n❓ 질문 수: {len(event['questions'])}")
+        for i, question in enumerate(event['questions'], 1):
+            print(f"  {i}. {question}")
+    
+    elif event_type == "qa_pair":
+        question = list(event['qa_pair'].keys())[0]
+        answer = list(event['qa_pair'].values())[0]
+        print(f"\n💬 Q: {question}")
+        print(f"     A: {answer}")
+    
+    elif event_type == "ka_pair":
+        keyword = list(event['ka_pair'].keys())[0]
+        explanation = list(event['ka_pair'].values())[0]
+        print(f"\n🔑 키워드: {keyword}")
+        print(f"     설명: {explanation}")
+    
+    elif event_type == "final_result":
+        print(f"\n📋 최종 보고서:")
+        print(f"   {event['final_result']}")
+
 if __name__ == "__main__":
     url = "https://n.news.naver.com/mnews/article/421/0008261200"
     
     try:
+        warm_up()
+
         results = analyze_articles(url)
         print_results(results)
     except Exception as e:
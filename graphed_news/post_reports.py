@@ -5,7 +5,7 @@ import argparse
 import httpx
 from typing import Dict, Any
 
-from main import analyze_articles, print_results
+from main import analyze_articles, print_results, print_stream_event, warm_up
 
 
 def prepare_post_data(results: Dict[str, Any]) -> Dict[str, Any]:
@@ -77,13 +77,22 @@ def main():
     parser.add_argument("--url", type=str, help="URL of the news article to process",
                         default="https://n.news.naver.com/mnews/article/016/0001843132?sid=105")
     parser.add_argument("--news-id", type=str, help="News ID for the POST request", required=False)
+    parser.add_argument("--stream", action="store_true", help="Print topic, answers and the report as soon as each is ready")
+    parser.add_argument("--force-refresh", action="store_true", help="Ignore cached results and reprocess the article")
     args = parser.parse_args()
     
     try:
-        results = analyze_articles(args.url)
+        # 공유 워크플로우를 먼저 준비
+        warm_up()
         
-        # 결과 출력
-        print_results(results)
+        if args.stream:
+            # 중간 결과를 도착하는 대로 출력
+            results = analyze_articles(args.url, on_event=print_stream_event, force_refresh=args.force_refresh)
+        else:
+            results = analyze_articles(args.url, force_refresh=args.force_refresh)
+            
+            # 결과 출력
+            print_results(results)
         
         # POST 요청 전송
         if args.news_id:
@@ -0,0 +1,101 @@
+"""배치 작업 파일 테스트"""
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.stubs import make_stub_batch_responder
+from core.batch_jobs import BatchJob, LocalFileBatchBackend, build_chat_request, parse_batch_result
+from core.news_question_generator import QuestionList
+from core.utils import load_model_config
+
+
+class _CountingBackend(LocalFileBatchBackend):
+    def __init__(self, directory, responder=None, statuses=None):
+        super().__init__(directory, responder or make_stub_batch_responder())
+        self.submitted = 0
+        self.statuses = list(statuses or [])
+
+    def submit(self, input_path):
+        self.submitted += 1
+        return super().submit(input_path)
+
+    def status(self, batch_id):
+        return self.statuses.pop(0) if self.statuses else super().status(batch_id)
+
+
+def _question_request(custom_id):
+    return build_chat_request(custom_id, "news_question_generator", "news_question_generator_prompt.yaml", {"content": "기사 본문"}, QuestionList)
+
+
+def test_build_chat_request_uses_module_settings_and_json_schema():
+    request = _question_request("questions-0")
+
+    assert request["custom_id"] == "questions-0"
+    assert request["url"] == "/v1/chat/completions"
+    model_config = load_model_config("news_question_generator")
+    assert request["body"]["model"] == model_config["model"]
+    assert request["body"]["temperature"] == model_config["temperature"]
+    assert any("기사 본문" in message["content"] for message in request["body"]["messages"])
+    assert request["body"]["response_format"]["json_schema"]["schema"]["properties"].keys() == {"questions"}
+
+
+def test_parse_batch_result_validates_schema_and_reports_errors():
+    ok = {"custom_id": "q", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": '{"questions": ["질문"]}'}}]}}, "error": None}
+    failed = {"custom_id": "q", "response": None, "error": {"code": "rate_limit", "message": "한도 초과"}}
+    refused = {"custom_id": "q", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": None, "refusal": "거부"}}]}}}
+
+    assert parse_batch_result(ok, QuestionList).questions == ["질문"]
+    with pytest.raises(RuntimeError, match="rate_limit"):
+        parse_batch_result(failed, QuestionList)
+    with pytest.raises(RuntimeError, match="거부"):
+        parse_batch_result(refused, QuestionList)
+
+
+def test_run_stage_returns_results_and_errors_per_request(tmp_path):
+    def responder(body):
+        if "실패" in json.dumps(body, ensure_ascii=False):
+            raise ValueError("잘못된 요청")
+        return make_stub_batch_responder()(body)
+
+    backend = _CountingBackend(str(tmp_path / "backend"), responder)
+    job = BatchJob(str(tmp_path / "job"), backend, poll_interval=0)
+    failing = build_chat_request("questions-1", "news_question_generator", "news_question_generator_prompt.yaml", {"content": "실패"}, QuestionList)
+
+    results = asyncio.run(job.run_stage("questions", [_question_request("questions-0"), failing], QuestionList))
+
+    assert results["questions-0"].questions
+    assert isinstance(results["questions-1"], RuntimeError)
+
+
+def test_rerun_reuses_submitted_stage(tmp_path):
+    backend = _CountingBackend(str(tmp_path / "backend"))
+    requests = [_question_request("questions-0")]
+
+    first = asyncio.run(BatchJob(str(tmp_path / "job"), backend, poll_interval=0).run_stage("questions", requests, QuestionList))
+    # 같은 작업 디렉토리로 다시 실행하면 manifest의 배치 결과를 사용
+    second = asyncio.run(BatchJob(str(tmp_path / "job"), backend, poll_interval=0).run_stage("questions", requests, QuestionList))
+
+    assert backend.submitted == 1
+    assert first["questions-0"] == second["questions-0"]
+
+
+def test_failed_batch_is_resubmitted_on_next_run(tmp_path):
+    backend = _CountingBackend(str(tmp_path / "backend"), statuses=["in_progress", "expired"])
+    requests = [_question_request("questions-0")]
+
+    with pytest.raises(RuntimeError, match="expired"):
+        asyncio.run(BatchJob(str(tmp_path / "job"), backend, poll_interval=0).run_stage("questions", requests, QuestionList))
+    results = asyncio.run(BatchJob(str(tmp_path / "job"), backend, poll_interval=0).run_stage("questions", requests, QuestionList))
+
+    assert backend.submitted == 2
+    assert results["questions-0"].questions
+
+
+def test_job_directory_is_tied_to_its_url_list(tmp_path):
+    backend = _CountingBackend(str(tmp_path / "backend"))
+    BatchJob(str(tmp_path / "job"), backend).check_urls(["https://example.com/1"])
+
+    BatchJob(str(tmp_path / "job"), backend).check_urls(["https://example.com/1"])
+    with pytest.raises(ValueError):
+        BatchJob(str(tmp_path / "job"), backend).check_urls(["https://example.com/2"])
@@ -0,0 +1,88 @@
+"""대량 처리(analyze_articles_bulk) 테스트"""
+import asyncio
+
+import pytest
+
+import main
+from benchmarks.stubs import StubChatModel, StubSearch, make_stub_batch_responder, make_stub_crawler
+from core import (
+    llm_scheduler, news_accumulator, news_fused_extractor, news_ka_agent, news_processor, news_qa_agent,
+    news_question_generator,
+)
+from core.batch_jobs import LocalFileBatchBackend
+
+URLS = [
+    "https://example.com/article/1",
+    "https://example.com/article/2?utm_source=feed",
+    "https://example.com/article/1#comments",
+]
+
+
+class _CountingBackend(LocalFileBatchBackend):
+    def __init__(self, directory):
+        super().__init__(directory, make_stub_batch_responder())
+        self.stages = []
+
+    def submit(self, input_path):
+        self.stages.append(input_path.rsplit("/", 1)[-1].split(".")[0])
+        return super().submit(input_path)
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch):
+    """모델, 검색, 크롤링을 벤치마크 대역으로 바꾸고 캐시와 체크포인트를 끕니다."""
+    stub_model = StubChatModel(latency=0, output_tokens=10)
+    for module in (news_processor, news_question_generator, news_fused_extractor, news_qa_agent, news_ka_agent, news_accumulator):
+        monkeypatch.setattr(module, "create_chat_model", lambda module_name: stub_model)
+    for module in (news_qa_agent, news_ka_agent):
+        monkeypatch.setattr(module, "TavilySearchResults", StubSearch)
+    monkeypatch.setattr(StubSearch, "latency", 0)
+    monkeypatch.setattr(llm_scheduler, "_scheduler", llm_scheduler.LLMScheduler({}, {}))
+    monkeypatch.setattr(main, "crawl_news", make_stub_crawler(latency=0, content_chars=500))
+    monkeypatch.setattr(main, "get_result_cache", lambda: None)
+    monkeypatch.setattr(main, "get_checkpoint_path", lambda: None)
+    monkeypatch.setattr(main, "get_answer_store", lambda: None)
+    monkeypatch.setattr(main, "close_loop_resources", lambda workflow=None: asyncio.sleep(0))
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_bulk_runs_model_stages_as_batches(tmp_path, stub_pipeline, fused):
+    backend = _CountingBackend(str(tmp_path / "backend"))
+    workflow = main.NewsAnalysisGraph(fused=fused)
+
+    items = asyncio.run(main.analyze_articles_bulk(URLS, backend=backend, job_dir=str(tmp_path / "job"), workflow=workflow))
+
+    assert [item["url"] for item in items] == URLS
+    assert all(item["error"] is None for item in items)
+    # 같은 기사의 URL 변형은 한 번만 처리
+    assert items[0]["result"]["final_result"] == items[2]["result"]["final_result"]
+    assert items[0]["result"]["qa_pairs"] and items[0]["result"]["ka_pairs"]
+    assert backend.stages == (["extract", "accumulate"] if fused else ["extract", "questions", "accumulate"])
+
+
+def test_bulk_rerun_reuses_submitted_batches(tmp_path, stub_pipeline):
+    backend = _CountingBackend(str(tmp_path / "backend"))
+    workflow = main.NewsAnalysisGraph()
+
+    asyncio.run(main.analyze_articles_bulk(URLS, backend=backend, job_dir=str(tmp_path / "job"), workflow=workflow))
+    items = asyncio.run(main.analyze_articles_bulk(URLS, backend=backend, job_dir=str(tmp_path / "job"), workflow=workflow))
+
+    assert all(item["error"] is None for item in items)
+    assert backend.stages == ["extract", "questions", "accumulate"]
+
+
+def test_bulk_reports_crawl_errors_per_url(tmp_path, stub_pipeline, monkeypatch):
+    crawl = make_stub_crawler(latency=0, content_chars=500)
+
+    async def failing_crawl(url, force_refresh=False):
+        if "article/2" in url:
+            raise RuntimeError("크롤링 실패")
+        return await crawl(url, force_refresh)
+
+    monkeypatch.setattr(main, "crawl_news", failing_crawl)
+    backend = _CountingBackend(str(tmp_path / "backend"))
+
+    items = asyncio.run(main.analyze_articles_bulk(URLS, backend=backend, job_dir=str(tmp_path / "job"), workflow=main.NewsAnalysisGraph()))
+
+    assert items[1]["result"] is None and "크롤링 실패" in items[1]["error"]
+    assert items[0]["error"] is None and items[2]["error"] is None
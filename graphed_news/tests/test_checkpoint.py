@@ -0,0 +1,135 @@
+"""체크포인트 재개와 체크포인터 연결 정리 테스트"""
+import asyncio
+import os
+import subprocess
+import sys
+from typing import Optional, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+import main
+from core.checkpoint import AnswerStore, close_checkpointer, create_checkpointer
+
+
+class _State(TypedDict):
+    url: str
+    force_refresh: bool
+    steps: Optional[list]
+
+
+def _build_graph(calls, fail_once):
+    async def first(state):
+        calls.append("first")
+        return {"steps": ["first"]}
+
+    async def second(state):
+        calls.append("second")
+        if fail_once:
+            fail_once.pop()
+            raise RuntimeError("일시적 오류")
+        return {"steps": state["steps"] + ["second"]}
+
+    builder = StateGraph(_State)
+    builder.add_node("first", first)
+    builder.add_node("second", second)
+    builder.add_edge(START, "first")
+    builder.add_edge("first", "second")
+    builder.add_edge("second", END)
+    return builder
+
+
+def test_failed_run_resumes_from_last_completed_node(tmp_path):
+    url = "https://example.com/article/1"
+    calls = []
+    initial_state = {"url": url, "force_refresh": False, "steps": None}
+
+    async def run():
+        checkpointer = await create_checkpointer(str(tmp_path / "checkpoints.sqlite3"))
+        try:
+            app = _build_graph(calls, fail_once=[True]).compile(checkpointer=checkpointer)
+            with pytest.raises(RuntimeError):
+                await app.ainvoke(initial_state, main._run_config(url))
+
+            run_input, state = await main._prepare_run(app, url, initial_state)
+            assert run_input is None
+            assert state["steps"] == ["first"]
+            return await app.ainvoke(run_input, main._run_config(url))
+        finally:
+            await close_checkpointer(checkpointer)
+
+    final_state = asyncio.run(run())
+
+    assert final_state["steps"] == ["first", "second"]
+    assert calls == ["first", "second", "second"]
+
+
+def test_force_refresh_ignores_failed_run(tmp_path):
+    url = "https://example.com/article/1"
+
+    async def run():
+        checkpointer = await create_checkpointer(str(tmp_path / "checkpoints.sqlite3"))
+        try:
+            app = _build_graph([], fail_once=[True]).compile(checkpointer=checkpointer)
+            with pytest.raises(RuntimeError):
+                await app.ainvoke({"url": url, "force_refresh": False, "steps": None}, main._run_config(url))
+            refreshed = {"url": url, "force_refresh": True, "steps": None}
+            return await main._prepare_run(app, url, refreshed)
+        finally:
+            await close_checkpointer(checkpointer)
+
+    run_input, _ = asyncio.run(run())
+
+    assert run_input == {"url": url, "force_refresh": True, "steps": None}
+
+
+def test_fresh_run_discards_saved_answers(tmp_path, monkeypatch):
+    url = "https://example.com/article/1"
+    answer_store = AnswerStore(str(tmp_path / "answers.sqlite3"))
+    monkeypatch.setattr(main, "get_answer_store", lambda: answer_store)
+
+    async def prepare(force_refresh):
+        checkpointer = await create_checkpointer(str(tmp_path / "checkpoints.sqlite3"))
+        try:
+            app = _build_graph([], fail_once=[True]).compile(checkpointer=checkpointer)
+            with pytest.raises(RuntimeError):
+                await app.ainvoke({"url": url, "force_refresh": False, "steps": None}, main._run_config(url))
+            answer_store.save(url, "qa", "질문", "이전 답변")
+            return await main._prepare_run(app, url, {"url": url, "force_refresh": force_refresh, "steps": None})
+        finally:
+            await close_checkpointer(checkpointer)
+
+    # 재개하는 실행은 저장된 답변을 이어 씀
+    asyncio.run(prepare(force_refresh=False))
+    assert answer_store.load(url, "qa") == {"질문": "이전 답변"}
+
+    asyncio.run(prepare(force_refresh=True))
+    assert answer_store.load(url, "qa") == {}
+
+
+def test_close_checkpointer_stops_connection_thread(tmp_path):
+    async def run():
+        checkpointer = await create_checkpointer(str(tmp_path / "checkpoints.sqlite3"))
+        await close_checkpointer(checkpointer)
+        return checkpointer.conn
+
+    conn = asyncio.run(run())
+    conn.join(timeout=5)
+
+    assert not conn.is_alive()
+
+
+def test_unclosed_checkpointer_does_not_block_exit(tmp_path):
+    script = (
+        "import asyncio, sys\n"
+        "from core.checkpoint import create_checkpointer\n"
+        "asyncio.run(create_checkpointer(sys.argv[1]))\n"
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script, str(tmp_path / "checkpoints.sqlite3")],
+        cwd=project_root, timeout=30,
+    )
+
+    assert completed.returncode == 0
@@ -0,0 +1,65 @@
+"""content_cleaner 테스트"""
+from core.content_cleaner import TRUNCATION_MARKER, clean_content, limit_content
+from core.utils import estimate_tokens
+
+
+def test_limit_content_keeps_lead_after_title():
+    markdown = "# 제목\n\n" + "가" * 100000
+
+    limited, truncated = limit_content(markdown, max_chars=60000, max_tokens=30000)
+
+    assert truncated
+    assert limited.startswith("# 제목\n\n가")
+    assert limited.endswith(TRUNCATION_MARKER)
+    assert len(limited) > 20000
+    assert len(limited) <= 60000
+    assert estimate_tokens(limited) <= 30000
+
+
+def test_limit_content_respects_token_limit_for_single_block():
+    limited, truncated = limit_content("가" * 100000, max_chars=60000, max_tokens=30000)
+
+    assert truncated
+    assert len(limited) <= 60000
+    assert estimate_tokens(limited) <= 30000
+    assert estimate_tokens(limited) > 29000
+
+
+def test_limit_content_returns_short_content_unchanged():
+    markdown = "# 제목\n\n짧은 본문입니다."
+
+    assert limit_content(markdown, max_chars=1000, max_tokens=1000) == (markdown, False)
+
+
+def test_clean_content_keeps_body_starting_with_widget_words():
+    paragraphs = [
+        "댓글 문화가 정치 양극화를 키운다는 지적이 나오면서 포털들이 댓글 정책 개편을 검토하고 있다. 업계에서는 실명제 도입 여부를 두고 의견이 갈린다.",
+        "좋아요 수를 공개하지 않는 방안도 논의되고 있다. 플랫폼들은 이용자 반응을 지켜본 뒤 다음 달 최종안을 내놓을 계획이다.",
+        "공유하기 기능을 통해 허위 정보가 빠르게 퍼진다는 연구 결과도 나왔다. 연구진은 공유 전 경고 문구를 띄우는 방안을 제안했다.",
+        "정부는 관련 가이드라인을 연내 마련하고, 구독하기 쉬운 뉴스레터를 운영하는 언론사와도 협의를 이어갈 방침이다.",
+    ]
+    markdown = "\n\n".join(paragraphs)
+
+    cleaned, stats = clean_content(markdown, {"min_keep_chars": 0})
+
+    assert cleaned == markdown
+    assert stats.removed_chars == 0
+
+
+def test_clean_content_drops_widget_lines():
+    body = "정부는 관련 가이드라인을 연내 마련하고 언론사와 협의를 이어갈 방침이다. " * 3
+    markdown = "\n\n".join(["# 제목", body, "댓글 12", "공유하기 좋아요 3", "뉴스레터 구독하기"])
+
+    cleaned, _ = clean_content(markdown, {"min_keep_chars": 0})
+
+    assert cleaned == "\n\n".join(["# 제목", body.rstrip()])
+
+
+def test_clean_content_drops_only_short_tip_off_lines():
+    body = "시민들의 기사 제보가 이어지면서 경찰이 해당 업체에 대한 수사에 착수했다. 업체 측은 의혹을 부인했다."
+    lead = "기사 제보를 받은 편집국은 사실 확인을 위해 현장 취재팀을 보내 관계자들을 만났고, 관련 문서를 확보해 보도 여부를 검토하고 있다."
+    markdown = "\n\n".join(["# 제목", body, lead, "▶ 기사제보 및 보도자료 news@example.com", "[기사 제보] 카카오톡 @뉴스"])
+
+    cleaned, _ = clean_content(markdown, {"min_keep_chars": 0})
+
+    assert cleaned == "\n\n".join(["# 제목", body, lead])
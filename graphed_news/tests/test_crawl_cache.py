@@ -0,0 +1,133 @@
+"""크롤링 캐시와 조건부 재검증 테스트"""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core import crawl_cache, http_fetcher, news_crawler
+from core.crawl_cache import CrawlCache
+
+URL = "https://example.com/article/1"
+ARTICLE_HTML = (
+    "<html><body><article><h1>정부, 플랫폼 가이드라인 연내 마련</h1>"
+    "<p>정부는 관련 가이드라인을 연내 마련하고 언론사와 협의를 이어갈 방침이다.</p>"
+    "</article></body></html>"
+).encode("utf-8")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(crawl_cache.time, "time", clock)
+    return clock
+
+
+def test_entry_is_fresh_within_ttl_and_stale_after(tmp_path, clock):
+    cache = CrawlCache(str(tmp_path / "crawl.sqlite3"), ttl_seconds=60)
+    cache.put(URL, "# 본문", etag='"v1"')
+
+    cached = cache.get(URL + "?utm_source=feed")
+    assert cached.fresh and cached.markdown == "# 본문" and cached.etag == '"v1"'
+
+    clock.now += 61
+    assert not cache.is_fresh(URL)
+    assert not cache.get(URL).fresh
+    assert cache.stats == {"hits": 1, "revalidated": 0, "misses": 0, "evicted": 0}
+
+
+def test_mark_revalidated_restarts_ttl(tmp_path, clock):
+    cache = CrawlCache(str(tmp_path / "crawl.sqlite3"), ttl_seconds=60)
+    cache.put(URL, "# 본문")
+    clock.now += 61
+
+    cache.mark_revalidated(URL)
+
+    assert cache.is_fresh(URL)
+    assert cache.stats["revalidated"] == 1
+
+
+def test_eviction_keeps_total_size_under_limit(tmp_path, clock):
+    cache = CrawlCache(str(tmp_path / "crawl.sqlite3"), max_bytes=30)
+    for i in range(3):
+        clock.now += 1
+        cache.put(f"https://example.com/article/{i}", "가" * 3)
+    clock.now += 1
+    cache.get("https://example.com/article/0")
+    clock.now += 1
+    cache.put("https://example.com/article/3", "가" * 3)
+
+    assert cache.get("https://example.com/article/0") is not None
+    assert cache.get("https://example.com/article/1") is None
+    assert cache.stats["evicted"] == 1
+
+
+class _ArticleHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(ARTICLE_HTML)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(ARTICLE_HTML)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def article_url(monkeypatch):
+    _ArticleHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ArticleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(http_fetcher, "_fetch_config", lambda: {"enabled": True, "domains": {"127.0.0.1": {}}})
+    yield f"http://127.0.0.1:{server.server_address[1]}/article/1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_stale_entry_is_revalidated_with_conditional_request(tmp_path, monkeypatch, article_url):
+    cache = CrawlCache(str(tmp_path / "crawl.sqlite3"), ttl_seconds=0)
+    monkeypatch.setattr(news_crawler, "get_crawl_cache", lambda: cache)
+
+    def no_browser():
+        raise AssertionError("HTTP 수집 대상은 브라우저를 사용하지 않아야 합니다")
+
+    monkeypatch.setattr(news_crawler, "get_crawler_pool", no_browser)
+
+    first = asyncio.run(news_crawler.crawl_news(article_url))
+    second = asyncio.run(news_crawler.crawl_news(article_url))
+
+    assert "가이드라인" in first
+    assert second == first
+    assert _ArticleHandler.requests == [None, '"v1"']
+    assert cache.stats["revalidated"] == 1
+
+
+def test_force_refresh_skips_cache(tmp_path, monkeypatch, article_url):
+    cache = CrawlCache(str(tmp_path / "crawl.sqlite3"))
+    monkeypatch.setattr(news_crawler, "get_crawl_cache", lambda: cache)
+
+    asyncio.run(news_crawler.crawl_news(article_url))
+    asyncio.run(news_crawler.crawl_news(article_url))
+    asyncio.run(news_crawler.crawl_news(article_url, force_refresh=True))
+
+    # 두 번째는 TTL 안이라 요청하지 않고, force_refresh는 검증자 없이 다시 받음
+    assert _ArticleHandler.requests == [None, None]
@@ -0,0 +1,132 @@
+"""같은 기사에 대한 동시 요청 병합 테스트"""
+import asyncio
+
+import pytest
+
+import main
+
+URL = "https://example.com/article/1?utm_source=feed"
+OTHER_VARIANT = "https://example.com/article/1"
+
+
+@pytest.fixture
+def fake_runs(monkeypatch):
+    """워크플로우 실행을 시작 횟수를 기록하는 가짜 실행으로 바꿉니다."""
+    started = []
+    release = {}
+
+    def results(canonical_url, force_refresh):
+        return {
+            "url": canonical_url,
+            "extracted_content": {"topic": "주제", "keywords": ["키워드"]},
+            "questions": ["질문"],
+            "qa_pairs": [],
+            "ka_pairs": [],
+            "final_result": "보고서",
+            "force_refresh": force_refresh,
+        }
+
+    async def run_workflow(canonical_url, workflow, force_refresh, crawled_content):
+        started.append(("run", force_refresh))
+        await release.setdefault(len(started), asyncio.Event()).wait()
+        return results(canonical_url, force_refresh)
+
+    async def stream_workflow(canonical_url, workflow, force_refresh, crawled_content):
+        started.append(("stream", force_refresh))
+        yield {"type": "extracted", "topic": "주제", "keywords": ["키워드"]}
+        await release.setdefault(len(started), asyncio.Event()).wait()
+        yield {"type": "final_result", "final_result": "보고서"}
+        yield {"type": "completed", "results": results(canonical_url, force_refresh)}
+
+    def finish(n):
+        release.setdefault(n, asyncio.Event()).set()
+
+    monkeypatch.setattr(main, "_run_workflow", run_workflow)
+    monkeypatch.setattr(main, "_stream_workflow", stream_workflow)
+    return started, finish
+
+
+async def _collect(url, **kwargs):
+    return [event async for event in main.analyze_articles_stream(url, workflow=object(), **kwargs)]
+
+
+def test_concurrent_callers_share_one_run(fake_runs):
+    started, finish = fake_runs
+
+    async def run():
+        first = asyncio.ensure_future(main.analyze_articles_async(URL, workflow=object()))
+        second = asyncio.ensure_future(main.analyze_articles_async(OTHER_VARIANT, workflow=object()))
+        await asyncio.sleep(0.01)
+        finish(1)
+        return await asyncio.gather(first, second)
+
+    first, second = asyncio.run(run())
+
+    assert started == [("run", False)]
+    assert first["url"] == URL
+    assert second["url"] == OTHER_VARIANT
+    assert first["final_result"] == second["final_result"] == "보고서"
+
+
+def test_streaming_callers_receive_all_events(fake_runs):
+    started, finish = fake_runs
+
+    async def run():
+        first = asyncio.ensure_future(_collect(URL))
+        await asyncio.sleep(0.01)
+        # 첫 이벤트가 나간 뒤 합류한 호출자도 처음부터 같은 이벤트를 받음
+        second = asyncio.ensure_future(_collect(OTHER_VARIANT))
+        joined = asyncio.ensure_future(main.analyze_articles_async(URL, workflow=object()))
+        await asyncio.sleep(0.01)
+        finish(1)
+        return await asyncio.gather(first, second, joined)
+
+    first, second, joined = asyncio.run(run())
+
+    assert started == [("stream", False)]
+    for events, url in ((first, URL), (second, OTHER_VARIANT)):
+        assert [event["type"] for event in events] == ["extracted", "final_result", "completed"]
+        assert events[-1]["results"]["url"] == url
+    assert joined["final_result"] == "보고서"
+
+
+def test_streaming_caller_joining_plain_run_receives_events(fake_runs):
+    started, finish = fake_runs
+
+    async def run():
+        plain = asyncio.ensure_future(main.analyze_articles_async(URL, workflow=object()))
+        await asyncio.sleep(0.01)
+        streaming = asyncio.ensure_future(_collect(URL))
+        await asyncio.sleep(0.01)
+        finish(1)
+        return await asyncio.gather(plain, streaming)
+
+    _, events = asyncio.run(run())
+
+    assert started == [("run", False)]
+    assert [event["type"] for event in events] == ["extracted", "questions", "final_result", "completed"]
+
+
+def test_force_refresh_waits_for_running_run_then_starts_new_one(fake_runs):
+    started, finish = fake_runs
+
+    async def run():
+        plain = asyncio.ensure_future(main.analyze_articles_async(URL, workflow=object()))
+        await asyncio.sleep(0.01)
+        forced = asyncio.ensure_future(main.analyze_articles_async(URL, workflow=object(), force_refresh=True))
+        await asyncio.sleep(0.01)
+        # 이전 실행이 끝나기 전에는 새 실행을 시작하지 않음 (체크포인트 스레드를 함께 쓰지 않도록)
+        assert started == [("run", False)]
+        # 새 실행이 대기 중이면 이후 요청은 새 실행에 합류
+        joined = asyncio.ensure_future(main.analyze_articles_async(OTHER_VARIANT, workflow=object()))
+        finish(1)
+        await asyncio.sleep(0.01)
+        finish(2)
+        return await asyncio.gather(plain, forced, joined)
+
+    plain, forced, joined = asyncio.run(run())
+
+    assert started == [("run", False), ("run", True)]
+    assert plain["force_refresh"] is False
+    assert forced["force_refresh"] is True
+    assert joined["force_refresh"] is True
@@ -0,0 +1,79 @@
+"""LLM 응답 캐시 테스트"""
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+
+from core import llm_cache
+from core.llm_cache import SQLiteLLMCache
+from core.tracing import start_trace, trace_span
+
+LLM_STRING = "model=gpt-4.1-nano,temperature=0"
+
+
+def _generation(text, input_tokens=120, output_tokens=30):
+    usage = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+    return ChatGeneration(message=AIMessage(content=text, usage_metadata=usage))
+
+
+def test_hit_returns_stored_response_without_token_usage(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite3"))
+    cache.update("프롬프트", LLM_STRING, [_generation("응답")])
+
+    cached = cache.lookup("프롬프트", LLM_STRING)
+
+    assert cached[0].message.content == "응답"
+    assert cached[0].message.usage_metadata["total_tokens"] == 0
+    assert cache.stats == {"hits": 1, "misses": 0, "evicted": 0}
+
+
+def test_miss_for_other_prompt_or_model_settings(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite3"))
+    cache.update("프롬프트", LLM_STRING, [_generation("응답")])
+
+    assert cache.lookup("다른 프롬프트", LLM_STRING) is None
+    assert cache.lookup("프롬프트", "model=gpt-4.1-nano,temperature=0.7") is None
+    assert cache.stats["misses"] == 2
+
+
+def test_unreadable_entry_is_treated_as_miss(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite3"))
+    cache.update("프롬프트", LLM_STRING, [_generation("응답")])
+    cache._conn.execute("UPDATE responses SET generations = 'not json'")
+
+    assert cache.lookup("프롬프트", LLM_STRING) is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path, monkeypatch):
+    now = [1_000_000.0]
+
+    def tick():
+        now[0] += 1
+        return now[0]
+
+    monkeypatch.setattr(llm_cache.time, "time", tick)
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite3"))
+    cache.update("첫 번째", LLM_STRING, [_generation("응답")])
+    entry_size = cache._conn.execute("SELECT size FROM responses").fetchone()[0]
+    cache.max_bytes = entry_size * 2
+    cache.update("두 번째", LLM_STRING, [_generation("응답")])
+    cache.lookup("첫 번째", LLM_STRING)
+    cache.update("세 번째", LLM_STRING, [_generation("응답")])
+
+    assert cache.lookup("첫 번째", LLM_STRING) is not None
+    assert cache.lookup("두 번째", LLM_STRING) is None
+    assert cache.stats["evicted"] == 1
+
+
+def test_model_with_cache_skips_repeated_call_and_records_hit_rate(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm.sqlite3"))
+    model = FakeListChatModel(responses=["첫 응답", "두 번째 응답"], cache=cache)
+
+    with start_trace("https://example.com/article/1") as trace:
+        with trace_span("extract_content", "node"):
+            first = model.invoke("기사 본문")
+            second = model.invoke("기사 본문")
+            other = model.invoke("다른 기사 본문")
+
+    assert first.content == second.content == "첫 응답"
+    assert other.content == "두 번째 응답"
+    assert trace.to_dict()["spans"][0]["llm_cache_hit_rate"] == round(1 / 3, 4)
@@ -0,0 +1,150 @@
+"""LLMScheduler 토큰 버킷과 우선순위 대기열 테스트"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core import llm_scheduler
+from core.llm_scheduler import LLMScheduler, TokenBucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(llm_scheduler.time, "monotonic", clock)
+    return clock
+
+
+def test_token_bucket_refills_at_per_minute_rate(clock):
+    bucket = TokenBucket(60)
+    bucket.take(60)
+
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+    clock.now += 0.5
+    assert bucket.wait_time(1) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert bucket.wait_time(1) == 0.0
+    # 오래 기다려도 용량을 넘게 쌓이지 않음
+    clock.now += 600
+    assert bucket.wait_time(60) == 0.0
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+
+def test_token_bucket_passes_requests_larger_than_capacity(clock):
+    bucket = TokenBucket(60)
+
+    assert bucket.wait_time(1000) == 0.0
+    bucket.take(1000)
+    assert bucket.tokens == 0.0
+
+
+def test_token_bucket_adjust_returns_unused_tokens(clock):
+    bucket = TokenBucket(100)
+    bucket.take(80)
+    bucket.adjust(-50)
+
+    assert bucket.tokens == pytest.approx(70)
+    bucket.adjust(-1000)
+    assert bucket.tokens == pytest.approx(100)
+
+
+def test_waiters_run_in_priority_order():
+    scheduler = LLMScheduler({"model": {"max_concurrency": 1}})
+    order = []
+
+    async def call(name, priority):
+        async with scheduler.slot("model", priority):
+            order.append(name)
+
+    async def run():
+        async with scheduler.slot("model"):
+            tasks = [
+                asyncio.ensure_future(call("low", 0)),
+                asyncio.ensure_future(call("high", 3)),
+                asyncio.ensure_future(call("middle", 1)),
+                asyncio.ensure_future(call("high-later", 3)),
+            ]
+            await asyncio.sleep(0.01)
+            assert order == []
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["high", "high-later", "middle", "low"]
+
+
+def test_cancelled_waiter_does_not_block_queue():
+    scheduler = LLMScheduler({"model": {"max_concurrency": 1}})
+
+    async def run():
+        async with scheduler.slot("model"):
+            cancelled = asyncio.ensure_future(scheduler.slot("model", 5).__aenter__())
+            waiting = asyncio.ensure_future(scheduler.slot("model", 0).__aenter__())
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+        await asyncio.wait_for(waiting, 1)
+
+    asyncio.run(run())
+
+    assert scheduler.metrics()["model"]["queue_depth"] == 0
+
+
+def test_rate_limited_waiter_sleeps_for_computed_time(monkeypatch):
+    # 분당 600회: 버킷을 비운 뒤 다음 호출은 0.1초 뒤에 실행
+    scheduler = LLMScheduler({"model": {"rpm": 600}})
+    scheduler._limiter("model").requests.take(600)
+    attempts = []
+    try_acquire = scheduler._try_acquire
+
+    def counting_try_acquire(*args):
+        attempts.append(args)
+        return try_acquire(*args)
+
+    monkeypatch.setattr(scheduler, "_try_acquire", counting_try_acquire)
+
+    async def run():
+        started = time.monotonic()
+        async with scheduler.slot("model"):
+            return time.monotonic() - started
+
+    waited = asyncio.run(run())
+
+    assert waited >= 0.09
+    # 짧은 간격으로 폴링하지 않고 계산한 시간만큼 한 번 기다림
+    assert len(attempts) <= 3
+
+
+def test_release_from_thread_wakes_async_waiter():
+    scheduler = LLMScheduler({"model": {"max_concurrency": 1}})
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_sync_slot():
+        with scheduler.slot_sync("model"):
+            held.set()
+            release.wait()
+
+    worker = threading.Thread(target=hold_sync_slot)
+    worker.start()
+    held.wait()
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        started = time.monotonic()
+        async with scheduler.slot("model"):
+            return time.monotonic() - started
+
+    waited = asyncio.run(run())
+    worker.join()
+
+    assert 0.04 <= waited < 1
@@ -0,0 +1,68 @@
+"""호출자 루프에서 실행한 배치 처리의 자원 정리 테스트"""
+import asyncio
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def closed(monkeypatch):
+    """close_loop_resources 호출을 기록합니다."""
+    calls = []
+
+    async def close_loop_resources(workflow=None):
+        calls.append(workflow)
+
+    monkeypatch.setattr(main, "close_loop_resources", close_loop_resources)
+    return calls
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    async def crawl_many(urls, force_refresh=False, crawl=None):
+        for url in urls:
+            yield url, "본문"
+
+    async def analyze_articles_async(url, workflow=None, force_refresh=False, crawled_content=None):
+        await asyncio.sleep(0.01)
+        return {"url": url}
+
+    monkeypatch.setattr(main, "crawl_many", crawl_many)
+    monkeypatch.setattr(main, "analyze_articles_async", analyze_articles_async)
+
+
+def test_batch_closes_caller_loop_resources(closed, fake_pipeline):
+    workflow = object()
+
+    async def run():
+        return [item async for item in main.analyze_articles_batch(["https://example.com/1", "https://example.com/2"], workflow=workflow)]
+
+    items = asyncio.run(run())
+
+    assert len(items) == 2
+    assert closed == [workflow]
+
+
+def test_batch_closes_resources_when_consumer_stops_early(closed, fake_pipeline):
+    async def run():
+        batch = main.analyze_articles_batch(["https://example.com/1", "https://example.com/2"], workflow=object())
+        await batch.__anext__()
+        await batch.aclose()
+
+    asyncio.run(run())
+
+    assert len(closed) == 1
+
+
+def test_resources_close_after_last_concurrent_batch(closed):
+    async def run():
+        async def use(delay):
+            async with main._closing_loop_resources(object()):
+                await asyncio.sleep(delay)
+                return len(closed)
+
+        return await asyncio.gather(use(0.01), use(0.02))
+
+    assert asyncio.run(run()) == [0, 0]
+    assert len(closed) == 1
@@ -0,0 +1,69 @@
+"""news_crawler 브라우저 크롤링 실패 처리 테스트"""
+import asyncio
+import contextlib
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core import news_crawler
+
+
+def _use_browser_result(monkeypatch, result):
+    class Crawler:
+        async def arun(self, url, config):
+            return result
+
+    class Pool:
+        @contextlib.asynccontextmanager
+        async def acquire(self):
+            yield Crawler()
+
+    async def no_http_fetch(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(news_crawler, "fetch_page", no_http_fetch)
+    monkeypatch.setattr(news_crawler, "get_crawl_cache", lambda: None)
+    monkeypatch.setattr(news_crawler, "get_crawler_pool", lambda: Pool())
+
+
+def test_crawl_news_raises_when_browser_crawl_fails(monkeypatch):
+    _use_browser_result(monkeypatch, SimpleNamespace(success=False, markdown=None, html="", status_code=500, error_message="timeout"))
+
+    with pytest.raises(news_crawler.CrawlError, match="timeout"):
+        asyncio.run(news_crawler.crawl_news("https://example.com/article/1"))
+
+
+def test_crawl_news_raises_on_empty_markdown(monkeypatch):
+    _use_browser_result(monkeypatch, SimpleNamespace(success=True, markdown="  \n", html="", status_code=200, error_message=None))
+
+    with pytest.raises(news_crawler.CrawlError):
+        asyncio.run(news_crawler.crawl_news("https://example.com/article/1"))
+
+
+def test_crawl_news_returns_browser_markdown(monkeypatch):
+    _use_browser_result(monkeypatch, SimpleNamespace(success=True, markdown="# 제목\n\n본문", html="", status_code=200, error_message=None))
+
+    assert asyncio.run(news_crawler.crawl_news("https://example.com/article/1")) == "# 제목\n\n본문"
+
+
+def test_crawl_many_spaces_same_host_requests_after_global_slot(monkeypatch):
+    monkeypatch.setattr(news_crawler, "get_crawl_cache", lambda: None)
+    started = []
+
+    async def crawl(url, force_refresh=False):
+        started.append((url, time.monotonic()))
+        # 다른 호스트의 느린 크롤링이 전체 슬롯을 모두 차지하는 동안 a.example.com 요청이 대기
+        await asyncio.sleep(0.05 if "a.example.com" in url else 0.3)
+        return url
+
+    async def run():
+        urls = ["https://b.example.com/1", "https://c.example.com/1", "https://a.example.com/1", "https://a.example.com/2"]
+        return [url async for url, _ in news_crawler.crawl_many(
+            urls, max_concurrency=2, per_host_concurrency=2, per_host_delay=0.1, crawl=crawl,
+        )]
+
+    asyncio.run(run())
+
+    a_starts = [at for url, at in started if "a.example.com" in url]
+    assert a_starts[1] - a_starts[0] >= 0.09
@@ -0,0 +1,31 @@
+"""news_processor 조각 병합 테스트"""
+from core.news_fused_extractor import NewsAnalysis
+from core.news_processor import merge_articles
+
+
+def _chunk(index: int, keywords, questions) -> NewsAnalysis:
+    return NewsAnalysis(topic=f"주제 {index}", keywords=keywords, content=f"조각 {index} 본문", questions=questions)
+
+
+def test_merge_articles_caps_questions_at_single_call_count():
+    chunks = [
+        _chunk(i, ["공통", f"키워드{i}"], [f"조각{i} 질문{j}" for j in range(5)] + ["공통 질문"])
+        for i in range(4)
+    ]
+
+    merged = merge_articles(chunks)
+
+    assert len(merged.questions) == 6
+    # 여러 조각에 나온 질문이 먼저, 나머지는 조각별로 번갈아 선택
+    assert merged.questions[0] == "공통 질문"
+    assert merged.questions[1:5] == ["조각0 질문0", "조각1 질문0", "조각2 질문0", "조각3 질문0"]
+
+
+def test_merge_articles_ranks_keywords_by_chunk_count():
+    chunks = [_chunk(0, ["가", "나"], []), _chunk(1, ["나", "다"], [])]
+
+    merged = merge_articles(chunks)
+
+    assert merged.keywords == ["나", "가", "다"]
+    assert merged.topic == "주제 0"
+    assert merged.content == "조각 0 본문\n\n조각 1 본문"
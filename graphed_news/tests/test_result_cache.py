@@ -0,0 +1,98 @@
+"""기사 처리 결과 캐시 테스트"""
+import pytest
+
+from core import result_cache
+from core.result_cache import ResultCache, article_hash
+
+URL = "https://example.com/article/1"
+BODY = "\n\n".join([
+    "# 정부, 플랫폼 가이드라인 연내 마련",
+    "정부는 관련 가이드라인을 연내 마련하고 언론사와 협의를 이어갈 방침이다. " * 3,
+    "업계에서는 실명제 도입 여부를 두고 의견이 갈린다. 플랫폼들은 이용자 반응을 지켜볼 계획이다. " * 2,
+])
+
+
+def _state(final_result):
+    return {
+        "extracted_content": {"content": "본문", "topic": "주제", "keywords": ["키워드"]},
+        "questions": ["질문"],
+        "qa_pairs": [],
+        "ka_pairs": [],
+        "final_result": final_result,
+        "crawled_content": "저장하지 않는 필드",
+    }
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(result_cache.time, "time", clock)
+    return clock
+
+
+def test_hit_returns_cached_fields_for_url_variant(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"))
+    cache.put(URL, "hash-1", _state("보고서"))
+
+    cached = cache.get(URL + "?utm_source=feed", "hash-1")
+
+    assert cached["final_result"] == "보고서"
+    assert "crawled_content" not in cached
+
+
+def test_miss_for_unknown_url_or_changed_content(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"))
+    cache.put(URL, "hash-1", _state("보고서"))
+
+    assert cache.get(URL, "hash-2") is None
+    assert cache.get("https://example.com/article/2", "hash-1") is None
+
+
+def test_entry_expires_after_ttl(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), ttl_seconds=60)
+    cache.put(URL, "hash-1", _state("보고서"))
+
+    clock.now += 59
+    assert cache.get(URL, "hash-1") is not None
+    clock.now += 2
+    assert cache.get(URL, "hash-1") is None
+
+
+def test_put_replaces_result_for_older_hash(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"))
+    cache.put(URL, "hash-1", _state("이전 보고서"))
+    cache.put(URL, "hash-2", _state("새 보고서"))
+
+    assert cache.get(URL, "hash-1") is None
+    assert cache.get(URL, "hash-2")["final_result"] == "새 보고서"
+
+
+def test_max_entries_evicts_least_recently_used(tmp_path, clock):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), max_entries=2)
+    for i in range(2):
+        clock.now += 1
+        cache.put(f"https://example.com/article/{i}", "hash", _state(str(i)))
+    clock.now += 1
+    cache.get("https://example.com/article/0", "hash")
+    clock.now += 1
+    cache.put("https://example.com/article/2", "hash", _state("2"))
+
+    assert cache.get("https://example.com/article/0", "hash") is not None
+    assert cache.get("https://example.com/article/1", "hash") is None
+
+
+def test_article_hash_ignores_page_boilerplate():
+    page = "\n\n".join([BODY, "댓글 3", "ⓒ 예시일보 무단전재 및 재배포 금지"])
+    changed_widgets = "\n\n".join([BODY, "댓글 57", "공유하기 좋아요 12", "ⓒ 예시일보 무단전재 및 재배포 금지"])
+    edited = page.replace("연내", "다음 달까지")
+
+    assert article_hash(page) == article_hash(changed_widgets)
+    assert article_hash(page) != article_hash(edited)
@@ -0,0 +1,102 @@
+"""실행 추적 테스트"""
+import asyncio
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from core.tracing import current_callbacks, current_span, start_trace, trace_span, traced_node
+
+
+def test_usage_rolls_up_to_node_and_workflow():
+    with start_trace("https://example.com/article/1") as trace:
+        with trace_span("answer_questions", "node"):
+            with trace_span("질문 1", "qa") as question:
+                question.record(llm_calls=2, tool_calls=1, input_tokens=100, output_tokens=20, scheduler_wait=0.5)
+            with trace_span("질문 2", "qa") as question:
+                question.record(llm_calls=1, input_tokens=50, output_tokens=10)
+
+    data = trace.to_dict()
+    spans = {span["name"]: span for span in data["spans"]}
+
+    assert spans["질문 1"]["parent"] == "answer_questions"
+    assert spans["answer_questions"]["llm_calls"] == 3
+    assert spans["answer_questions"]["total_tokens"] == 180
+    assert data["totals"]["llm_calls"] == 3
+    assert data["totals"]["tool_calls"] == 1
+    assert data["totals"]["scheduler_wait"] == 0.5
+    assert data["totals"]["wall_time"] >= spans["answer_questions"]["wall_time"]
+
+
+def test_span_records_error_and_reraises():
+    with start_trace("https://example.com/article/1") as trace:
+        with pytest.raises(ValueError):
+            with trace_span("extract_content", "node"):
+                raise ValueError("잘못된 응답")
+
+    assert trace.to_dict()["spans"][0]["error"] == "ValueError: 잘못된 응답"
+
+
+def test_nothing_is_recorded_outside_a_trace():
+    with trace_span("extract_content", "node") as span:
+        assert span is None
+        assert current_span() is None
+        assert current_callbacks() == []
+
+
+def test_concurrent_nodes_record_into_their_own_spans():
+    async def node(calls):
+        await asyncio.sleep(0.01)
+        current_span().record(llm_calls=calls)
+        return calls
+
+    async def run():
+        with start_trace("https://example.com/article/1") as trace:
+            await asyncio.gather(traced_node("answer_questions", node)(2), traced_node("answer_keywords", node)(3))
+        return trace
+
+    data = asyncio.run(run()).to_dict()
+    spans = {span["name"]: span for span in data["spans"]}
+
+    assert spans["answer_questions"]["llm_calls"] == 2
+    assert spans["answer_keywords"]["llm_calls"] == 3
+    assert data["totals"]["llm_calls"] == 5
+
+
+def test_callback_handler_counts_calls_and_tokens():
+    with start_trace("https://example.com/article/1") as trace:
+        with trace_span("extract_content", "node"):
+            handler = current_callbacks()[0]
+            handler.on_chat_model_start({}, [[]])
+            message = AIMessage(content="응답", usage_metadata={"input_tokens": 30, "output_tokens": 5, "total_tokens": 35})
+            handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+            # usage_metadata가 없으면 llm_output의 token_usage 사용
+            handler.on_chat_model_start({}, [[]])
+            handler.on_llm_end(LLMResult(
+                generations=[[ChatGeneration(message=AIMessage(content="응답"))]],
+                llm_output={"token_usage": {"prompt_tokens": 7, "completion_tokens": 3}},
+            ))
+            handler.on_tool_start({}, "검색어")
+
+    totals = trace.to_dict()["totals"]
+
+    assert totals["llm_calls"] == 2
+    assert totals["tool_calls"] == 1
+    assert totals["input_tokens"] == 37
+    assert totals["output_tokens"] == 8
+
+
+def test_export_jsonl_writes_spans_then_totals(tmp_path):
+    with start_trace("https://example.com/article/1") as trace:
+        with trace_span("extract_content", "node") as span:
+            span.count("llm_cache_hit")
+            span.count("llm_cache_miss", 3)
+    path = tmp_path / "traces" / "runs.jsonl"
+
+    trace.export_jsonl(str(path))
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert [line["name"] for line in lines] == ["extract_content", "workflow"]
+    assert all(line["run_id"] == trace.run_id for line in lines)
+    assert lines[0]["llm_cache_hit_rate"] == 0.25
@@ -0,0 +1,57 @@
+"""기사 URL 정규화 테스트"""
+import pytest
+
+from core.url_canonicalizer import canonical_groups, canonicalize_url, normalize_url
+
+NAVER_ARTICLE = "https://n.news.naver.com/mnews/article/001/0014567890"
+
+
+@pytest.mark.parametrize("url", [
+    "https://n.news.naver.com/mnews/article/001/0014567890",
+    "https://n.news.naver.com/article/001/0014567890?sid=100",
+    "https://N.NEWS.NAVER.COM/mnews/article/001/0014567890/",
+    "https://news.naver.com/main/read.naver?mode=LSD&mid=shm&sid1=100&oid=001&aid=0014567890",
+    "https://m.news.naver.com/read.nhn?oid=001&aid=0014567890&sid1=100",
+    "https://n.news.naver.com/mnews/article/001/0014567890?utm_source=twitter#comment",
+])
+def test_naver_article_variants_share_one_url(url):
+    assert canonicalize_url(url) == NAVER_ARTICLE
+
+
+@pytest.mark.parametrize("url", [
+    "https://v.daum.net/v/20250512093012345",
+    "https://m.v.daum.net/v/20250512093012345?f=m",
+    "http://v.daum.net/v/20250512093012345/",
+])
+def test_daum_article_variants_share_one_url(url):
+    assert canonicalize_url(url) == "https://v.daum.net/v/20250512093012345"
+
+
+def test_naver_read_url_without_article_id_is_only_normalized():
+    url = "https://news.naver.com/main/read.naver?oid=001"
+
+    assert canonicalize_url(url) == "https://news.naver.com/main/read.naver?oid=001"
+
+
+def test_other_publishers_keep_content_params_and_drop_tracking():
+    url = "HTTPS://Example.com/news/view/?page=2&idxno=123&utm_medium=social&fbclid=abc#top"
+
+    assert canonicalize_url(url) == "https://example.com/news/view?idxno=123&page=2"
+
+
+def test_normalize_url_keeps_root_path_and_blank_values():
+    assert normalize_url("https://example.com?b=&a=1") == "https://example.com/?a=1&b="
+
+
+def test_canonical_groups_keeps_first_appearance_order():
+    urls = [
+        "https://example.com/a?utm_source=x",
+        "https://m.news.naver.com/read.nhn?oid=001&aid=0014567890",
+        "https://example.com/a",
+        NAVER_ARTICLE,
+    ]
+
+    assert canonical_groups(urls) == [
+        ("https://example.com/a", [urls[0], urls[2]]),
+        (NAVER_ARTICLE, [urls[1], urls[3]]),
+    ]
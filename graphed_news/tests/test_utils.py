@@ -0,0 +1,50 @@
+"""utils 공유 HTTP 클라이언트 테스트"""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.utils import LoopLocalAsyncClient
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_loop_local_client_works_across_event_loops(server_url):
+    client = LoopLocalAsyncClient()
+
+    # Keep-Alive 커넥션이 이전 루프에 묶여 있으면 두 번째 루프에서 "Event loop is closed"가 발생
+    for _ in range(3):
+        assert asyncio.run(client.get(server_url)).text == "ok"
+
+
+def test_loop_local_client_uses_one_pool_per_loop(server_url):
+    client = LoopLocalAsyncClient()
+
+    async def fetch_twice():
+        await client.get(server_url)
+        first = client._loop_client()
+        await client.get(server_url)
+        return first is client._loop_client()
+
+    assert asyncio.run(fetch_twice())